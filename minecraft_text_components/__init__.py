@@ -1,7 +1,19 @@
 from . import contrib
-from .advances import get_advance, get_char_advance, get_line_advance
+from .advances import (
+    advance_cache_info,
+    clear_advance_cache,
+    get_advance,
+    get_char_advance,
+    get_line_advance,
+    get_text_advance,
+    load_resource_pack_fonts,
+    register_font,
+    set_advance_cache_size,
+    unregister_font,
+)
 from .alignment import center, local_center, local_right, right
 from .columns import columns
+from .compiled import CompiledComponent
 from .container import Container, container
 from .flat import flat
 from .formatting import (
@@ -14,13 +26,26 @@ from .formatting import (
     is_affected_by_inheriting_from,
 )
 from .helpers import js_str, json_str
+from .interned_formatting import clear_interned_formatting, interned_formatting_info
 from .join import join
-from .minify import minify
+from .layout_many import layout_many
+from .measured import MeasuredComponent
+from .minify import (
+    FactoringStats,
+    clear_minify_cache,
+    minify,
+    minify_cache_info,
+    minify_many,
+    set_factoring_stats_hook,
+    set_minify_cache_size,
+)
 from .overlap import overlap
 from .pad_each_line import pad_each_line
+from .paginate import BOOK_PAGE_LINES, PAGE_BREAK, paginate
 from .prevent_inheritance import prevent_inheritance
-from .split import split
+from .split import ComponentSlice, split, split_slices
 from .style import style
+from .table import table
 from .trim import trim
 from .types import (
     FlatTextComponent,
@@ -46,19 +71,32 @@ from .types import (
     TextComponentTextDict,
     TextComponentTranslationDict,
 )
-from .whitespace import whitespace
-from .wrap import wrap
+from .whitespace import (
+    get_valid_whitespace_advance,
+    get_whitespace,
+    set_whitespace_table_max_advance,
+    whitespace,
+)
+from .wrap import wrap, wrap_widths
 
 __all__ = [
     "contrib",
+    "advance_cache_info",
+    "clear_advance_cache",
     "get_advance",
     "get_char_advance",
     "get_line_advance",
+    "get_text_advance",
+    "load_resource_pack_fonts",
+    "register_font",
+    "set_advance_cache_size",
+    "unregister_font",
     "center",
     "local_center",
     "local_right",
     "right",
     "columns",
+    "CompiledComponent",
     "Container",
     "container",
     "flat",
@@ -71,13 +109,29 @@ __all__ = [
     "is_affected_by_inheriting_from",
     "js_str",
     "json_str",
+    "clear_interned_formatting",
+    "interned_formatting_info",
     "join",
+    "layout_many",
+    "MeasuredComponent",
+    "FactoringStats",
+    "clear_minify_cache",
     "minify",
+    "minify_cache_info",
+    "minify_many",
+    "set_factoring_stats_hook",
+    "set_minify_cache_size",
     "overlap",
     "pad_each_line",
+    "BOOK_PAGE_LINES",
+    "PAGE_BREAK",
+    "paginate",
     "prevent_inheritance",
+    "ComponentSlice",
     "split",
+    "split_slices",
     "style",
+    "table",
     "trim",
     "FlatTextComponent",
     "TextComponent",
@@ -101,6 +155,10 @@ __all__ = [
     "TextComponentText",
     "TextComponentTextDict",
     "TextComponentTranslationDict",
+    "get_valid_whitespace_advance",
+    "get_whitespace",
+    "set_whitespace_table_max_advance",
     "whitespace",
     "wrap",
+    "wrap_widths",
 ]
@@ -1,9 +1,23 @@
+from .advance_cache import (
+    advance_cache_info,
+    clear_advance_cache,
+    set_advance_cache_size,
+)
+from .fonts import load_resource_pack_fonts, register_font, unregister_font
 from .get_advance import get_advance
 from .get_char_advance import get_char_advance
 from .get_line_advance import get_line_advance
+from .get_text_advance import get_text_advance
 
 __all__ = [
+    "advance_cache_info",
+    "clear_advance_cache",
+    "set_advance_cache_size",
+    "load_resource_pack_fonts",
+    "register_font",
+    "unregister_font",
     "get_advance",
     "get_char_advance",
     "get_line_advance",
+    "get_text_advance",
 ]
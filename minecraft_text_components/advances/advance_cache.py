@@ -0,0 +1,50 @@
+from functools import lru_cache
+
+from .fonts import get_font_advance_table
+from .get_text_advance import get_table_text_advance
+
+# The default maximum number of text runs whose advances are cached.
+DEFAULT_ADVANCE_CACHE_SIZE = 4096
+
+cached_get_table_text_advance = lru_cache(maxsize=DEFAULT_ADVANCE_CACHE_SIZE)(
+    get_table_text_advance
+)
+
+
+def get_cached_text_advance(
+    text: str,
+    bold: bool = False,
+    font: str | None = None,
+) -> float:
+    """Gets the number of in-game pixels that a string takes up horizontally, caching
+    the result by the string, its boldness, and its font's `AdvanceTable` in a bounded
+    LRU cache.
+    """
+
+    # Keying by the table rather than the `font` ensures registering a font can't leave
+    # stale advances in the cache.
+    return cached_get_table_text_advance(text, bold, get_font_advance_table(font))
+
+
+def set_advance_cache_size(maxsize: int | None):
+    """Sets the maximum number of text runs whose advances are cached, clearing the
+    cache. `None` makes the cache unbounded, and `0` disables it.
+    """
+
+    global cached_get_table_text_advance
+
+    cached_get_table_text_advance = lru_cache(maxsize=maxsize)(get_table_text_advance)
+
+
+def clear_advance_cache():
+    """Clears the cached text run advances and resets the cache's statistics."""
+
+    cached_get_table_text_advance.cache_clear()
+
+
+def advance_cache_info():
+    """Gets the hits, misses, maximum size, and current size of the cache of text run
+    advances.
+    """
+
+    return cached_get_table_text_advance.cache_info()
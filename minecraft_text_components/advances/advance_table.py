@@ -0,0 +1,276 @@
+import itertools
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import cache, cached_property
+from importlib import resources
+from importlib.abc import Traversable
+from pathlib import Path
+from typing import Any
+
+# The advance of an unknown character in in-game pixels.
+UNKNOWN_CHAR_ADVANCE = 6.0
+# The advance of an invalid character (i.e. a lone surrogate) in in-game pixels.
+INVALID_CHAR_ADVANCE = 8.0
+
+# The number of code points in the Basic Multilingual Plane.
+BMP_SIZE = 0xFFFF + 1
+# A range of all surrogate code points.
+SURROGATES = range(0xD800, 0xDFFF + 1)
+
+# The binary advance table layout, all little-endian:
+# - The `BINARY_MAGIC` bytes, a `BINARY_VERSION`, the `array` typecode of the advances,
+#   and the number of astral entries (`BINARY_HEADER`).
+# - `BMP_SIZE` advances of the specified typecode, indexed by code point.
+# - `BMP_SIZE` bytes of legacy unicode flags, indexed by code point.
+# - Each astral entry as a code point and an advance (`BINARY_ASTRAL_ENTRY`).
+BINARY_MAGIC = b"MTCA"
+BINARY_VERSION = 2
+BINARY_HEADER = struct.Struct("<4sIcxxxI")
+BINARY_ASTRAL_ENTRY = struct.Struct("<Id")
+
+
+@dataclass(frozen=True, eq=False)
+class AdvanceTable:
+    """A compact lookup table of the advance of every code point in a font."""
+
+    # The advance in in-game pixels of each code point in the Basic Multilingual Plane,
+    # indexed by code point. Unknown and invalid code points have their fallback advance
+    # rather than a placeholder, so no further checks are needed after a lookup.
+    bmp_advances: Sequence[float]
+    # For each code point in the Basic Multilingual Plane (indexed by code point), `1` if
+    # the code point only exists in the legacy unicode font, and otherwise `0`.
+    bmp_legacy_unicode: Sequence[int]
+    # A mapping from each known code point outside the Basic Multilingual Plane to its
+    # advance in in-game pixels. All other code points outside it are unknown.
+    astral_advances: dict[int, float]
+
+    @cached_property
+    def bmp_advance_translation(self) -> str | None:
+        """A `str.translate` table mapping each code point in the Basic Multilingual
+        Plane to the character whose code point is its advance, or `None` if any advance
+        isn't an integer from 0 to 255.
+        """
+
+        try:
+            advances = array("B", self.bmp_advances)
+        except (TypeError, OverflowError):
+            return None
+
+        return advances.tobytes().decode("latin-1")
+
+    @cached_property
+    def bmp_legacy_unicode_translation(self) -> str:
+        """A `str.translate` table mapping each code point in the Basic Multilingual
+        Plane to `"\\x01"` if it only exists in the legacy unicode font, and otherwise to
+        `"\\x00"`.
+        """
+
+        return bytes(self.bmp_legacy_unicode).decode("latin-1")
+
+    @cached_property
+    def has_negative_advances(self) -> bool:
+        """Whether any code point has a negative advance, like a negative space."""
+
+        return min(self.bmp_advances) < 0 or any(
+            advance < 0 for advance in self.astral_advances.values()
+        )
+
+    @cached_property
+    def numpy_bmp_advances(self) -> Any:
+        """`bmp_advances` as a NumPy array. ⚠️ Requires NumPy."""
+
+        import numpy
+
+        return numpy.asarray(self.bmp_advances)
+
+    @cached_property
+    def numpy_bmp_legacy_unicode(self) -> Any:
+        """`bmp_legacy_unicode` as a NumPy array. ⚠️ Requires NumPy."""
+
+        import numpy
+
+        return numpy.frombuffer(self.bmp_legacy_unicode, dtype=numpy.uint8)
+
+
+def load_advances(filename: str) -> dict[str, int]:
+    path = resources.files("minecraft_text_components") / f"resources/{filename}.json"
+    return json.loads(path.read_text("utf8"))
+
+
+def get_advances_typecode(advances: Iterable[float]):
+    """Gets the smallest `array` typecode which can hold all the specified advances."""
+
+    typecode = "b"
+
+    for advance in advances:
+        if not isinstance(advance, int) or not -(2**31) <= advance < 2**31:
+            return "d"
+
+        if not -(2**7) <= advance < 2**7:
+            typecode = "i"
+
+    return typecode
+
+
+def build_advance_table(
+    advances: dict[str, float],
+    legacy_unicode_advances: dict[str, float],
+    base: "AdvanceTable | None" = None,
+):
+    """Compiles mappings from characters to advances into an `AdvanceTable`.
+
+    Characters not in either mapping take their advances from the `base` table if there
+    is one, and are otherwise unknown or invalid.
+    """
+
+    typecode = get_advances_typecode(
+        itertools.chain(
+            advances.values(),
+            legacy_unicode_advances.values(),
+            () if base is None else base.bmp_advances,
+        )
+    )
+
+    if base is None:
+        bmp_advances = array(typecode, [int(UNKNOWN_CHAR_ADVANCE)]) * BMP_SIZE
+        bmp_legacy_unicode = bytearray(BMP_SIZE)
+        astral_advances: dict[int, float] = {}
+
+        for code_point in SURROGATES:
+            bmp_advances[code_point] = int(INVALID_CHAR_ADVANCE)
+
+    else:
+        bmp_advances = array(typecode, base.bmp_advances)
+        bmp_legacy_unicode = bytearray(base.bmp_legacy_unicode)
+        astral_advances = base.astral_advances.copy()
+
+    for char, advance in legacy_unicode_advances.items():
+        code_point = ord(char)
+        bmp_advances[code_point] = advance
+        bmp_legacy_unicode[code_point] = 1
+
+    for char, advance in advances.items():
+        code_point = ord(char)
+
+        if code_point < BMP_SIZE:
+            bmp_advances[code_point] = advance
+            bmp_legacy_unicode[code_point] = 0
+        else:
+            astral_advances[code_point] = advance
+
+    return AdvanceTable(bmp_advances, bytes(bmp_legacy_unicode), astral_advances)
+
+
+def pack_advance_table(table: AdvanceTable):
+    """Serializes an `AdvanceTable` to the binary advance table layout."""
+
+    typecode = get_advances_typecode(table.bmp_advances)
+    bmp_advances = array(typecode, table.bmp_advances)
+    if sys.byteorder != "little":
+        bmp_advances.byteswap()
+
+    astral_entries = sorted(table.astral_advances.items())
+
+    return b"".join(
+        [
+            BINARY_HEADER.pack(
+                BINARY_MAGIC,
+                BINARY_VERSION,
+                typecode.encode(),
+                len(astral_entries),
+            ),
+            bmp_advances.tobytes(),
+            bytes(table.bmp_legacy_unicode),
+            *(BINARY_ASTRAL_ENTRY.pack(*entry) for entry in astral_entries),
+        ]
+    )
+
+
+def unpack_advance_table(buffer: memoryview):
+    """Gets an `AdvanceTable` which indexes directly into a buffer in the binary advance
+    table layout, without copying its per-code-point arrays.
+    """
+
+    magic, version, typecode, astral_entry_count = BINARY_HEADER.unpack_from(buffer)
+
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("The buffer is not in a supported binary advance table layout")
+
+    typecode = typecode.decode()
+    bmp_advances_start = BINARY_HEADER.size
+    bmp_legacy_unicode_start = bmp_advances_start + BMP_SIZE * array(typecode).itemsize
+    astral_entries_start = bmp_legacy_unicode_start + BMP_SIZE
+
+    if (
+        len(buffer)
+        < astral_entries_start + astral_entry_count * BINARY_ASTRAL_ENTRY.size
+    ):
+        raise ValueError("The buffer is too short for its binary advance table layout")
+
+    bmp_advances: Sequence[float] = buffer[
+        bmp_advances_start:bmp_legacy_unicode_start
+    ].cast(typecode)
+
+    if sys.byteorder != "little" and typecode != "b":
+        # Multi-byte advances can't be indexed in place on a big-endian machine.
+        bmp_advances = array(typecode, bmp_advances)
+        bmp_advances.byteswap()
+
+    astral_advances: dict[int, float] = {}
+    for i in range(astral_entry_count):
+        code_point, advance = BINARY_ASTRAL_ENTRY.unpack_from(
+            buffer, astral_entries_start + i * BINARY_ASTRAL_ENTRY.size
+        )
+        astral_advances[code_point] = advance if typecode == "d" else int(advance)
+
+    return AdvanceTable(
+        bmp_advances,
+        buffer[bmp_legacy_unicode_start:astral_entries_start],
+        astral_advances,
+    )
+
+
+def load_binary_advance_table(path: Traversable):
+    """Loads an `AdvanceTable` from a file in the binary advance table layout,
+    memory-mapping it if possible.
+
+    Returns `None` if the file doesn't exist.
+    """
+
+    if not path.is_file():
+        return None
+
+    if isinstance(path, Path):
+        with open(path, "rb") as file:
+            # The map stays valid after the file is closed, and it is kept alive by the
+            # `memoryview`s referencing it.
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return unpack_advance_table(memoryview(buffer))
+
+    # The file isn't a real file (e.g. the package is zipped), so it can't be mapped.
+    return unpack_advance_table(memoryview(path.read_bytes()))
+
+
+@cache
+def get_advance_table():
+    """Gets the `AdvanceTable` of the default font, loading it on the first call."""
+
+    table = load_binary_advance_table(
+        resources.files("minecraft_text_components") / "resources/advances.bin"
+    )
+
+    if table is not None:
+        return table
+
+    # The JSON mappings aren't kept after this, since the table holds everything needed
+    # in a small fraction of the memory.
+    return build_advance_table(
+        load_advances("advances"),
+        load_advances("legacy_unicode_advances"),
+    )
@@ -0,0 +1,430 @@
+import hashlib
+import io
+import json
+import math
+import os
+import struct
+import warnings
+import zipfile
+from collections.abc import Callable, Container
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Literal, NotRequired, TypedDict
+
+from .advance_table import (
+    BINARY_VERSION,
+    AdvanceTable,
+    build_advance_table,
+    get_advance_table,
+    load_binary_advance_table,
+    pack_advance_table,
+)
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+
+class SpaceFontProvider(TypedDict):
+    type: Literal["space"]
+    advances: dict[str, float]
+
+
+class BitmapFontProvider(TypedDict):
+    type: Literal["bitmap"]
+    file: str
+    height: NotRequired[int]
+    ascent: int
+    chars: list[str]
+
+
+class LegacyUnicodeFontProvider(TypedDict):
+    type: Literal["legacy_unicode"]
+    sizes: str
+    template: str
+
+
+class TTFFontProvider(TypedDict):
+    type: Literal["ttf"]
+    file: str
+    shift: list[float]
+    size: float
+    oversample: float
+    skip: str | list[str]
+
+
+FontProvider = (
+    SpaceFontProvider | BitmapFontProvider | LegacyUnicodeFontProvider | TTFFontProvider
+)
+
+
+class Font(TypedDict):
+    providers: list[FontProvider]
+
+
+# The font provider types which can be compiled into an `AdvanceTable`.
+SUPPORTED_PROVIDER_TYPES = {"space", "bitmap", "legacy_unicode"}
+
+# The ID of the font used by text components without a `font`.
+DEFAULT_FONT = "minecraft:default"
+
+# A range of all 16-bit code points.
+LEGACY_UNICODE = range(0xFFFF + 1)
+# A range of all surrogate code points.
+SURROGATES = range(0xD800, 0xDFFF + 1)
+
+# The width of the space between glyphs in in-game pixels.
+KERNING_WIDTH = 1
+# The default height of a bitmap font glyph in in-game pixels.
+DEFAULT_GLYPH_HEIGHT = 8
+
+# The directory compiled font advance tables are cached in by default.
+DEFAULT_FONT_CACHE_DIRECTORY = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "minecraft_text_components"
+    / "fonts"
+)
+
+# A mapping from each registered font ID to its `AdvanceTable`.
+font_advance_tables: dict[str, AdvanceTable] = {}
+
+
+def get_font_id(font: str):
+    """Adds the default namespace to a font ID if it has none."""
+
+    return font if ":" in font else f"minecraft:{font}"
+
+
+def register_font(font: str, table: AdvanceTable):
+    """Makes text components with the specified `font` be measured using the specified
+    `AdvanceTable`. Registering `minecraft:default` also affects text without a `font`.
+    """
+
+    font_advance_tables[get_font_id(font)] = table
+
+
+def unregister_font(font: str):
+    """Makes text components with the specified `font` be measured using the default
+    font again.
+    """
+
+    font_advance_tables.pop(get_font_id(font), None)
+
+
+def get_font_advance_table(font: str | None = None):
+    """Gets the `AdvanceTable` to measure text with the specified `font` by.
+
+    Fonts which aren't registered are measured as the default font.
+    """
+
+    if font_advance_tables:
+        table = font_advance_tables.get(
+            DEFAULT_FONT if font is None else get_font_id(font)
+        )
+
+        if table is not None:
+            return table
+
+    return get_advance_table()
+
+
+def get_bitmap_provider_advances(provider: BitmapFontProvider, texture: "Image"):
+    """Gets a mapping from each character in a bitmap font provider to its advance in
+    in-game pixels, given the provider's texture.
+    """
+
+    advances: dict[str, int] = {}
+
+    if texture.mode != "RGBA":
+        texture = texture.convert("RGBA")
+
+    alpha = texture.getchannel("A")
+
+    row_count = len(provider["chars"])
+    column_count = len(provider["chars"][0])
+
+    row_height = texture.height // row_count
+    column_width = texture.width // column_count
+
+    glyph_height = provider.get("height", DEFAULT_GLYPH_HEIGHT)
+    glyph_scale = glyph_height / row_height
+
+    for row_index in range(row_count):
+        row = provider["chars"][row_index]
+        for column_index in range(column_count):
+            char = row[column_index]
+
+            if char in {"\u0000", " "}:
+                # These characters are ignored in bitmap font providers.
+                continue
+
+            glyph_x = column_index * column_width
+            glyph_y = row_index * row_height
+
+            # Find the first non-empty column of pixels from the right within the glyph.
+            glyph_bounds = alpha.crop(
+                (glyph_x, glyph_y, glyph_x + column_width, glyph_y + row_height)
+            ).getbbox()
+            glyph_width = 0 if glyph_bounds is None else glyph_bounds[2]
+
+            # For negative `glyph_scale`s, it makes no sense to add 0.5 and then truncate
+            # instead of rounding, but it's straight from the game's code, so we're going
+            # with it.
+            advance = math.trunc(glyph_width * glyph_scale + 0.5) + KERNING_WIDTH
+
+            advances[char] = advance
+
+    return advances
+
+
+def get_legacy_unicode_provider_advances(
+    sizes: bytes,
+    # Characters already covered by other font providers, which should be skipped.
+    covered_chars: Container[str] = (),
+):
+    """Gets a mapping from each character in a legacy unicode font provider to its
+    advance in in-game pixels, given the provider's `sizes` file.
+    """
+
+    advances: dict[str, int] = {}
+
+    for char_code in LEGACY_UNICODE:
+        if char_code in SURROGATES:
+            continue
+
+        char = chr(char_code)
+
+        if char in covered_chars:
+            continue
+
+        # A byte with the start position of the character in the left half and the end
+        # position in the right half.
+        size = sizes[char_code]
+        char_start = size >> 4
+        char_end = (size & 0xF) + 1
+
+        advance = (char_end - char_start) // 2 + KERNING_WIDTH
+        advances[char] = advance
+
+    return advances
+
+
+def get_asset_path(resource_location: str, directory: str):
+    """Gets the path in a resource pack of the file a resource location refers to."""
+
+    namespace, _, path = get_font_id(resource_location).partition(":")
+    return PurePosixPath("assets", namespace, directory, path).as_posix()
+
+
+def compile_font(
+    font: Font,
+    # Reads a file from the resource pack by its path.
+    read_file: Callable[[str], bytes],
+    # The table to take the advances of characters the `font` doesn't cover from.
+    base: AdvanceTable | None = None,
+):
+    """Compiles a font definition's providers into an `AdvanceTable`.
+
+    ⚠️ Requires Pillow if the font has any bitmap providers.
+    """
+
+    # Each provider only applies to characters not covered by a previous one.
+    advances: dict[str, float] = {}
+    legacy_unicode_advances: dict[str, float] = {}
+
+    def add_advances(
+        provider_advances: dict[str, float],
+        target: dict[str, float],
+    ):
+        for char, advance in provider_advances.items():
+            if char not in advances and char not in legacy_unicode_advances:
+                target[char] = advance
+
+    for provider in font["providers"]:
+        if provider["type"] == "space":
+            add_advances(provider["advances"], advances)
+
+        elif provider["type"] == "bitmap":
+            from PIL import Image
+
+            texture_path = get_asset_path(provider["file"], "textures")
+            texture = Image.open(io.BytesIO(read_file(texture_path)))
+
+            add_advances(get_bitmap_provider_advances(provider, texture), advances)
+
+        elif provider["type"] == "legacy_unicode":
+            sizes = read_file(get_asset_path(provider["sizes"], ""))
+
+            add_advances(
+                get_legacy_unicode_provider_advances(sizes, advances),
+                legacy_unicode_advances,
+            )
+
+        else:
+            raise NotImplementedError(
+                f"Provider type {repr(provider['type'])} is not currently supported"
+            )
+
+    return build_advance_table(advances, legacy_unicode_advances, base)
+
+
+class ResourcePack:
+    """Reads files from a resource pack directory or zip file."""
+
+    path: Path
+
+    _zip_file: zipfile.ZipFile | None
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        self._zip_file = None if self.path.is_dir() else zipfile.ZipFile(self.path)
+
+    def get_font_paths(self):
+        """Gets the path of each font definition in the resource pack."""
+
+        if self._zip_file is None:
+            paths = (
+                path.relative_to(self.path).as_posix()
+                for path in self.path.glob("assets/*/font/**/*.json")
+            )
+        else:
+            paths = self._zip_file.namelist()
+
+        return sorted(
+            path
+            for path in paths
+            if path.endswith(".json")
+            and PurePosixPath(path).parts[0:1] == ("assets",)
+            and PurePosixPath(path).parts[2:3] == ("font",)
+        )
+
+    def read_file(self, path: str):
+        try:
+            if self._zip_file is None:
+                return (self.path / path).read_bytes()
+
+            return self._zip_file.read(path)
+
+        except (FileNotFoundError, KeyError):
+            raise ValueError(
+                f"The file {repr(path)} is not in the resource pack {repr(self.path)}"
+            ) from None
+
+    def close(self):
+        if self._zip_file is not None:
+            self._zip_file.close()
+
+
+def get_font_hash(
+    font_file: bytes,
+    font: Font,
+    read_file: Callable[[str], bytes],
+    base: AdvanceTable | None,
+):
+    """Hashes the contents a font's advance table is compiled from."""
+
+    font_hash = hashlib.sha256(font_file)
+    # Tables cached in an older layout are never looked up.
+    font_hash.update(BINARY_VERSION.to_bytes(4, "little"))
+
+    for provider in font["providers"]:
+        if provider["type"] == "bitmap":
+            font_hash.update(read_file(get_asset_path(provider["file"], "textures")))
+        elif provider["type"] == "legacy_unicode":
+            font_hash.update(read_file(get_asset_path(provider["sizes"], "")))
+
+    if base is not None:
+        font_hash.update(pack_advance_table(base))
+
+    return font_hash.hexdigest()
+
+
+def load_resource_pack_fonts(
+    path: str | os.PathLike[str],
+    # The directory to cache compiled fonts in, or `None` to not cache them.
+    cache_directory: str | os.PathLike[str] | None = DEFAULT_FONT_CACHE_DIRECTORY,
+):
+    """Compiles and registers every font in a resource pack directory or zip file, so
+    text components with those fonts are measured correctly. Returns the registered
+    font IDs.
+
+    The resource pack's `minecraft:default` font is layered over the built-in default
+    font, as it is in-game. Each compiled font is cached by a hash of its contents, so
+    it's only compiled again if it changes.
+
+    Font providers of unsupported types (such as `ttf`) are skipped with a warning
+    naming them, rather than failing to load the whole resource pack.
+
+    ⚠️ Requires Pillow if any font has bitmap providers which aren't cached.
+    """
+
+    resource_pack = ResourcePack(path)
+    registered_fonts: list[str] = []
+
+    try:
+        for font_path in resource_pack.get_font_paths():
+            _, namespace, _, *font_name = PurePosixPath(font_path).with_suffix("").parts
+            font_id = f"{namespace}:{'/'.join(font_name)}"
+
+            font_file = resource_pack.read_file(font_path)
+            font: Font = json.loads(font_file)
+
+            unsupported_types = sorted(
+                {
+                    provider["type"]
+                    for provider in font["providers"]
+                    if provider["type"] not in SUPPORTED_PROVIDER_TYPES
+                }
+            )
+
+            if unsupported_types:
+                warnings.warn(
+                    f"Skipping the unsupported provider types {unsupported_types} in "
+                    f"the font {repr(font_id)}, so the characters they provide are "
+                    "measured by the font's other providers or as unknown",
+                    stacklevel=2,
+                )
+
+                font = {
+                    "providers": [
+                        provider
+                        for provider in font["providers"]
+                        if provider["type"] in SUPPORTED_PROVIDER_TYPES
+                    ]
+                }
+
+            base = get_advance_table() if font_id == DEFAULT_FONT else None
+
+            table: AdvanceTable | None = None
+            cache_path: Path | None = None
+
+            if cache_directory is not None:
+                font_hash = get_font_hash(
+                    font_file, font, resource_pack.read_file, base
+                )
+                cache_path = Path(cache_directory) / f"{font_hash}.bin"
+
+                try:
+                    table = load_binary_advance_table(cache_path)
+                except (ValueError, struct.error):
+                    # The cached table is corrupt or in an unsupported layout, so
+                    # compile it again, overwriting it.
+                    table = None
+
+            if table is None:
+                table = compile_font(font, resource_pack.read_file, base)
+
+                if cache_path is not None:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+                    # Write to a temporary file first so that concurrent builds never
+                    # read a partially written table.
+                    temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                    temporary_path.write_bytes(pack_advance_table(table))
+                    os.replace(temporary_path, cache_path)
+
+            register_font(font_id, table)
+            registered_fonts.append(font_id)
+
+    finally:
+        resource_pack.close()
+
+    return registered_fonts
@@ -1,9 +1,16 @@
+from ..compiled import CompiledComponent
 from ..split import split
 from ..types import TextComponent
 from .get_line_advance import get_line_advance
 
 
-def get_advance(component: TextComponent):
+def get_advance(component: TextComponent | CompiledComponent):
     """Gets the width in in-game pixels that a text component takes up."""
 
+    if isinstance(component, CompiledComponent) and not any(
+        text and "\n" in text for text in component.texts
+    ):
+        # The component is a single line, so it doesn't need to be split into lines.
+        return component.get_advance()
+
     return max(get_line_advance(line) for line in split(component, "\n"))
@@ -1,25 +1,12 @@
-import json
-from functools import cache
-from importlib import resources
-
 from ..types import TextComponentFormatting
+from .advance_table import BMP_SIZE, UNKNOWN_CHAR_ADVANCE
+from .fonts import get_font_advance_table
 
 # The advance in in-game pixels added to a non-legacy-unicode character when bold.
 BOLD_ADVANCE = 1.0
 # The advance in in-game pixels added to a legacy unicode character when bold.
 BOLD_LEGACY_UNICODE_ADVANCE = 0.5
 
-# The advance of an unknown character in in-game pixels.
-UNKNOWN_CHAR_ADVANCE = 6.0
-# The advance of an invalid character (i.e. a lone surrogate) in in-game pixels.
-INVALID_CHAR_ADVANCE = 8.0
-
-
-@cache
-def get_advances(filename: str) -> dict[str, int]:
-    path = resources.files("minecraft_text_components") / f"resources/{filename}.json"
-    return json.loads(path.read_text("utf8"))
-
 
 def get_char_advance(
     char: str,
@@ -30,36 +17,20 @@ def get_char_advance(
     ⚠️ Assumes the input is a string with length 1.
     """
 
-    if formatting is None:
-        formatting = {}
-
-    # Whether the `char` only exists in the legacy unicode font.
-    legacy_unicode = False
-    advance = None
-
-    advances = get_advances("advances")
-    if char in advances:
-        advance = float(advances[char])
+    table = get_font_advance_table(
+        None if formatting is None else formatting.get("font")
+    )
+    code_point = ord(char)
 
+    if code_point < BMP_SIZE:
+        advance = float(table.bmp_advances[code_point])
+        # Whether the `char` only exists in the legacy unicode font.
+        legacy_unicode = table.bmp_legacy_unicode[code_point]
     else:
-        legacy_unicode_advances = get_advances("legacy_unicode_advances")
-        if char in legacy_unicode_advances:
-            legacy_unicode = True
-            advance = float(legacy_unicode_advances[char])
-
-        else:
-            # The `char` is unknown or invalid.
-            try:
-                char.encode("utf-8")
-
-                # The `char` is unknown.
-                advance = UNKNOWN_CHAR_ADVANCE
-
-            except UnicodeEncodeError:
-                # The `char` is invalid.
-                advance = INVALID_CHAR_ADVANCE
+        advance = float(table.astral_advances.get(code_point, UNKNOWN_CHAR_ADVANCE))
+        legacy_unicode = False
 
-    if formatting.get("bold") == True:
+    if formatting is not None and formatting.get("bold") == True:
         advance += BOLD_LEGACY_UNICODE_ADVANCE if legacy_unicode else BOLD_ADVANCE
 
     return advance
@@ -1,8 +1,9 @@
+from ..compiled import CompiledComponent
 from ..flat import flat
 from ..formatting import get_formatting
 from ..helpers import js_str
 from ..types import TextComponent, TextComponentFormatting, TextComponentText
-from .get_char_advance import get_char_advance
+from .advance_cache import get_cached_text_advance
 
 
 def get_text_line_advance(
@@ -12,22 +13,25 @@ def get_text_line_advance(
     """Gets the width in in-game pixels that a single line of text takes up."""
 
     if formatting is None:
-        formatting = {}
+        return get_cached_text_advance(js_str(text))
 
-    advance = 0
-
-    for char in js_str(text):
-        advance += get_char_advance(char, formatting)
+    return get_cached_text_advance(
+        js_str(text),
+        formatting.get("bold") == True,
+        formatting.get("font"),
+    )
 
-    return advance
 
-
-def get_line_advance(component: TextComponent) -> float:
+def get_line_advance(component: TextComponent | CompiledComponent) -> float:
     """Gets the width in in-game pixels that a single-line text component takes up."""
 
     if isinstance(component, TextComponentText):
         return get_text_line_advance(component)
 
+    if isinstance(component, CompiledComponent):
+        # Use the advances measured for each run.
+        return component.get_advance()
+
     advance = 0
 
     for subcomponent in flat(component):
@@ -0,0 +1,187 @@
+from collections.abc import Iterable
+from operator import add
+
+from .advance_table import BMP_SIZE, UNKNOWN_CHAR_ADVANCE, AdvanceTable
+from .fonts import get_font_advance_table
+from .get_char_advance import BOLD_ADVANCE, BOLD_LEGACY_UNICODE_ADVANCE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The advance added to each character when bold, indexed by whether the character only
+# exists in the legacy unicode font.
+BOLD_ADVANCES = (BOLD_ADVANCE, BOLD_LEGACY_UNICODE_ADVANCE)
+
+# The minimum length of text to measure using NumPy (if it's installed), below which the
+# overhead of creating arrays outweighs the speedup.
+NUMPY_MIN_LENGTH = 256
+
+
+def get_bold_advance(char_count: int, legacy_unicode_count: int):
+    """Gets the advance that being bold adds to a string with the specified numbers of
+    characters and legacy unicode characters.
+    """
+
+    # Every character gets the bold advance except legacy unicode characters, which get a
+    # smaller one.
+    return (
+        char_count - legacy_unicode_count
+    ) * BOLD_ADVANCE + legacy_unicode_count * BOLD_LEGACY_UNICODE_ADVANCE
+
+
+def get_text_advance_with_numpy(text: str, bold: bool, table: AdvanceTable) -> float:
+    assert numpy is not None
+
+    code_points = numpy.frombuffer(
+        # Lone surrogates can't be encoded without `surrogatepass`.
+        text.encode("utf-32-le", "surrogatepass"),
+        dtype=numpy.uint32,
+    )
+    advance = 0.0
+
+    bmp_mask = code_points < BMP_SIZE
+    if not bmp_mask.all():
+        for code_point in code_points[~bmp_mask].tolist():
+            advance += table.astral_advances.get(code_point, UNKNOWN_CHAR_ADVANCE)
+
+        code_points = code_points[bmp_mask]
+
+    advance += float(table.numpy_bmp_advances[code_points].sum())
+
+    if bold:
+        legacy_unicode_count = int(table.numpy_bmp_legacy_unicode[code_points].sum())
+        advance += get_bold_advance(len(text), legacy_unicode_count)
+
+    return advance
+
+
+def get_text_advance_with_translation(
+    text: str,
+    bold: bool,
+    table: AdvanceTable,
+) -> float | None:
+    """Returns `None` if the text can't be measured by translation."""
+
+    advance_translation = table.bmp_advance_translation
+
+    if advance_translation is None:
+        return None
+
+    try:
+        # Replace each character with the character whose code point is its advance, so
+        # the advances can be summed as bytes without a Python-level loop.
+        advance = float(sum(text.translate(advance_translation).encode("latin-1")))
+    except UnicodeEncodeError:
+        # There are characters outside the Basic Multilingual Plane, which the
+        # translation leaves unchanged.
+        return None
+
+    if bold:
+        legacy_unicode_count = text.translate(
+            table.bmp_legacy_unicode_translation
+        ).count("\x01")
+        advance += get_bold_advance(len(text), legacy_unicode_count)
+
+    return advance
+
+
+def get_text_advance_by_char(text: str, bold: bool, table: AdvanceTable) -> float:
+    advance = 0.0
+    legacy_unicode_count = 0
+
+    for char in text:
+        code_point = ord(char)
+
+        if code_point < BMP_SIZE:
+            advance += table.bmp_advances[code_point]
+            legacy_unicode_count += table.bmp_legacy_unicode[code_point]
+        else:
+            advance += table.astral_advances.get(code_point, UNKNOWN_CHAR_ADVANCE)
+
+    if bold:
+        advance += get_bold_advance(len(text), legacy_unicode_count)
+
+    return advance
+
+
+def get_table_text_advance(text: str, bold: bool, table: AdvanceTable) -> float:
+    """Gets the number of in-game pixels that a string takes up horizontally in the font
+    of the specified `AdvanceTable`.
+    """
+
+    if not text:
+        return 0.0
+
+    if numpy is not None and len(text) >= NUMPY_MIN_LENGTH:
+        return get_text_advance_with_numpy(text, bold, table)
+
+    advance = get_text_advance_with_translation(text, bold, table)
+
+    if advance is None:
+        advance = get_text_advance_by_char(text, bold, table)
+
+    return advance
+
+
+def get_text_advance(
+    text: str,
+    bold: bool = False,
+    font: str | None = None,
+) -> float:
+    """Gets the number of in-game pixels that a string takes up horizontally, measuring
+    the whole string at once rather than character by character.
+    """
+
+    return get_table_text_advance(text, bold, get_font_advance_table(font))
+
+
+def get_table_char_advances(
+    text: str,
+    bold: bool,
+    table: AdvanceTable,
+) -> Iterable[float]:
+    """Gets the number of in-game pixels that each character of a string takes up
+    horizontally in the font of the specified `AdvanceTable`, in order.
+    """
+
+    advance_translation = table.bmp_advance_translation
+
+    if advance_translation is not None:
+        try:
+            # Replace each character with the character whose code point is its advance,
+            # so the advances can be read as bytes without a Python-level loop.
+            advances = text.translate(advance_translation).encode("latin-1")
+        except UnicodeEncodeError:
+            # There are characters outside the Basic Multilingual Plane, which the
+            # translation leaves unchanged.
+            pass
+        else:
+            if not bold:
+                return advances
+
+            legacy_unicode = text.translate(
+                table.bmp_legacy_unicode_translation
+            ).encode("latin-1")
+            return map(add, advances, map(BOLD_ADVANCES.__getitem__, legacy_unicode))
+
+    char_advances: list[float] = []
+
+    for char in text:
+        code_point = ord(char)
+
+        if code_point < BMP_SIZE:
+            advance = float(table.bmp_advances[code_point])
+
+            if bold:
+                advance += BOLD_ADVANCES[table.bmp_legacy_unicode[code_point]]
+        else:
+            advance = float(table.astral_advances.get(code_point, UNKNOWN_CHAR_ADVANCE))
+
+            if bold:
+                advance += BOLD_ADVANCE
+
+        char_advances.append(advance)
+
+    return char_advances
@@ -1,22 +1,23 @@
 from .advances import get_advance
+from .compiled import CompiledComponent
 from .container import container
 from .pad_each_line import pad_each_line
 from .types import TextComponent
 
 
-def center(component: TextComponent):
+def center(component: TextComponent | CompiledComponent):
     """Centers a text component, automatically minified."""
 
     return pad_each_line(component, lambda advance: (container.width - advance) / 2)
 
 
-def right(component: TextComponent):
+def right(component: TextComponent | CompiledComponent):
     """Right-aligns a text component, automatically minified."""
 
     return pad_each_line(component, lambda advance: container.width - advance)
 
 
-def local_center(component: TextComponent):
+def local_center(component: TextComponent | CompiledComponent):
     """Centers a text component using its own width as the container width,
     automatically minified.
     """
@@ -25,7 +26,7 @@ def local_center(component: TextComponent):
         return center(component)
 
 
-def local_right(component: TextComponent):
+def local_right(component: TextComponent | CompiledComponent):
     """Right-aligns a text component using its own width as the container width,
     automatically minified.
     """
@@ -1,9 +1,9 @@
-from .advances import get_advance, get_line_advance
+from .advances import get_advance
 from .container import container
 from .overlap import overlap
 from .pad_each_line import pad_each_line
 from .types import TextComponent
-from .whitespace import SPACE_ADVANCE, whitespace
+from .whitespace import get_space_advance, get_valid_whitespace_advance
 
 
 def columns(
@@ -16,6 +16,8 @@ def columns(
     left-aligned, automatically minified.
     """
 
+    space_advance = get_space_advance()
+
     component_advances: list[float] = []
 
     # The amount of in-game pixels available for additional columns in the container.
@@ -30,21 +32,21 @@ def columns(
     # The amount of whitespace around or between each column.
     column_spacing = free_width / (len(components) + 1)
 
-    if column_spacing < SPACE_ADVANCE:
+    if column_spacing < space_advance:
         # There isn't room to fit the spacing around columns, so try removing it.
         spacing_around_columns = False
 
     if not spacing_around_columns:
         column_spacing = free_width / (len(components) - 1)
 
-        if column_spacing < SPACE_ADVANCE:
+        if column_spacing < space_advance:
             # There isn't room to fit any spacing between columns either.
             raise ValueError(
                 "The specified columns are too wide to fit in the container."
             )
 
     # Round to the nearest valid whitespace advance.
-    column_spacing = get_line_advance(whitespace(column_spacing))
+    column_spacing = get_valid_whitespace_advance(column_spacing)
 
     padded_columns: list[TextComponent] = []
 
@@ -0,0 +1,222 @@
+from collections.abc import Generator
+from typing import TYPE_CHECKING, cast
+
+from .formatting import FORMATTING_KEYS
+from .helpers import js_str
+from .interned_formatting import get_interned_formatting, intern_formatting
+from .types import (
+    FlatTextComponent,
+    TextComponent,
+    TextComponentDict,
+    TextComponentFormatting,
+    TextComponentText,
+)
+
+if TYPE_CHECKING:
+    from .advances.advance_table import AdvanceTable
+
+
+class CompiledComponent:
+    """A text component flattened once into parallel arrays of runs, so it can be passed
+    to any function accepting a text component without being flattened again.
+
+    >>> compiled = CompiledComponent(["", {"text": "a", "color": "red"}, "b"])
+    >>> compiled.texts
+    ["a", "b"]
+    >>> [compiled.get_formatting(index) for index in range(len(compiled))]
+    [{"color": "red"}, {}]
+    >>> compiled.to_component()
+    ["", {"text": "a", "color": "red"}, "b"]
+    """
+
+    __slots__ = (
+        "formatting",
+        "contents",
+        "texts",
+        "formatting_ids",
+        "_formattings",
+        "_advances",
+        "_advance_tables",
+    )
+
+    # The formatting of the original text component itself, which the rest of a list
+    # inherits if the original text component is first in it.
+    formatting: TextComponentFormatting
+
+    # Each run without its formatting: its `TextComponentText` if it's plain text, and
+    # otherwise its `dict` with only non-formatting keys.
+    contents: list[TextComponentText | TextComponentDict]
+    # Each run's `text` as a `str`, or `None` if it has no `text`.
+    texts: list[str | None]
+    # Each run's interned formatting ID.
+    formatting_ids: list[int]
+    # Each run's interned formatting, kept so it outlives `clear_interned_formatting`.
+    _formattings: list[TextComponentFormatting]
+    # Each run's advance in in-game pixels, measured on first access.
+    _advances: list[float]
+    # The `AdvanceTable` each run's advance was measured with, or `None` if it hasn't
+    # been measured yet.
+    _advance_tables: "list[AdvanceTable | None]"
+
+    def __init__(self, component: TextComponent):
+        from .flat import flat, inherit_formatting
+
+        self.formatting = inherit_formatting({}, component)
+        self.contents = []
+        self.texts = []
+        self.formatting_ids = []
+        self._formattings = []
+
+        for subcomponent in flat(component):
+            formatting: TextComponentFormatting = {}
+            text: str | None = None
+
+            if isinstance(subcomponent, dict):
+                content: TextComponentText | TextComponentDict = cast(
+                    TextComponentDict, {}
+                )
+
+                for key, value in subcomponent.items():
+                    if key in FORMATTING_KEYS:
+                        formatting[key] = value
+                    else:
+                        content[key] = value
+
+                if "text" in subcomponent:
+                    text = js_str(subcomponent["text"])
+
+            else:
+                content = subcomponent
+                text = js_str(subcomponent)
+
+            self.contents.append(content)
+            self.texts.append(text)
+            formatting_id = intern_formatting(formatting)
+            self.formatting_ids.append(formatting_id)
+            self._formattings.append(get_interned_formatting(formatting_id).formatting)
+
+        self._advances = [0.0] * len(self.contents)
+        self._advance_tables = [None] * len(self.contents)
+
+    def __len__(self):
+        return len(self.contents)
+
+    def __repr__(self):
+        return f"CompiledComponent({repr(self.to_component())})"
+
+    def get_formatting(self, index: int) -> TextComponentFormatting:
+        """Gets a run's formatting. ⚠️ Must never be mutated."""
+
+        return self._formattings[index]
+
+    def get_run(
+        self,
+        index: int,
+        # The formatting inherited from outside the compiled component.
+        inherited_formatting: TextComponentFormatting | None = None,
+    ) -> FlatTextComponent:
+        """Converts a run back to a new `FlatTextComponent`."""
+
+        content = self.contents[index]
+        formatting = self.get_formatting(index)
+
+        if inherited_formatting:
+            formatting = inherited_formatting | formatting
+
+        if isinstance(content, dict):
+            return cast(TextComponentDict, content | formatting)
+
+        if formatting:
+            return cast(TextComponentDict, {"text": content, **formatting})
+
+        return content
+
+    def get_run_slice(self, index: int, start: int, end: int) -> FlatTextComponent:
+        """Converts a run back to a new `FlatTextComponent` with only `text[start:end]`
+        of its text.
+        """
+
+        content = self.contents[index]
+        text = self.texts[index]
+
+        if text is None or (start == 0 and end == len(text)):
+            return self.get_run(index)
+
+        formatting = self.get_formatting(index)
+
+        if isinstance(content, dict):
+            return cast(
+                TextComponentDict, {**content, **formatting, "text": text[start:end]}
+            )
+
+        if formatting:
+            return cast(TextComponentDict, {"text": text[start:end], **formatting})
+
+        return text[start:end]
+
+    def runs(
+        self,
+        # The formatting inherited from outside the compiled component.
+        inherited_formatting: TextComponentFormatting | None = None,
+    ) -> Generator[FlatTextComponent, None, None]:
+        """Generates each run converted back to a new `FlatTextComponent`, equivalent to
+        what `flat` yields for the original text component.
+        """
+
+        for index in range(len(self.contents)):
+            yield self.get_run(index, inherited_formatting)
+
+    def get_run_advance(self, index: int) -> float | None:
+        """Gets a run's advance in in-game pixels, or `None` if it has no `text`.
+
+        The advance is measured on first access and kept until the `AdvanceTable` of the
+        run's font changes (e.g. by `register_font` or `load_resource_pack_fonts`), so
+        it's never stale.
+        """
+
+        from .advances.fonts import get_font_advance_table
+        from .advances.get_line_advance import get_text_line_advance
+
+        text = self.texts[index]
+
+        if text is None:
+            return None
+
+        formatting = self.get_formatting(index)
+        table = get_font_advance_table(formatting.get("font"))
+
+        if table is not self._advance_tables[index]:
+            self._advances[index] = get_text_line_advance(text, formatting)
+            self._advance_tables[index] = table
+
+        return self._advances[index]
+
+    def get_advance(self) -> float:
+        """Gets the sum of the runs' advances in in-game pixels."""
+
+        advance = 0
+
+        for index in range(len(self.contents)):
+            run_advance = self.get_run_advance(index)
+
+            if run_advance is None:
+                raise ValueError(
+                    "It's impossible to determine the advance of the following text "
+                    f"component:\n{repr(self.get_run(index))}"
+                )
+
+            advance += run_advance
+
+        return advance
+
+    def to_component(self) -> TextComponent:
+        """Converts the compiled component back to a new equivalent `TextComponent`."""
+
+        if not self.contents:
+            return ""
+
+        if len(self.contents) == 1:
+            return self.get_run(0)
+
+        # Start with `""` so no run inherits formatting from the first.
+        return ["", *self.runs()]
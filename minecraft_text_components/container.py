@@ -1,6 +1,41 @@
 from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from types import EllipsisType
 from typing import Any, ClassVar, Final
 
+# The container width shared by every thread and asyncio task which hasn't entered a
+# `Container`, or `None` if it isn't defined.
+default_container_width: float | None = None
+
+# A container width in a context, `None` if it isn't defined, or `...` if no
+# `Container` is entered, so the `default_container_width` applies.
+ContextContainerWidth = float | None | EllipsisType
+
+# The container width of the innermost `Container` entered in the current thread or
+# asyncio task.
+container_width: ContextVar[ContextContainerWidth] = ContextVar(
+    "container_width", default=...
+)
+
+# The container width from before each `Container` entered in the current context,
+# since the same `Container` may be entered in several contexts at once.
+previous_container_widths: ContextVar[tuple[ContextContainerWidth, ...]] = ContextVar(
+    "previous_container_widths", default=()
+)
+
+
+def set_container_width(width: float | None):
+    """Sets the container width of the current context until the innermost `Container`
+    entered in it exits, or the `default_container_width` if no `Container` is entered.
+    """
+
+    global default_container_width
+
+    if container_width.get() is ...:
+        default_container_width = width
+    else:
+        container_width.set(width)
+
 
 class Container(AbstractContextManager["Container"]):
     """A context manager for the maximum advance of a line of text in in-game pixels.
@@ -9,36 +44,52 @@ class Container(AbstractContextManager["Container"]):
 
     width: Final[float | None]
 
-    _previous_widths: list[float | None]
-
     def __init__(self, width: float | None):
         self.width = width
 
-        self._previous_widths = []
-
     def __enter__(self):
-        self._previous_widths.append(getattr(container, "width", None))
-
-        if self.width is None:
-            del container.width
-        else:
-            container.width = self.width
+        previous_container_widths.set(
+            (*previous_container_widths.get(), container_width.get())
+        )
+        container_width.set(self.width)
 
         return self
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any):
-        previous_width = self._previous_widths.pop()
+        *previous_widths, previous_width = previous_container_widths.get()
 
-        if previous_width is None:
-            del container.width
-        else:
-            container.width = previous_width
+        previous_container_widths.set(tuple(previous_widths))
+        container_width.set(previous_width)
 
     def __repr__(self):
         return f"container(width={self.width})"
 
 
-class container:
+class ContainerMeta(type):
+    """Makes `container.width` read and write the current context's container width."""
+
+    @property
+    def width(cls) -> float:
+        width = container_width.get()
+
+        if width is ...:
+            width = default_container_width
+
+        if width is None:
+            raise AttributeError("The container width isn't defined")
+
+        return width
+
+    @width.setter
+    def width(cls, width: float):
+        set_container_width(width)
+
+    @width.deleter
+    def width(cls):
+        set_container_width(None)
+
+
+class container(metaclass=ContainerMeta):
     """Holds the current maximum advance of a line of text in in-game pixels.
 
     To set the container width for the duration of a `with` block:
@@ -68,6 +119,14 @@ class container:
     >>> del container.width
     >>> print(container.width)
     AttributeError
+
+    The persistent container width is shared by every thread, so it's visible to
+    threads and pools started at any time. The container width set by a `with` block
+    is local to the current thread or asyncio task (as a `contextvars.ContextVar`), so
+    concurrent layouts with different widths don't interfere, and other threads only
+    see it if they run in a copy of the current context, like those of `layout_many`
+    do. Setting the container width within a `with` block only changes it until the
+    block exits, like the block's own width.
     """
 
     # A container with no defined width.
@@ -1,6 +1,11 @@
 import dataclasses
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, TypeGuard, cast
 
-from beet import Context
+from beet import Context, TextFileBase
 from mecha import (
     AstChildren,
     AstCommand,
@@ -11,7 +16,62 @@ from mecha import (
     rule,
 )
 
-from minecraft_text_components import minify
+import minecraft_text_components
+from minecraft_text_components import minify, minify_many
+from minecraft_text_components.helpers import json_str
+from minecraft_text_components.types import TextComponent
+
+# The key of this plugin's cache in beet's cache directory.
+MINIFY_CACHE_KEY = "minecraft_text_components.minify"
+
+# The default maximum number of minified text components to keep cached between builds,
+# overridable by the `minify_cache_size` in the beet configuration's `meta`.
+DEFAULT_MINIFY_CACHE_SIZE = 65536
+
+# The default number of processes to minify text components in, overridable by the
+# `minify_workers` in the beet configuration's `meta`. If more than 1, all text
+# components are minified in parallel before any commands are rewritten.
+DEFAULT_MINIFY_WORKERS = 1
+
+
+def get_library_version():
+    """Gets the installed version of this library, or if it isn't installed (such as
+    when running from a clone of its repository), a hash of its files.
+    """
+
+    try:
+        return version("minecraft-text-components")
+    except PackageNotFoundError:
+        pass
+
+    package_path = Path(minecraft_text_components.__file__).parent
+    files_hash = hashlib.sha256()
+
+    for path in sorted(package_path.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            files_hash.update(path.read_bytes())
+
+    return f"source-{files_hash.hexdigest()}"
+
+
+def get_minify_cache_entries(ctx: Context) -> dict[str, str]:
+    """Gets the persistent mapping from the SHA-256 hash of each cached text component's
+    JSON to the JSON of its minified text component, from least to most recently used.
+    """
+
+    library_version = get_library_version()
+    cache_json = ctx.cache[MINIFY_CACHE_KEY].json
+
+    if cache_json.get("version") != library_version:
+        # The cached results may differ from what this version would output.
+        cache_json.clear()
+        cache_json["version"] = library_version
+
+    return cast(dict[str, str], cache_json.setdefault("entries", {}))
+
+
+def get_cache_key(text_component_json: str):
+    return hashlib.sha256(text_component_json.encode()).hexdigest()
 
 
 class MinifyTextComponentTransformer(MutatingReducer):
@@ -25,29 +85,122 @@ class MinifyTextComponentTransformer(MutatingReducer):
         self.ctx = ctx
         self.mecha = ctx.inject(Mecha)
         self.processed_commands: set[AstCommand] = set()
+        self.cache_entries = get_minify_cache_entries(ctx)
+        self.cache_size: int = ctx.meta.get(
+            "minify_cache_size", DEFAULT_MINIFY_CACHE_SIZE
+        )
+        self.workers: int = ctx.meta.get("minify_workers", DEFAULT_MINIFY_WORKERS)
+        # The functions being compiled when `minify_in_parallel` was last called, so it
+        # can be called again for each compilation (e.g. by other plugins calling
+        # `Mecha.compile`).
+        self.parallel_minified_functions: set[TextFileBase[Any]] = set()
+        # A mapping from the cache key of each text component minified by
+        # `minify_in_parallel` to the JSON of its minified text component.
+        self.parallel_minified_jsons: dict[str, str] = {}
 
         super().__init__()
 
-    def process_argument(self, argument: AstNode, scope: tuple[str, ...]):
-        """Returns a minified copy of the `AstJson` node if it was parsed as a text
-        component.
-
-        Otherwise returns the original node.
-        """
+    def is_text_component(
+        self,
+        argument: AstNode,
+        scope: tuple[str, ...],
+    ) -> TypeGuard[AstJson]:
+        """Checks whether a command argument was parsed as a text component."""
 
         if not isinstance(argument, AstJson):
-            return argument
+            return False
 
         command_tree = self.mecha.spec.tree.get(scope)
 
         if command_tree is None:
-            return argument
+            return False
+
+        return command_tree.parser == "minecraft:component"
+
+    def minify_in_parallel(self):
+        """Minifies every distinct uncached text component in the commands of all
+        functions being compiled, split between `self.workers` processes.
+        """
 
-        if command_tree.parser != "minecraft:component":
+        self.parallel_minified_functions = set(self.mecha.database.session)
+        self.parallel_minified_jsons = {}
+
+        # A mapping from each cache key to the text component to minify.
+        text_components: dict[str, Any] = {}
+
+        for function in self.mecha.database.session:
+            ast = self.mecha.database[function].ast
+
+            if ast is None:
+                continue
+
+            for node in ast.walk():
+                if not isinstance(node, AstCommand):
+                    continue
+
+                prototype = self.mecha.spec.prototypes[node.identifier]
+
+                for i, argument in enumerate(node.arguments):
+                    scope = prototype.get_argument(i).scope
+
+                    if not self.is_text_component(argument, scope):
+                        continue
+
+                    text_component = argument.evaluate()
+                    key = get_cache_key(json_str(text_component))
+
+                    if key not in self.cache_entries:
+                        text_components[key] = text_component
+
+        minified_text_components = minify_many(
+            text_components.values(), workers=self.workers
+        )
+
+        self.parallel_minified_jsons.update(
+            zip(
+                text_components,
+                (
+                    json_str(minified_text_component)
+                    for minified_text_component in minified_text_components
+                ),
+            )
+        )
+
+    def minify(self, text_component: Any) -> TextComponent:
+        """Minifies a text component, reusing the result from a previous build if
+        possible.
+        """
+
+        key = get_cache_key(json_str(text_component))
+        minified_json = self.cache_entries.pop(key, None)
+
+        if minified_json is None:
+            minified_json = self.parallel_minified_jsons.get(key)
+
+        if minified_json is None:
+            minified_json = json_str(minify(text_component))
+
+        # (Re)insert the entry so it's the most recently used.
+        self.cache_entries[key] = minified_json
+
+        if len(self.cache_entries) > self.cache_size:
+            # Evict the least recently used entry.
+            del self.cache_entries[next(iter(self.cache_entries))]
+
+        return json.loads(minified_json)
+
+    def process_argument(self, argument: AstNode, scope: tuple[str, ...]):
+        """Returns a minified copy of the `AstJson` node if it was parsed as a text
+        component.
+
+        Otherwise returns the original node.
+        """
+
+        if not self.is_text_component(argument, scope):
             return argument
 
         initial_text_component = argument.evaluate()
-        minified_text_component = minify(initial_text_component)
+        minified_text_component = self.minify(initial_text_component)
 
         if initial_text_component == minified_text_component:
             return argument
@@ -64,6 +217,15 @@ class MinifyTextComponentTransformer(MutatingReducer):
         if node in self.processed_commands:
             return node
 
+        if (
+            self.workers > 1
+            and self.mecha.database.current not in self.parallel_minified_functions
+        ):
+            # This is the first command optimized in a new compilation. Every function
+            # in it has been parsed and transformed by now, since Mecha runs each
+            # compilation step on all functions before the next step.
+            self.minify_in_parallel()
+
         prototype = self.mecha.spec.prototypes[node.identifier]
         arguments: list[AstNode] = []
         changed = False
@@ -1,16 +1,61 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 
-from .formatting import get_formatting
+from .compiled import CompiledComponent
+from .formatting import FORMATTING_KEYS
 from .types import FlatTextComponent, TextComponent, TextComponentFormatting
 
 
+def inherit_formatting(
+    formatting: TextComponentFormatting,
+    component: TextComponent | CompiledComponent,
+) -> TextComponentFormatting:
+    """Gets the formatting that a text component's contents inherit, given the
+    formatting the text component itself inherits.
+
+    Never mutates the inputted `formatting`, and returns it as is (rather than a copy)
+    if the text component doesn't add to it.
+    """
+
+    # A list's formatting is its first element's formatting.
+    while isinstance(component, list):
+        if not component:
+            return formatting
+
+        component = component[0]
+
+    if isinstance(component, CompiledComponent):
+        if component.formatting:
+            return formatting | component.formatting
+
+        return formatting
+
+    if not isinstance(component, dict):
+        return formatting
+
+    inherited_formatting: TextComponentFormatting | None = None
+
+    for key in component:
+        if key in FORMATTING_KEYS:
+            if inherited_formatting is None:
+                inherited_formatting = formatting.copy()
+
+            inherited_formatting[key] = component[key]
+
+    if inherited_formatting is None:
+        return formatting
+
+    return inherited_formatting
+
+
 def flat(
-    component: TextComponent,
+    component: TextComponent | CompiledComponent,
     formatting: TextComponentFormatting | None = None,
 ) -> Generator[FlatTextComponent, None, None]:
     """Generates the sequence of `TextComponentText`s and `TextComponentDict`s needed to
     recursively flatten all lists and `extra`s of a text component into one big list.
 
+    `CompiledComponent`s are already flat, so their runs are yielded directly.
+
     Never yields `''`. All yielded `dict`s are shallow copies if not new. Doesn't
     transform `with` values at all.
     """
@@ -18,33 +63,60 @@ def flat(
     if formatting is None:
         formatting = {}
 
-    # Be careful not to mutate the original `formatting`.
-    formatting = formatting | get_formatting(component)
+    # A stack of the partially iterated lists of subcomponents currently being
+    # flattened, each with the formatting its subcomponents inherit. The formattings are
+    # shared between stack entries and never mutated, so a new one is only created when
+    # a subcomponent adds formatting.
+    stack: list[
+        tuple[Iterator[TextComponent | CompiledComponent], TextComponentFormatting]
+    ] = [(iter((component,)), formatting)]
+
+    while stack:
+        subcomponents, formatting = stack[-1]
+
+        for subcomponent in subcomponents:
+            if isinstance(subcomponent, CompiledComponent):
+                yield from subcomponent.runs(formatting)
+                continue
+
+            if isinstance(subcomponent, list):
+                if subcomponent:
+                    stack.append(
+                        (
+                            iter(subcomponent),
+                            inherit_formatting(formatting, subcomponent),
+                        )
+                    )
+                    # Flatten the new top of the stack before continuing this one.
+                    break
+
+                continue
 
-    if isinstance(component, list):
-        if component:
-            for subcomponent in component:
-                yield from flat(subcomponent, formatting)
+            if isinstance(subcomponent, dict):
+                subcomponent_formatting = inherit_formatting(formatting, subcomponent)
 
-        return
+                flat_subcomponent = subcomponent.copy()
+                extra = flat_subcomponent.pop("extra", None)
+                flat_subcomponent.update(subcomponent_formatting)
 
-    if isinstance(component, dict):
-        component_without_extra = component.copy()
-        extra = component_without_extra.pop("extra", None)
+                yield flat_subcomponent  # type: ignore
 
-        yield component_without_extra | formatting  # type: ignore
+                if extra:
+                    stack.append((iter(extra), subcomponent_formatting))
+                    # Flatten the new top of the stack before continuing this one.
+                    break
 
-        if extra:
-            for subcomponent in extra:
-                yield from flat(subcomponent, formatting)
+                continue
 
-        return
+            if subcomponent == "":
+                continue
 
-    if component == "":
-        return
+            if formatting:
+                yield {"text": subcomponent, **formatting}
+                continue
 
-    if formatting:
-        yield {"text": component, **formatting}
-        return
+            yield subcomponent
 
-    yield component
+        else:
+            # This list of subcomponents is exhausted.
+            stack.pop()
@@ -23,11 +23,17 @@ def js_str(component: TextComponentText) -> str:
     return str(component)
 
 
-def json_str(value: object):
+def json_str(
+    value: object,
+    # Whether to sort the keys of each `dict`, so equal objects always get the same
+    # string regardless of the order of their keys.
+    sort_keys: bool = False,
+):
     """Gets a minified JSON string of the specified object."""
 
     return json.dumps(
         value,
         ensure_ascii=False,
         separators=(",", ":"),
+        sort_keys=sort_keys,
     )
@@ -0,0 +1,197 @@
+import json
+import threading
+from collections.abc import Hashable
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Final, NamedTuple, cast
+
+from .formatting import WHITESPACE_UNAFFECTED_BY_KEYS
+from .helpers import json_str
+from .types import TextComponentFormatting
+
+
+@dataclass(frozen=True)
+class FormattingItem:
+    key: Final[str]
+    value: Final[object]
+
+    @cached_property
+    def _json(self):
+        # This assumes `json_str(self.key) == f'"{self.key}"'`.
+        return f',"{self.key}":{json_str(self.value)}'
+
+    @cached_property
+    def cost(self):
+        return len(self._json)
+
+    def __hash__(self):
+        return hash(self._json)
+
+
+FormattingSet = frozenset[FormattingItem]
+
+
+def get_value_key(value: object) -> Hashable:
+    """Gets a hashable key which is equal for two formatting values if and only if they
+    are equivalent in JSON.
+    """
+
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+    # Include the type so that e.g. `True` and `1` aren't considered equal.
+    return (type(value), value)
+
+
+def get_formatting_key(formatting: TextComponentFormatting) -> Hashable:
+    """Gets a hashable key which is equal for two formattings if and only if they are
+    equivalent in JSON, regardless of key order.
+    """
+
+    return tuple(
+        sorted((key, get_value_key(value)) for key, value in formatting.items())
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class InternedFormatting:
+    """A distinct `TextComponentFormatting` with precomputed properties, shared by every
+    equivalent formatting.
+    """
+
+    id: Final[int]
+    # ⚠️ Must never be mutated.
+    formatting: Final[TextComponentFormatting]
+
+    @cached_property
+    def items(self):
+        """The formatting as a `FormattingSet`."""
+
+        return FormattingSet(
+            get_formatting_item(key, value) for key, value in self.formatting.items()
+        )
+
+    @cached_property
+    def cost(self):
+        """The number of characters the formatting adds to a text component's JSON."""
+
+        return sum(item.cost for item in self.items)
+
+    @cached_property
+    def keys(self):
+        return frozenset(self.formatting)
+
+    @cached_property
+    def whitespace_affecting_id(self):
+        """The ID of this formatting without the keys that don't affect whitespace."""
+
+        if self.keys.isdisjoint(WHITESPACE_UNAFFECTED_BY_KEYS):
+            return self.id
+
+        return intern_formatting(
+            cast(
+                TextComponentFormatting,
+                {
+                    key: value
+                    for key, value in self.formatting.items()
+                    if key not in WHITESPACE_UNAFFECTED_BY_KEYS
+                },
+            )
+        )
+
+
+# Each `InternedFormatting`, keyed by ID.
+interned_formattings: dict[int, InternedFormatting] = {}
+# The ID of the next formatting to be interned. IDs are never reused, even after
+# `clear_interned_formatting`, so an ID from before clearing can't be mistaken for a
+# different formatting.
+next_formatting_id = 0
+# A mapping from each interned formatting's `get_formatting_key` to its ID.
+formatting_ids: dict[Hashable, int] = {}
+# A mapping from each `FormattingItem`'s key and `get_value_key` to the item.
+formatting_items: dict[tuple[str, Hashable], FormattingItem] = {}
+
+interning_lock = threading.Lock()
+
+
+def intern_formatting(formatting: TextComponentFormatting) -> int:
+    """Gets the ID of the `InternedFormatting` equivalent to the specified formatting,
+    interning a copy of it if there is none yet.
+    """
+
+    global next_formatting_id
+
+    formatting_key = get_formatting_key(formatting)
+    formatting_id = formatting_ids.get(formatting_key)
+
+    if formatting_id is not None:
+        return formatting_id
+
+    with interning_lock:
+        formatting_id = formatting_ids.get(formatting_key)
+
+        if formatting_id is None:
+            formatting_id = next_formatting_id
+            next_formatting_id += 1
+
+            interned_formattings[formatting_id] = InternedFormatting(
+                formatting_id, formatting.copy()
+            )
+            formatting_ids[formatting_key] = formatting_id
+
+    return formatting_id
+
+
+def get_interned_formatting(formatting_id: int):
+    return interned_formattings[formatting_id]
+
+
+def clear_interned_formatting():
+    """Frees every interned formatting, which are otherwise kept for the life of the
+    process so that each distinct formatting's properties are only computed once.
+
+    Worth calling periodically in long-running processes that style text with many
+    distinct formattings (e.g. generated colors or hover events). `CompiledComponent`s
+    keep their own formattings, so they're unaffected.
+
+    ⚠️ Must not be called while other threads are minifying or compiling text
+    components, since they may look up formatting IDs interned before clearing.
+    """
+
+    with interning_lock:
+        interned_formattings.clear()
+        formatting_ids.clear()
+        formatting_items.clear()
+
+
+class InternedFormattingInfo(NamedTuple):
+    # The number of distinct interned formattings.
+    formattings: int
+    # The number of distinct interned formatting keys and values.
+    items: int
+
+
+def interned_formatting_info():
+    """Gets the number of distinct formattings and formatting items interned."""
+
+    return InternedFormattingInfo(len(interned_formattings), len(formatting_items))
+
+
+def get_formatting_item(key: str, value: object):
+    """Gets the `FormattingItem` equivalent to the specified key and value, so that each
+    distinct item's JSON is only computed once.
+    """
+
+    item_key = (key, get_value_key(value))
+    item = formatting_items.get(item_key)
+
+    if item is None:
+        item = formatting_items.setdefault(item_key, FormattingItem(key, value))
+
+    return item
+
+
+def get_formatting_set(formatting: TextComponentFormatting) -> FormattingSet:
+    """Converts a `TextComponentFormatting` to a `FormattingSet` of interned items."""
+
+    return get_interned_formatting(intern_formatting(formatting)).items
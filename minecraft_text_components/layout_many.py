@@ -0,0 +1,74 @@
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TypeVar
+
+from .compiled import CompiledComponent
+from .container import container
+from .minify.minify_many import initialize_worker
+from .types import TextComponent
+
+T = TypeVar("T")
+
+
+def layout_many(
+    layout: Callable[[TextComponent | CompiledComponent], T],
+    components: Iterable[TextComponent | CompiledComponent],
+    # The container width to lay out each text component in, in the same order.
+    widths: Iterable[float | None],
+    *,
+    # The number of threads to lay out in. Defaults to the number of CPUs. If 1, the
+    # text components are laid out in the current thread.
+    workers: int | None = None,
+) -> list[T]:
+    """Lays out many independent text components with a function like `wrap`, `center`,
+    or `pad_each_line`, each in a container of its own width, in parallel threads if
+    `workers` isn't 1.
+
+    Returns the results in the same order as the inputted text components. Each text
+    component is laid out in a copy of the current context, so the container width and
+    any other context variables set around this call are visible to `layout`.
+
+    ⚠️ Laying out text is CPU-bound, so it only runs faster in more threads on
+    free-threaded builds of CPython. With the GIL, threads only help when `layout` also
+    waits on I/O, and `minify_many` with processes is faster for minifying.
+
+    >>> layout_many(wrap, [text, text], [container.chat.width, container.book.width])
+    [<text wrapped for chat>, <text wrapped for a book>]
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("The number of `workers` must be at least 1")
+
+    components = list(components)
+    widths = list(widths)
+
+    if len(widths) != len(components):
+        raise ValueError("The number of `widths` must equal the number of `components`")
+
+    # The current context, a copy of which each text component is laid out in.
+    context = copy_context()
+
+    def lay_out_in_container(
+        component: TextComponent | CompiledComponent,
+        width: float | None,
+    ):
+        with container(width):
+            return layout(component)
+
+    def lay_out(component: TextComponent | CompiledComponent, width: float | None):
+        return context.copy().run(lay_out_in_container, component, width)
+
+    if workers == 1 or len(components) <= 1:
+        return list(map(lay_out, components, widths))
+
+    # Load the tables before starting any workers, so they aren't loaded by several
+    # threads at once.
+    initialize_worker()
+
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(lay_out, components, widths))
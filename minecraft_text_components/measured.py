@@ -0,0 +1,415 @@
+import math
+from bisect import bisect_right
+from collections.abc import Generator, Iterable
+from itertools import accumulate, islice
+from typing import cast
+
+from .advances.fonts import get_font_advance_table
+from .advances.get_text_advance import get_table_char_advances
+from .compiled import CompiledComponent
+from .container import container
+from .flat import flat
+from .helpers import js_str
+from .minify import minify
+from .types import FlatTextComponent, TextComponent, TextComponentDict
+
+# The start and end indices of a line in a `MeasuredComponent`'s `text`, and the
+# minimum container width at which the line wraps the same way.
+LineRange = tuple[int, int, float]
+
+
+class MeasuredComponent:
+    """A text component flattened into its runs' concatenated text and the advance of
+    every prefix of that text, so it can be wrapped in containers of any number of
+    widths without being flattened or measured again.
+
+    The positions where it wraps are found by bisecting the advances rather than
+    measuring each character separately, unless any of its fonts has negative advances,
+    in which case the advances are scanned instead.
+
+    >>> measured = MeasuredComponent(["", {"text": "Hello", "bold": True}, " world!"])
+    >>> measured.wrap(40)
+    ["", {"text": "Hello\\n", "bold": True}, "world!"]
+    >>> measured.get_min_width(2)
+    29.0
+    """
+
+    __slots__ = (
+        "runs",
+        "run_starts",
+        "text",
+        "prefix_advances",
+        "has_negative_advances",
+    )
+
+    # Each run with a non-empty `text`.
+    runs: list[FlatTextComponent]
+    # The index in `text` at which each run's `text` starts.
+    run_starts: list[int]
+    # The `text`s of all the runs concatenated.
+    text: str
+    # The advance in in-game pixels of each prefix of `text`, from the empty prefix to
+    # the whole `text`, so the advance of `text[start:end]` is
+    # `prefix_advances[end] - prefix_advances[start]`.
+    prefix_advances: list[float]
+    # Whether any run's font has negative advances, in which case the `prefix_advances`
+    # can decrease and can't be bisected.
+    has_negative_advances: bool
+
+    def __init__(self, component: TextComponent | CompiledComponent):
+        self.runs = []
+        self.run_starts = []
+        self.prefix_advances = [0]
+        self.has_negative_advances = False
+
+        texts: list[str] = []
+        text_length = 0
+
+        for run in flat(component):
+            if isinstance(run, dict):
+                if "text" not in run:
+                    raise ValueError(
+                        "It's impossible to determine the advance of the following text "
+                        f"component:\n{repr(run)}"
+                    )
+
+                text = js_str(run["text"])
+                bold = run.get("bold") == True
+                font = run.get("font")
+
+            else:
+                text = js_str(run)
+                bold = False
+                font = None
+
+            if not text:
+                continue
+
+            self.runs.append(run)
+            self.run_starts.append(text_length)
+            texts.append(text)
+            text_length += len(text)
+
+            table = get_font_advance_table(font)
+
+            if table.has_negative_advances:
+                self.has_negative_advances = True
+
+            # Continue the prefix advances from the last one, which `accumulate` yields
+            # again as its initial value.
+            self.prefix_advances.extend(
+                accumulate(
+                    get_table_char_advances(text, bold, table),
+                    initial=self.prefix_advances.pop(),
+                )
+            )
+
+        self.text = "".join(texts)
+
+    def __repr__(self):
+        return f"MeasuredComponent({repr(['', *self.get_slice(0, len(self.text))])})"
+
+    def get_max_advance(self, start: int, end: int) -> float:
+        """Gets the greatest advance in in-game pixels of any prefix of
+        `text[start:end]`, which is the advance of the whole slice unless any advances
+        are negative.
+        """
+
+        prefix_advances = self.prefix_advances
+
+        if not self.has_negative_advances or end <= start:
+            return prefix_advances[end] - prefix_advances[start]
+
+        return max(islice(prefix_advances, start + 1, end + 1)) - prefix_advances[start]
+
+    def scan_overflow_end(self, start: int, end: int, width: float) -> int:
+        """Finds the index after the first character of `text[start + 1:end]` that
+        overflows a line starting at `start`, or `end + 1` if none does, by scanning
+        rather than bisecting, since negative advances can make the prefix advances
+        decrease.
+        """
+
+        prefix_advances = self.prefix_advances
+        # The greatest advance of any prefix of the line that doesn't overflow it.
+        max_prefix_advance = prefix_advances[start] + width
+
+        for index in range(start + 2, end + 1):
+            if prefix_advances[index] > max_prefix_advance:
+                return index
+
+        return end + 1
+
+    def wrapped_line_ranges(
+        self,
+        start: int,
+        end: int,
+        width: float,
+        # A list to append to, for each line, the least width greater than `width` at
+        # which the line would wrap differently, or `math.inf` if there is none.
+        next_widths: list[float] | None = None,
+    ) -> Generator[LineRange, None, None]:
+        """Generates the `LineRange` of each line that `text[start:end]` wraps into,
+        where that range has no line breaks.
+
+        Lines wrap before the word that overflows them, dropping the space before it,
+        and words which can't fit on a line of their own are broken wherever they
+        overflow.
+        """
+
+        text = self.text
+        prefix_advances = self.prefix_advances
+        has_negative_advances = self.has_negative_advances
+
+        while True:
+            # The index after the first character that overflows the line. The first
+            # character of a line never overflows it, since it couldn't fit on any other
+            # line either.
+            if has_negative_advances:
+                overflow_end = self.scan_overflow_end(start, end, width)
+            else:
+                overflow_end = bisect_right(
+                    prefix_advances,
+                    prefix_advances[start] + width,
+                    start + 2,
+                    end + 1,
+                )
+
+            if overflow_end > end:
+                # The rest of the text fits on this line.
+                if next_widths is not None:
+                    next_widths.append(math.inf)
+
+                yield start, end, self.get_max_advance(start, end)
+                return
+
+            overflow = overflow_end - 1
+            # Everything before the overflowing character has to fit for the line to
+            # overflow there.
+            min_width = (
+                self.get_max_advance(start, overflow)
+                if has_negative_advances
+                else prefix_advances[overflow] - prefix_advances[start]
+            )
+            # The width at which the overflowing character would fit.
+            next_width = prefix_advances[overflow_end] - prefix_advances[start]
+
+            if text[overflow] == " ":
+                # Wrap at the space, dropping it.
+                if next_widths is not None:
+                    next_widths.append(next_width)
+
+                yield start, overflow, min_width
+                start = overflow + 1
+                continue
+
+            # The start of the word containing the overflowing character, or `start`
+            # if the line has no spaces before it.
+            word_start = text.rfind(" ", start, overflow) + 1
+
+            if word_start > start:
+                if word_start == overflow:
+                    # Wrap the word to the next line, dropping the space before it.
+                    if next_widths is not None:
+                        next_widths.append(next_width)
+
+                    yield start, word_start - 1, min_width
+                    start = word_start
+                    continue
+
+                # The advance of the word up to and including the overflowing character.
+                word_advance = (
+                    self.get_max_advance(word_start, overflow_end)
+                    if has_negative_advances
+                    else prefix_advances[overflow_end] - prefix_advances[word_start]
+                )
+
+                if word_advance <= width:
+                    # Wrap the word to the next line, dropping the space before it.
+                    if next_widths is not None:
+                        next_widths.append(next_width)
+
+                    yield start, word_start - 1, max(min_width, word_advance)
+                    start = word_start
+                    continue
+
+                # The word would fit on a line of its own in a container this wide.
+                next_width = min(next_width, word_advance)
+
+            # The word is too long to fit on a line of its own, so break it.
+            if next_widths is not None:
+                next_widths.append(next_width)
+
+            yield start, overflow, min_width
+            start = overflow
+
+    def line_ranges(
+        self,
+        width: float,
+        # See `wrapped_line_ranges`.
+        next_widths: list[float] | None = None,
+    ) -> Generator[LineRange, None, None]:
+        """Generates the `LineRange` of each line that the text component wraps into in
+        a container of the specified width, including lines separated by line breaks.
+        """
+
+        text = self.text
+        start = 0
+
+        while True:
+            end = text.find("\n", start)
+            if end == -1:
+                end = len(text)
+
+            yield from self.wrapped_line_ranges(start, end, width, next_widths)
+
+            if end == len(text):
+                return
+
+            start = end + 1
+
+    def get_slice(self, start: int, end: int) -> list[FlatTextComponent]:
+        """Gets new runs of `text[start:end]`, each with the formatting of the run it's
+        sliced from.
+        """
+
+        output: list[FlatTextComponent] = []
+
+        # The index of the run containing `start`.
+        index = max(bisect_right(self.run_starts, start) - 1, 0)
+
+        while index < len(self.runs) and self.run_starts[index] < end:
+            run = self.runs[index]
+            run_start = self.run_starts[index]
+            next_run_start = (
+                self.run_starts[index + 1] if index + 1 < len(self.runs) else end
+            )
+            text = self.text[max(start, run_start) : min(end, next_run_start)]
+
+            if isinstance(run, dict):
+                output.append(cast(TextComponentDict, {**run, "text": text}))
+            else:
+                output.append(text)
+
+            index += 1
+
+        return output
+
+    def get_lines(self, line_ranges: Iterable[LineRange]) -> TextComponent:
+        """Gets the specified lines of the text component separated by line breaks,
+        automatically minified.
+        """
+
+        # Start with `""` to prevent unwanted inheritence.
+        output: list[TextComponent] = [""]
+
+        for i, (start, end, _) in enumerate(line_ranges):
+            if i != 0:
+                output.append("\n")
+
+            output.extend(self.get_slice(start, end))
+
+        return minify(output)
+
+    def wrap(self, width: float | None = None) -> TextComponent:
+        """Inserts line breaks in the text component where there would otherwise be
+        wrapping due to the text overflowing a container of the specified width,
+        automatically minified. The width defaults to `container.width`.
+        """
+
+        if width is None:
+            width = container.width
+
+        return self.get_lines(self.line_ranges(width))
+
+    def get_line_count(self, width: float | None = None) -> int:
+        """Gets the number of lines the text component wraps into in a container of the
+        specified width. The width defaults to `container.width`.
+        """
+
+        if width is None:
+            width = container.width
+
+        return sum(1 for _ in self.line_ranges(width))
+
+    def get_min_width(self, line_count: int) -> float:
+        """Gets the minimum container width in in-game pixels at which the text
+        component wraps into at most the specified number of lines.
+
+        The width is never less than the advance of the widest character, since text
+        can't be wrapped any narrower than that.
+
+        ⚠️ Unless any advances are negative, assumes wider containers never wrap into
+        more lines, so the widths can be bisected. Spaces at the start or end of a
+        wrapped line can occasionally break that assumption, in which case a narrower
+        width may be missed. With negative advances, which break it far more often,
+        every width at which the wrapping changes is tried in order instead.
+        """
+
+        if line_count < 1:
+            raise ValueError("The `line_count` must be at least 1")
+
+        text = self.text
+        prefix_advances = self.prefix_advances
+
+        # The number of lines separated by line breaks, which no width can reduce.
+        paragraph_count = text.count("\n") + 1
+
+        if paragraph_count > line_count:
+            raise ValueError(
+                f"The text component can't fit in {line_count} lines, since it has "
+                f"{paragraph_count} lines separated by line breaks"
+            )
+
+        # A width at which the text component may wrap into too many lines.
+        narrow_width = max(
+            (
+                prefix_advances[i + 1] - prefix_advances[i]
+                for i, char in enumerate(text)
+                if char != "\n"
+            ),
+            default=0,
+        )
+
+        if self.has_negative_advances:
+            width = narrow_width
+
+            while True:
+                next_widths: list[float] = []
+
+                if sum(1 for _ in self.line_ranges(width, next_widths)) <= line_count:
+                    return width
+
+                # Every width up to the next one wraps the same way.
+                width = min(next_widths)
+
+        if self.get_line_count(narrow_width) <= line_count:
+            return narrow_width
+
+        # A width at which the text component is known to wrap into few enough lines,
+        # since each line separated by a line break fits on one line.
+        wide_width = max(
+            min_width for _, _, min_width in self.line_ranges(prefix_advances[-1])
+        )
+
+        while True:
+            width = (narrow_width + wide_width) / 2
+
+            if not narrow_width < width < wide_width:
+                # There are no more widths between them to try.
+                return wide_width
+
+            line_ranges = list(self.line_ranges(width))
+
+            if len(line_ranges) <= line_count:
+                # Every width from the greatest minimum width of its lines up to this
+                # one wraps the same way.
+                lines_min_width = max(min_width for _, _, min_width in line_ranges)
+
+                if lines_min_width < wide_width:
+                    wide_width = lines_min_width
+                    continue
+
+                # The width only wraps into few enough lines due to floating-point
+                # rounding, so it doesn't count.
+
+            narrow_width = width
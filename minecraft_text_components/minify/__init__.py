@@ -1,3 +1,14 @@
+from .factor_common_formatting import FactoringStats, set_factoring_stats_hook
 from .minify import minify
+from .minify_cache import clear_minify_cache, minify_cache_info, set_minify_cache_size
+from .minify_many import minify_many
 
-__all__ = ["minify"]
+__all__ = [
+    "FactoringStats",
+    "set_factoring_stats_hook",
+    "minify",
+    "clear_minify_cache",
+    "minify_cache_info",
+    "set_minify_cache_size",
+    "minify_many",
+]
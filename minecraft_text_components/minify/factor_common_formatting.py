@@ -1,13 +1,13 @@
 import itertools
 import math
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from functools import cache, cached_property
 from types import EllipsisType
-from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast
+from typing import Any, Final, NamedTuple, cast
 
 from ..formatting import get_formatting, is_affected_by_inheriting
-from ..helpers import json_str
+from ..interned_formatting import FormattingItem, FormattingSet, get_formatting_set
 from ..prevent_inheritance import prevent_inheritance
 from ..types import (
     FlatTextComponent,
@@ -18,27 +18,6 @@ from ..types import (
 from .merged import merged
 from .reduce import reduced
 
-
-@dataclass(frozen=True)
-class FormattingItem:
-    key: Final[str]
-    value: Final[object]
-
-    @cached_property
-    def _json(self):
-        # This assumes `json_str(self.key) == f'"{self.key}"'`.
-        return f',"{self.key}":{json_str(self.value)}'
-
-    @cached_property
-    def cost(self):
-        return len(self._json)
-
-    def __hash__(self):
-        return hash(self._json)
-
-
-FormattingSet = frozenset[FormattingItem]
-
 # A list for which the first element is the parent formatting (if there is any), and
 # each ellipsis is a placeholder for a subcomponent inheriting from the formatting.
 FactoredFormattingList = list["FormattingSet | EllipsisType | FactoredFormattingList"]
@@ -49,12 +28,42 @@ class FactoredFormattings(NamedTuple):
     cost: float
 
 
-def get_formatting_set(formatting: TextComponentFormatting):
-    """Converts a `TextComponentFormatting` to a `FormattingSet`."""
+@dataclass
+class FactoringStats:
+    """Statistics about the memoization of one `factor_common_formatting` call."""
+
+    # The number of subcomponents factored.
+    subcomponents: int = 0
+    # The number of memoized factorings. The memo only grows during a call, so this is
+    # also its peak size.
+    entries: int = 0
+    # The number of factorings reused from the memo.
+    hits: int = 0
+    # The number of factorings computed because they weren't in the memo.
+    misses: int = 0
+    # Whether `time_limit` or `max_memo_entries` cut the search for factorings short.
+    limited: bool = False
+    # Whether `time_limit` cut the search for factorings short, so the result depends
+    # on how fast it ran.
+    timed_out: bool = False
+    # The number of seconds factoring took.
+    wall_time: float = 0
 
-    return FormattingSet(
-        FormattingItem(key, value) for key, value in formatting.items()
-    )
+
+# A function called with the `FactoringStats` of each `factor_common_formatting` call.
+FactoringStatsHook = Callable[[FactoringStats], None]
+
+factoring_stats_hook: FactoringStatsHook | None = None
+
+
+def set_factoring_stats_hook(hook: FactoringStatsHook | None):
+    """Sets a function to call with the `FactoringStats` of every text component
+    `minify` factors from now on, or removes it if `None`. Useful for finding which text
+    components are slow to minify.
+    """
+
+    global factoring_stats_hook
+    factoring_stats_hook = hook
 
 
 def get_component_formatting(items: Iterable[FormattingItem]):
@@ -67,12 +76,40 @@ def get_cost(formatting_items: Iterable[FormattingItem]):
     return sum(item.cost for item in formatting_items)
 
 
-def factor_common_formatting(subcomponents: list[FlatTextComponent]):
+def factor_common_formatting(
+    subcomponents: list[FlatTextComponent],
+    # The maximum number of consecutive subcomponents to factor together. Longer lists
+    # are factored in separate windows of at most this many subcomponents.
+    max_range_length: int | None = None,
+    # The maximum number of formatting items to consider factoring into one new array.
+    # This shrinks the search but doesn't bound its run time, since every range of
+    # subcomponents is still searched.
+    max_combination_size: int | None = None,
+    # The number of seconds after which to stop searching for better factorings, instead
+    # giving each remaining subcomponent not covered by its parent its own array.
+    time_limit: float | None = None,
+    # The maximum number of factorings to memoize, after which the search for better
+    # factorings stops as if the `time_limit` ran out.
+    max_memo_entries: int | None = None,
+    # The `FactoringStats` to record the call's statistics in, if they're needed
+    # regardless of the `set_factoring_stats_hook` hook.
+    stats: FactoringStats | None = None,
+):
     """Wraps certain ranges of subcomponents into arrays, utilizing array inheritance to
     reduce redundant formatting in the wrapped subcomponents.
 
     ⚠️ Only for use in `minify`. May mutate the inputted subcomponents.
 
+    The optimal factoring takes time roughly cubic in the number of subcomponents and
+    exponential in the number of distinct formatting items, so long lists of
+    subcomponents may need `max_range_length`, `max_combination_size`, or `time_limit`
+    to trade some optimality for speed. Without them, the factoring is always optimal.
+    Similarly, `max_memo_entries` bounds the memory used to search.
+
+    ⚠️ Only `max_range_length` and `time_limit` bound the run time. `time_limit` is
+    checked before factoring each range, so it's only exceeded by the time taken to
+    give the rest of the subcomponents their own arrays.
+
     >>> factor_common_formatting(
     >>>     [
     >>>         {"text": "a", "color": "red"},
@@ -87,6 +124,24 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
     ]
     """
 
+    if max_range_length is not None and max_range_length < 1:
+        raise ValueError("The `max_range_length` must be at least 1")
+
+    if max_combination_size is not None and max_combination_size < 1:
+        raise ValueError("The `max_combination_size` must be at least 1")
+
+    if max_memo_entries is not None and max_memo_entries < 1:
+        raise ValueError("The `max_memo_entries` must be at least 1")
+
+    if stats is None:
+        stats = FactoringStats()
+
+    stats.subcomponents = len(subcomponents)
+    start_time = time.perf_counter()
+
+    # The `time.perf_counter` value after which to stop searching for better factorings.
+    deadline = None if time_limit is None else start_time + time_limit
+
     formattings: Final = [
         get_formatting_set(get_formatting(subcomponent))
         for subcomponent in subcomponents
@@ -111,7 +166,58 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
             )
         )
 
-    @cache
+    # A mapping from each parent formatting passed to `factor_and_get_cost` to a unique
+    # ID, so memo keys don't need to hold or hash whole `FormattingSet`s.
+    parent_ids: dict[FormattingSet, int] = {}
+    # A mapping from each memo key (see `factor_and_get_cost`) to its factoring, in the
+    # order they were memoized.
+    memo: dict[int, FactoredFormattings] = {}
+    # One more than the largest possible `start` or `end` index.
+    index_count = len(subcomponents) + 1
+
+    def memoize(key: int, factoring: FactoredFormattings):
+        if max_memo_entries is None or len(memo) < max_memo_entries:
+            memo[key] = factoring
+
+        return factoring
+
+    def is_search_limited():
+        """Checks whether the search for better factorings must stop."""
+
+        if stats.limited:
+            return True
+
+        if deadline is not None and time.perf_counter() > deadline:
+            stats.limited = stats.timed_out = True
+        elif max_memo_entries is not None and len(memo) >= max_memo_entries:
+            stats.limited = True
+
+        return stats.limited
+
+    def get_unfactored(
+        parent: FormattingSet,
+        start: int,
+        end: int,
+    ) -> FactoredFormattings:
+        """Gives each subcomponent in a range not covered by the parent its own array
+        without searching for common formatting, for when the search must stop.
+        """
+
+        value: FactoredFormattingList = []
+        cost = 0
+
+        for i in range(start, end):
+            if parent_covers_subcomponent(parent, i):
+                value.append(...)
+                continue
+
+            # Like a sublist of just this subcomponent, which needs no brackets.
+            sublist_formatting = formattings[i] - parent
+            value.append([sublist_formatting, ...])
+            cost += get_cost(sublist_formatting)
+
+        return FactoredFormattings(value=value, cost=cost)
+
     def factor_and_get_cost(
         parent: FormattingSet,
         # The index to start the range of `subcomponents` to factor.
@@ -119,7 +225,24 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
         # The index to end the range of `subcomponents` to factor.
         end: int,
     ) -> FactoredFormattings:
-        """Factors a range of the inputted `formattings` and gets its cost."""
+        """Factors a range of the inputted `formattings` and gets its cost, memoized."""
+
+        parent_id = parent_ids.get(parent)
+        if parent_id is None:
+            parent_id = parent_ids[parent] = len(parent_ids)
+
+        # Pack the parent ID and the range into one `int`.
+        key = (parent_id * index_count + start) * index_count + end
+
+        factoring = memo.get(key)
+        if factoring is not None:
+            stats.hits += 1
+            return factoring
+
+        stats.misses += 1
+
+        if is_search_limited():
+            return get_unfactored(parent, start, end)
 
         # The formattings which only inherit from the parent and precede the next
         # sublist.
@@ -140,7 +263,9 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
         if sublist_start == end:
             # All the formattings are the same as the parent, so no factoring needs to
             # be done.
-            return FactoredFormattings(value=formattings_covered_by_parent, cost=0)
+            return memoize(
+                key, FactoredFormattings(value=formattings_covered_by_parent, cost=0)
+            )
 
         best_cost = math.inf
         best_sublist_formatting: FormattingSet | None = None
@@ -187,7 +312,11 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
                 )
             }
 
-            for length in range(1, len(potential_items) + 1):
+            max_length = len(potential_items)
+            if max_combination_size is not None:
+                max_length = min(max_length, max_combination_size)
+
+            for length in range(1, max_length + 1):
                 combinations = itertools.combinations(potential_items, length)
                 for combination in combinations:
                     combination_keys: set[str] = set()
@@ -239,6 +368,10 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
         for sublist_end in range(sublist_start + 1, end + 1):
             sublist_length = sublist_end - sublist_start
 
+            if is_search_limited():
+                # Settle for the best factoring found so far, if there is one.
+                break
+
             if sublist_length == 1:
                 # If the sublist only has one element, it's unnecessary to compute and
                 # try all the `potential_formattings`.
@@ -271,6 +404,9 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
                 continue
 
             for new_parent in formattings_to_try:
+                if best_sublist_factoring is not None and is_search_limited():
+                    break
+
                 sublist_formatting = new_parent - parent
 
                 cost = get_cost(sublist_formatting) + remainder_factoring.cost
@@ -295,19 +431,24 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
                 best_sublist_factoring = sublist_factoring
                 best_remainder_factoring = remainder_factoring
 
-        if TYPE_CHECKING:
-            # The above loops must have ran for at least one iteration.
-            assert best_sublist_formatting is not None
-            assert best_sublist_factoring is not None
-            assert best_remainder_factoring is not None
-
-        return FactoredFormattings(
-            value=[
-                *formattings_covered_by_parent,
-                [best_sublist_formatting, *best_sublist_factoring.value],
-                *best_remainder_factoring.value,
-            ],
-            cost=best_cost,
+        if (
+            best_sublist_formatting is None
+            or best_sublist_factoring is None
+            or best_remainder_factoring is None
+        ):
+            # The search stopped before finding any factoring.
+            return get_unfactored(parent, start, end)
+
+        return memoize(
+            key,
+            FactoredFormattings(
+                value=[
+                    *formattings_covered_by_parent,
+                    [best_sublist_formatting, *best_sublist_factoring.value],
+                    *best_remainder_factoring.value,
+                ],
+                cost=best_cost,
+            ),
         )
 
     subcomponent_iterator = iter(subcomponents)
@@ -421,10 +562,28 @@ def factor_common_formatting(subcomponents: list[FlatTextComponent]):
 
         return output
 
-    return get_factored_component(
-        factor_and_get_cost(
-            parent=FormattingSet(),
-            start=0,
-            end=len(subcomponents),
-        ).value
-    )
+    window_length = len(subcomponents)
+    if max_range_length is not None:
+        window_length = max_range_length
+
+    factoring: FactoredFormattingList = []
+
+    for window_start in range(0, len(subcomponents), window_length):
+        # Nothing is inherited between windows since their parent is empty, so their
+        # factorings can simply be concatenated.
+        factoring.extend(
+            factor_and_get_cost(
+                parent=FormattingSet(),
+                start=window_start,
+                end=min(window_start + window_length, len(subcomponents)),
+            ).value
+        )
+
+    output = get_factored_component(factoring)
+
+    if factoring_stats_hook is not None:
+        stats.entries = len(memo)
+        stats.wall_time = time.perf_counter() - start_time
+        factoring_stats_hook(stats)
+
+    return output
@@ -1,105 +1,227 @@
-from collections.abc import Iterator
+from collections.abc import Generator, Iterable
+from typing import Literal
 
-from ..formatting import (
-    FORMATTING_KEYS,
-    WHITESPACE_AFFECTED_BY_KEYS,
-    is_affected_by_inheriting_from,
-)
+from ..formatting import WHITESPACE_UNAFFECTED_BY_KEYS, get_formatting
 from ..helpers import js_str
-from ..types import FlatTextComponent
+from ..interned_formatting import get_interned_formatting, intern_formatting
+from ..regex import LINE_BREAKS
+from ..types import FlatTextComponent, TextComponentDict
 
+# What a run's text consists of, which determines what formatting can affect it.
+TextKind = Literal["line_breaks", "whitespace", "other"]
 
-def merged(subcomponents: Iterator[FlatTextComponent]):
-    """Merges adjacent elements of the inputted subcomponents wherever possible.
+# A reduced subcomponent, its `text` as a `str` (or `None` if it has no `text`), and the
+# `TextKind` of its `text` (or `None` if it has no `text`).
+Run = tuple[FlatTextComponent, str | None, TextKind | None]
 
-    ⚠️ Only for use in `minify`. May mutate the inputted subcomponents.
+
+def get_text_kind(text: str) -> TextKind:
+    """Gets the `TextKind` of a non-empty string."""
+
+    if text.isspace():
+        if LINE_BREAKS.match(text):
+            return "line_breaks"
+
+        return "whitespace"
+
+    return "other"
+
+
+def get_joined_text_kind(kind: TextKind, other_kind: TextKind) -> TextKind:
+    """Gets the `TextKind` of two strings of the specified kinds joined together."""
+
+    if kind == other_kind:
+        return kind
+
+    if kind == "other" or other_kind == "other":
+        return "other"
+
+    return "whitespace"
+
+
+def is_plain_text_affected_by_inheriting(kind: TextKind, formatting_id: int):
+    """Checks whether inheriting an interned formatting would have a distinguishable
+    in-game effect on plain text of the specified `TextKind`. Equivalent to
+    `is_affected_by_inheriting`.
     """
 
+    if kind == "line_breaks":
+        # Nothing affects line breaks.
+        return False
+
+    interned_formatting = get_interned_formatting(formatting_id)
+
+    if kind == "whitespace":
+        return not interned_formatting.keys <= WHITESPACE_UNAFFECTED_BY_KEYS
+
+    return bool(interned_formatting.keys)
+
+
+def get_formatting_id(subcomponent: TextComponentDict):
+    return intern_formatting(get_formatting(subcomponent))
+
+
+def get_run(subcomponent: FlatTextComponent) -> Run:
+    """Classifies a reduced subcomponent's `text` as a `Run`."""
+
+    if isinstance(subcomponent, dict):
+        if "text" not in subcomponent:
+            return subcomponent, None, None
+
+        text = js_str(subcomponent["text"])
+
+    else:
+        text = js_str(subcomponent)
+
+    return subcomponent, text, get_text_kind(text)
+
+
+def merged_runs(runs: Iterable[Run]) -> Generator[FlatTextComponent, None, None]:
+    """Merges adjacent reduced runs wherever possible.
+
+    The `text`s of merged runs are collected and only joined once no more runs can be
+    merged into them, so merging many runs takes linear rather than quadratic time.
+
+    ⚠️ Only for use in `minify`. May mutate the inputted runs.
+    """
+
+    runs = iter(runs)
+
     try:
-        previous_subcomponent = next(subcomponents)
+        previous_run, previous_text, previous_kind = next(runs)
     except StopIteration:
         return
 
-    for subcomponent in subcomponents:
-        # Try to merge this subcomponent with the previous one.
+    # The `text`s to join into the previous run's `text`, or `None` if it has no
+    # `text`.
+    previous_texts = None if previous_text is None else [previous_text]
+    # The interned formatting ID of the previous run, or `None` if it hasn't been
+    # computed yet.
+    previous_formatting_id: int | None = None
 
-        # Whether this subcomponent was successfully merged with the previous one.
-        merged = False
+    def get_joined_run():
+        """Gets the previous run with its `text`s joined."""
 
-        if isinstance(subcomponent, dict):
-            if "text" in subcomponent:
-                # The subcomponent has `text` with distinguishable formatting. (We know
-                # the formatting is distinguishable because the previous step of the
-                # `minify` algorithm is `reduce`, which removes indistinguishable
-                # formatting.)
+        if previous_texts is None or len(previous_texts) == 1:
+            return previous_run
 
-                if isinstance(previous_subcomponent, dict):
-                    if "text" in previous_subcomponent:
-                        # Both this subcomponent and the previous one have `text` with
-                        # distinguishable formatting.
+        text = "".join(previous_texts)
+
+        if isinstance(previous_run, dict):
+            previous_run["text"] = text
+            return previous_run
+
+        return text
 
-                        text = js_str(subcomponent["text"])
-                        previous_text = js_str(previous_subcomponent["text"])
-                        text_is_whitespace = text.isspace()
-                        previous_text_is_whitespace = previous_text.isspace()
+    for run, text, kind in runs:
+        # Try to merge this run with the previous one.
 
-                        keys_which_must_equal = FORMATTING_KEYS
-                        if text_is_whitespace or previous_text_is_whitespace:
-                            keys_which_must_equal = WHITESPACE_AFFECTED_BY_KEYS
+        # Whether this run was successfully merged with the previous one.
+        merged = False
+        # The interned formatting ID of this run, or `None` if it hasn't been computed
+        # yet.
+        formatting_id: int | None = None
+
+        if isinstance(run, dict):
+            if text is not None and kind is not None:
+                # The run has `text` with distinguishable formatting. (We know the
+                # formatting is distinguishable because the runs are reduced, which
+                # removes indistinguishable formatting.)
+
+                if isinstance(previous_run, dict):
+                    if previous_texts is not None and previous_kind is not None:
+                        # Both this run and the previous one have `text` with
+                        # distinguishable formatting.
 
-                        if all(
-                            subcomponent.get(key) == previous_subcomponent.get(key)
-                            for key in keys_which_must_equal
-                        ):
+                        formatting_id = get_formatting_id(run)
+                        if previous_formatting_id is None:
+                            previous_formatting_id = get_formatting_id(previous_run)
+
+                        if kind != "other" or previous_kind != "other":
+                            # Only compare the formatting that affects whitespace.
+                            formattings_equal = (
+                                get_interned_formatting(
+                                    formatting_id
+                                ).whitespace_affecting_id
+                                == get_interned_formatting(
+                                    previous_formatting_id
+                                ).whitespace_affecting_id
+                            )
+                        else:
+                            formattings_equal = formatting_id == previous_formatting_id
+
+                        if formattings_equal:
                             # Merge their `text`s.
 
-                            if not text_is_whitespace:
-                                # The previous subcomponent might be whitespace, so
-                                # merging this subcomponent into it might cause some of
-                                # this subcomponent's formatting to be lost. Instead,
-                                # because this subcomponent isn't whitespace, merge the
-                                # previous subcomponent into this one.
-                                previous_subcomponent = subcomponent
+                            if kind == "other":
+                                # The previous run might be whitespace, so merging this
+                                # run into it might cause some of this run's formatting
+                                # to be lost. Instead, because this run isn't
+                                # whitespace, merge the previous run into this one.
+                                previous_run = run
+                                previous_formatting_id = formatting_id
 
-                            previous_subcomponent["text"] = previous_text + text
+                            previous_texts.append(text)
+                            previous_kind = get_joined_text_kind(previous_kind, kind)
                             merged = True
 
-                elif not is_affected_by_inheriting_from(
-                    previous_subcomponent, subcomponent
-                ):
-                    # This subcomponent has `text` with distinguishable properties, the
-                    # previous subcomponent is plain text, and they can be merged.
+                elif previous_texts is not None and previous_kind is not None:
+                    formatting_id = get_formatting_id(run)
 
-                    text = js_str(subcomponent["text"])
-                    previous_text = js_str(previous_subcomponent)
+                    if not is_plain_text_affected_by_inheriting(
+                        previous_kind, formatting_id
+                    ):
+                        # This run has `text` with distinguishable properties, the
+                        # previous run is plain text, and they can be merged.
 
-                    subcomponent["text"] = previous_text + text
-                    previous_subcomponent = subcomponent
-                    merged = True
+                        previous_run = run
+                        previous_formatting_id = formatting_id
+
+                        previous_texts.append(text)
+                        previous_kind = get_joined_text_kind(previous_kind, kind)
+                        merged = True
+
+        elif isinstance(previous_run, dict):
+            # This run is plain text, but the previous one is not.
 
-        elif isinstance(previous_subcomponent, dict):
-            # This subcomponent is plain text, but the previous one is not.
+            if previous_texts is not None and previous_kind is not None:
+                assert text is not None and kind is not None
 
-            if "text" in previous_subcomponent and not is_affected_by_inheriting_from(
-                subcomponent, previous_subcomponent
-            ):
-                text = js_str(subcomponent)
-                previous_text = js_str(previous_subcomponent["text"])
+                if previous_formatting_id is None:
+                    previous_formatting_id = get_formatting_id(previous_run)
 
-                previous_subcomponent["text"] = previous_text + text
-                merged = True
+                if not is_plain_text_affected_by_inheriting(
+                    kind, previous_formatting_id
+                ):
+                    previous_texts.append(text)
+                    previous_kind = get_joined_text_kind(previous_kind, kind)
+                    merged = True
 
         else:
-            # Both this subcomponent and the previous one are plain text.
+            # Both this run and the previous one are plain text.
 
-            text = js_str(subcomponent)
-            previous_text = js_str(previous_subcomponent)
+            assert previous_texts is not None and previous_kind is not None
+            assert text is not None and kind is not None
 
-            previous_subcomponent = previous_text + text
+            previous_texts.append(text)
+            previous_kind = get_joined_text_kind(previous_kind, kind)
             merged = True
 
         if not merged:
-            yield previous_subcomponent
-            previous_subcomponent = subcomponent
+            yield get_joined_run()
+
+            previous_run = run
+            previous_texts = None if text is None else [text]
+            previous_kind = kind
+            previous_formatting_id = formatting_id
+
+    yield get_joined_run()
+
+
+def merged(subcomponents: Iterable[FlatTextComponent]):
+    """Merges adjacent elements of the inputted reduced subcomponents wherever possible.
+
+    ⚠️ Only for use in `minify`. May mutate the inputted subcomponents.
+    """
 
-    yield previous_subcomponent
+    return merged_runs(get_run(subcomponent) for subcomponent in subcomponents)
@@ -1,20 +1,80 @@
-from ..flat import flat
+import json
+
+from ..compiled import CompiledComponent
+from ..helpers import json_str
 from ..types import TextComponent
-from .factor_common_formatting import factor_common_formatting
-from .merged import merged
-from .reduce import reduced
+from . import minify_cache
+from .factor_common_formatting import FactoringStats, factor_common_formatting
+from .normalized import normalized
 
 
-def minify(component: TextComponent) -> TextComponent:
+def minify(
+    component: TextComponent | CompiledComponent,
+    *,
+    max_range_length: int | None = None,
+    max_combination_size: int | None = None,
+    time_limit: float | None = None,
+    max_memo_entries: int | None = None,
+) -> TextComponent:
     """Transforms a text component to be as short and simplified as possible without
     changing its in-game appearance.
+
+    For text components with many differently formatted subcomponents, optimal
+    minification can be slow. Setting `max_range_length` or `time_limit` (in seconds)
+    bounds the search for common formatting to factor, at the cost of possibly longer
+    output, and `max_memo_entries` bounds the memory used to search.
+    `max_combination_size` shrinks the search without bounding its run time. See
+    `factor_common_formatting`.
+
+    ⚠️ Factoring recurses once per subcomponent in a range, so text components with
+    more than a few hundred subcomponents need a `max_range_length` to avoid exceeding
+    the recursion limit.
+
+    Results can be cached by enabling the cache with `set_minify_cache_size`.
     """
 
-    output = flat(component)
-    output = reduced(output)
-    output = merged(output)
+    if not minify_cache.minify_cache_enabled:
+        return minify_uncached(
+            component,
+            max_range_length=max_range_length,
+            max_combination_size=max_combination_size,
+            time_limit=time_limit,
+            max_memo_entries=max_memo_entries,
+        )
+
+    if isinstance(component, CompiledComponent):
+        component = component.to_component()
+
+    try:
+        result_json = minify_cache.cached_minify_json(
+            # Sort the keys so text components which only differ in the order of their
+            # keys share a result.
+            json_str(component, sort_keys=True),
+            max_range_length,
+            max_combination_size,
+            time_limit,
+            max_memo_entries,
+        )
+    except minify_cache.UncacheableMinifyResult as result:
+        result_json = result.result_json
+
+    # Every cache hit returns a new copy of the result parsed from JSON.
+    return json.loads(result_json)
+
+
+def minify_uncached(
+    component: TextComponent | CompiledComponent,
+    *,
+    max_range_length: int | None = None,
+    max_combination_size: int | None = None,
+    time_limit: float | None = None,
+    max_memo_entries: int | None = None,
+    # See `factor_common_formatting`.
+    stats: FactoringStats | None = None,
+) -> TextComponent:
+    """Same as `minify`, but never uses the cache."""
 
-    output = list(output)
+    output = list(normalized(component))
 
     if len(output) == 1:
         return output[0]
@@ -22,4 +82,11 @@ def minify(component: TextComponent) -> TextComponent:
     if len(output) == 0:
         return ""
 
-    return factor_common_formatting(output)
+    return factor_common_formatting(
+        output,
+        max_range_length=max_range_length,
+        max_combination_size=max_combination_size,
+        time_limit=time_limit,
+        max_memo_entries=max_memo_entries,
+        stats=stats,
+    )
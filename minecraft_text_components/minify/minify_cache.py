@@ -0,0 +1,110 @@
+import json
+from functools import lru_cache
+
+from ..helpers import json_str
+from .factor_common_formatting import FactoringStats
+
+
+def minify_json(
+    component_json: str,
+    max_range_length: int | None,
+    max_combination_size: int | None,
+    time_limit: float | None,
+    max_memo_entries: int | None,
+    # See `factor_common_formatting`.
+    stats: FactoringStats | None = None,
+) -> str:
+    """Minifies the JSON of a text component to the JSON of the result, so results can
+    be cached without callers being able to mutate them.
+    """
+
+    from .minify import minify_uncached
+
+    return json_str(
+        minify_uncached(
+            json.loads(component_json),
+            max_range_length=max_range_length,
+            max_combination_size=max_combination_size,
+            time_limit=time_limit,
+            max_memo_entries=max_memo_entries,
+            stats=stats,
+        )
+    )
+
+
+class UncacheableMinifyResult(Exception):
+    """Carries the JSON of a `minify` result out of `cached_minify_json` without it
+    being cached, since `lru_cache` doesn't cache exceptions.
+    """
+
+    result_json: str
+
+    def __init__(self, result_json: str):
+        super().__init__(result_json)
+
+        self.result_json = result_json
+
+
+def minify_json_if_deterministic(
+    component_json: str,
+    max_range_length: int | None,
+    max_combination_size: int | None,
+    time_limit: float | None,
+    max_memo_entries: int | None,
+) -> str:
+    """Same as `minify_json`, but raises an `UncacheableMinifyResult` if the
+    `time_limit` cut the search short, since the result then depends on how fast it
+    ran.
+    """
+
+    stats = FactoringStats()
+    result_json = minify_json(
+        component_json,
+        max_range_length,
+        max_combination_size,
+        time_limit,
+        max_memo_entries,
+        stats,
+    )
+
+    if stats.timed_out:
+        raise UncacheableMinifyResult(result_json)
+
+    return result_json
+
+
+# Whether `minify` results are cached. The cache is disabled by default.
+minify_cache_enabled = False
+
+cached_minify_json = lru_cache(maxsize=0)(minify_json_if_deterministic)
+
+
+def set_minify_cache_size(maxsize: int | None):
+    """Sets the maximum number of `minify` results to cache, clearing the cache. `None`
+    makes the cache unbounded, and `0` disables it (the default).
+
+    Cached results are keyed by the JSON of the inputted text component with sorted
+    keys, so it's only worth enabling when the same text components are minified
+    repeatedly, such as when `style`, `join`, `wrap`, and `center` are called on the
+    same text components. Results which the `time_limit` cut short aren't cached, since
+    they depend on how fast they ran.
+    """
+
+    global minify_cache_enabled, cached_minify_json
+
+    minify_cache_enabled = maxsize != 0
+    cached_minify_json = lru_cache(maxsize=maxsize)(minify_json_if_deterministic)
+
+
+def clear_minify_cache():
+    """Clears the cached `minify` results and resets the cache's statistics."""
+
+    cached_minify_json.cache_clear()
+
+
+def minify_cache_info():
+    """Gets the hits, misses, maximum size, and current size of the cache of `minify`
+    results.
+    """
+
+    return cached_minify_json.cache_info()
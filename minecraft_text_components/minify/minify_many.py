@@ -0,0 +1,111 @@
+import json
+import math
+import os
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from ..advances.advance_table import get_advance_table
+from ..compiled import CompiledComponent
+from ..helpers import json_str
+from ..types import TextComponent
+from ..whitespace import get_space_advance
+from .minify_cache import minify_json
+
+
+def initialize_worker():
+    """Loads the tables used to measure text ahead of time, so each worker only loads
+    them once rather than in the middle of its first task.
+    """
+
+    get_advance_table()
+    get_space_advance()
+
+
+def minify_many(
+    components: Iterable[TextComponent | CompiledComponent],
+    *,
+    # The number of threads or processes to minify in. Defaults to the number of CPUs.
+    # If 1, the text components are minified in the current thread.
+    workers: int | None = None,
+    # The number of text components to send to a worker at once. Defaults to a few
+    # chunks per worker.
+    chunksize: int | None = None,
+    # Whether to minify in processes rather than threads.
+    processes: bool = True,
+    max_range_length: int | None = None,
+    max_combination_size: int | None = None,
+    time_limit: float | None = None,
+    max_memo_entries: int | None = None,
+) -> list[TextComponent]:
+    """Minifies many independent text components, in parallel if `workers` isn't 1.
+
+    Returns the results in the same order as the inputted text components. Identical
+    text components are only minified once, but each result is a separate copy.
+
+    ⚠️ Fonts registered by `register_font` or `load_resource_pack_fonts` aren't
+    available to worker processes unless they're forked from the current process (the
+    default on Linux).
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("The number of `workers` must be at least 1")
+
+    # The JSON of each inputted text component.
+    component_jsons = [
+        json_str(
+            component.to_component()
+            if isinstance(component, CompiledComponent)
+            else component
+        )
+        for component in components
+    ]
+    # The JSON of each distinct inputted text component, in order of first appearance.
+    distinct_component_jsons = list(dict.fromkeys(component_jsons))
+
+    minify_json_with_options = partial(
+        minify_json,
+        max_range_length=max_range_length,
+        max_combination_size=max_combination_size,
+        time_limit=time_limit,
+        max_memo_entries=max_memo_entries,
+    )
+
+    if workers == 1 or len(distinct_component_jsons) <= 1:
+        minified_jsons = map(minify_json_with_options, distinct_component_jsons)
+    else:
+        if chunksize is None:
+            chunksize = math.ceil(len(distinct_component_jsons) / (workers * 4))
+
+        # Load the tables before starting any workers, so forked worker processes
+        # inherit them instead of loading them again.
+        initialize_worker()
+
+        executor: Executor = (
+            ProcessPoolExecutor(workers, initializer=initialize_worker)
+            if processes
+            else ThreadPoolExecutor(workers)
+        )
+
+        with executor:
+            minified_jsons = list(
+                executor.map(
+                    minify_json_with_options,
+                    distinct_component_jsons,
+                    chunksize=chunksize,
+                )
+            )
+
+    # A mapping from the JSON of each distinct inputted text component to the JSON of its
+    # minified text component.
+    minified_jsons_by_component_json = dict(
+        zip(distinct_component_jsons, minified_jsons)
+    )
+
+    return [
+        json.loads(minified_jsons_by_component_json[component_json])
+        for component_json in component_jsons
+    ]
@@ -0,0 +1,157 @@
+from collections.abc import Generator, Iterator
+from typing import cast
+
+from ..compiled import CompiledComponent
+from ..flat import inherit_formatting
+from ..formatting import WHITESPACE_UNAFFECTED_BY_KEYS
+from ..helpers import js_str
+from ..types import (
+    FlatTextComponent,
+    TextComponent,
+    TextComponentDict,
+    TextComponentFormatting,
+)
+from .merged import Run, get_text_kind, merged_runs
+
+
+def reduced_runs(
+    component: TextComponent | CompiledComponent,
+) -> Generator[Run, None, None]:
+    """Generates the runs of a text component flattened and reduced. Equivalent to
+    `reduced(flat(component))`, except each run's text is classified along the way, and
+    plain text that reduces to plain text is never built into a `dict`.
+
+    ⚠️ Only for use in `minify`.
+    """
+
+    from .minify import minify
+
+    def reduce_dict(run: TextComponentDict) -> Run | None:
+        """Reduces a flattened `dict`, returning `None` if it reduces to nothing."""
+
+        if "text" not in run:
+            if "with" in run:
+                # Recursively minify `with` values.
+                run["with"] = [minify(value) for value in run["with"]]
+
+            return run, None, None
+
+        if run["text"] == "":
+            return None
+
+        text = js_str(run["text"])
+        kind = get_text_kind(text)
+
+        if kind != "other":
+            for key in WHITESPACE_UNAFFECTED_BY_KEYS:
+                if key in run:
+                    del run[key]
+
+        # Check if the run's formatting has no effect on its `text`.
+        if len(run) == 1 or kind == "line_breaks":
+            # Reduce this run to plain text.
+            return run["text"], text, kind
+
+        return run, text, kind
+
+    # The same stack as in `flat`.
+    stack: list[
+        tuple[Iterator[TextComponent | CompiledComponent], TextComponentFormatting]
+    ] = [(iter((component,)), {})]
+
+    while stack:
+        subcomponents, formatting = stack[-1]
+
+        for subcomponent in subcomponents:
+            if isinstance(subcomponent, CompiledComponent):
+                for compiled_run in subcomponent.runs(formatting):
+                    if isinstance(compiled_run, dict):
+                        run = reduce_dict(compiled_run)
+                        if run is not None:
+                            yield run
+
+                    elif compiled_run != "":
+                        text = js_str(compiled_run)
+                        yield compiled_run, text, get_text_kind(text)
+
+                continue
+
+            if isinstance(subcomponent, list):
+                if subcomponent:
+                    stack.append(
+                        (
+                            iter(subcomponent),
+                            inherit_formatting(formatting, subcomponent),
+                        )
+                    )
+                    # Flatten the new top of the stack before continuing this one.
+                    break
+
+                continue
+
+            if isinstance(subcomponent, dict):
+                subcomponent_formatting = inherit_formatting(formatting, subcomponent)
+
+                flat_subcomponent = subcomponent.copy()
+                extra = flat_subcomponent.pop("extra", None)
+                flat_subcomponent.update(subcomponent_formatting)
+
+                run = reduce_dict(flat_subcomponent)  # type: ignore
+                if run is not None:
+                    yield run
+
+                if extra:
+                    stack.append((iter(extra), subcomponent_formatting))
+                    # Flatten the new top of the stack before continuing this one.
+                    break
+
+                continue
+
+            if subcomponent == "":
+                continue
+
+            text = js_str(subcomponent)
+            kind = get_text_kind(text)
+
+            if not formatting or kind == "line_breaks":
+                yield subcomponent, text, kind
+                continue
+
+            if kind == "whitespace":
+                if formatting.keys() <= WHITESPACE_UNAFFECTED_BY_KEYS:
+                    yield subcomponent, text, kind
+                    continue
+
+                yield cast(
+                    TextComponentDict,
+                    {
+                        "text": subcomponent,
+                        **{
+                            key: value
+                            for key, value in formatting.items()
+                            if key not in WHITESPACE_UNAFFECTED_BY_KEYS
+                        },
+                    },
+                ), text, kind
+                continue
+
+            yield cast(
+                TextComponentDict, {"text": subcomponent, **formatting}
+            ), text, kind
+
+        else:
+            # This list of subcomponents is exhausted.
+            stack.pop()
+
+
+def normalized(
+    component: TextComponent | CompiledComponent,
+) -> Generator[FlatTextComponent, None, None]:
+    """Flattens, reduces, and merges the runs of a text component in a single pass.
+    Equivalent to `merged(reduced(flat(component)))`, except each run's text is only
+    converted and classified once.
+
+    ⚠️ Only for use in `minify`.
+    """
+
+    return merged_runs(reduced_runs(component))
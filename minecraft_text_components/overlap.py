@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Final
 
@@ -8,15 +9,15 @@ from .join import join
 from .minify import minify
 from .split import split
 from .types import TextComponent
-from .whitespace import whitespace
+from .whitespace import get_valid_whitespace_advance, get_whitespace
 
 # The reason it's ` {2,}` instead of ` +` is because a single space in the middle of the
 # string is most likely just a normal space that should not be adjustable or allow
 # things to overlap it.
 OVERLAPPABLE_WHITESPACE_PATTERN = re.compile(r"(^ +| {2,}| +$)")
 
-# The maximum absolute value that `whitespace_offset` can be before additional overflow
-# correction attempts must be disallowed.
+# The maximum number of in-game pixels by which the whitespace in a line can be reduced
+# to stop the line overflowing the container.
 MAX_WHITESPACE_OFFSET = 4
 
 
@@ -65,14 +66,13 @@ def overlap(*components: TextComponent):
                     return
 
                 # The index in the `range_line` at which the new range containing the
-                # `range_value` should be inserted.
-                range_index = 0
-
-                for range in range_line:
-                    if range.start > range_start:
-                        break
-
-                    range_index += 1
+                # `range_value` should be inserted, after any ranges starting at the
+                # same position.
+                range_index = bisect_right(
+                    range_line,
+                    range_start,
+                    key=lambda component_range: component_range.start,
+                )
 
                 def raise_collision_error(conflicting_subcomponent: TextComponent):
                     raise ValueError(
@@ -96,12 +96,16 @@ def overlap(*components: TextComponent):
                     if range_end > next_range.start:
                         raise_collision_error(next_range.value)
 
-                range = TextComponentRange(range_start, range_end, range_value)
-                range_line.insert(range_index, range)
+                range_line.insert(
+                    range_index,
+                    TextComponentRange(range_start, range_end, range_value),
+                )
 
             # The `component_line` split into a list in which odd indexes have
             # whitespace-only segments and even indexes do not.
-            subcomponents = split(component_line, OVERLAPPABLE_WHITESPACE_PATTERN)
+            subcomponents = split(
+                component_line, OVERLAPPABLE_WHITESPACE_PATTERN, across_runs=True
+            )
 
             for i, subcomponent in enumerate(subcomponents):
                 subcomponent_advance = get_line_advance(subcomponent)
@@ -127,69 +131,63 @@ def overlap(*components: TextComponent):
 
             end_range()
 
-    output_lines: list[TextComponent] = []
-
-    for range_line in range_lines:
-        # The amount (always negative) of in-game pixels to add to the whitespace in
-        # order to avoid the line overflowing the container.
-        whitespace_offset = 0
-        # The amount that `output_line`'s advance exceeds the container width.
-        overflowing_advance = 0
-        # Each range's original `whitespace_advance` value without offsets.
-        initial_whitespace_advances: list[float] = []
-
-        while True:
-            # Attempt to construct the `output_line`.
-
-            output_line: list[TextComponent] = [""]
-            # The position in the line at which the previous range ended.
-            previous_range_end = 0
-            # The amount that whitespace advances still need to be offset in order to
-            # apply the full `whitespace_offset`.
-            whitespace_offset_remaining = whitespace_offset
-
-            for range_index, range in enumerate(range_line):
-                ideal_whitespace_advance = max(
-                    0, range.start - previous_range_end - whitespace_offset_remaining
-                )
-                whitespace_before_range = whitespace(ideal_whitespace_advance)
-
-                output_line.append(whitespace_before_range)
-                output_line.append(range.value)
-
-                range_width = range.end - range.start
-                whitespace_advance = get_line_advance(whitespace_before_range)
-                previous_range_end += whitespace_advance + range_width
-
-                if whitespace_offset == 0:
-                    initial_whitespace_advances.append(whitespace_advance)
-                elif whitespace_offset_remaining:
-                    initial_whitespace_advance = initial_whitespace_advances[
-                        range_index
-                    ]
-                    whitespace_offset_remaining = min(
-                        0,
-                        whitespace_offset_remaining
-                        + initial_whitespace_advance
-                        - whitespace_advance,
-                    )
+    return minify(
+        join("\n", (get_range_line(range_line) for range_line in range_lines))
+    )
+
+
+def get_range_line(range_line: list[TextComponentRange]) -> TextComponent:
+    """Gets a line of text component with whitespace before each of the sorted,
+    non-colliding ranges in a line placing it at its position, as closely as valid
+    whitespace advances allow.
+    """
+
+    # The advance of the whitespace before each range.
+    whitespace_advances: list[int] = []
+    # The position in the line at which the previous range ended.
+    previous_range_end = 0
+
+    for component_range in range_line:
+        whitespace_advance = get_valid_whitespace_advance(
+            max(0, component_range.start - previous_range_end)
+        )
+        whitespace_advances.append(whitespace_advance)
+
+        previous_range_end += (
+            whitespace_advance + component_range.end - component_range.start
+        )
+
+    # The amount that the line's advance exceeds the container width.
+    overflowing_advance = previous_range_end - container.width
+
+    if 0 < overflowing_advance <= MAX_WHITESPACE_OFFSET:
+        # The line overflows the container, so take the overflow out of the
+        # whitespace, starting from the end of the line so as few ranges as possible
+        # move.
+
+        for range_index in reversed(range(len(whitespace_advances))):
+            whitespace_advance = whitespace_advances[range_index]
+            reduced_whitespace_advance = get_valid_whitespace_advance(
+                max(0, whitespace_advance - overflowing_advance), "floor"
+            )
+
+            whitespace_advances[range_index] = reduced_whitespace_advance
+            overflowing_advance -= whitespace_advance - reduced_whitespace_advance
 
-            overflowing_advance = previous_range_end - container.width
             if overflowing_advance <= 0:
-                # The attempt was successful.
                 break
 
-            # The line overflows the container, so try again with more overflow
-            # correction.
-            whitespace_offset -= 0.5
+    output_line: list[TextComponent] = [""]
 
-            if abs(whitespace_offset) > MAX_WHITESPACE_OFFSET:
-                # No more attempts can be made, and the line still overflows.
-                raise ValueError(
-                    "The following text component cannot fit on one line:\n"
-                    + repr(minify(output_line))
-                )
+    for whitespace_advance, component_range in zip(whitespace_advances, range_line):
+        output_line.append(get_whitespace(whitespace_advance)[0])
+        output_line.append(component_range.value)
 
-        output_lines.append(output_line)
+    if overflowing_advance > 0:
+        # The line still overflows, and the whitespace can't be reduced any further.
+        raise ValueError(
+            "The following text component cannot fit on one line:\n"
+            + repr(minify(output_line))
+        )
 
-    return minify(join("\n", output_lines))
+    return output_line
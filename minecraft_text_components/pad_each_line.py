@@ -1,18 +1,19 @@
 from collections.abc import Callable
 
 from .advances import get_line_advance
+from .compiled import CompiledComponent
 from .container import container
 from .join import join
 from .split import split
 from .types import TextComponent
-from .whitespace import whitespace
+from .whitespace import get_whitespace
 from .wrap import wrap
 
 GetIdealPadding = Callable[[float], float]
 
 
 def pad_each_line(
-    component: TextComponent,
+    component: TextComponent | CompiledComponent,
     ideal_padding_advance: float | GetIdealPadding,
 ):
     """Adds whitespace before each line of a text component (counting lines caused by
@@ -39,11 +40,10 @@ def pad_each_line(
             )
 
         ideal_padding_advance = get_ideal_padding(advance)
-        padding = whitespace(ideal_padding_advance)
-        padding_advance = get_line_advance(padding)
+        padding, padding_advance = get_whitespace(ideal_padding_advance)
 
         if advance + padding_advance > container.width:
-            padding = whitespace(ideal_padding_advance, floor=True)
+            padding, _ = get_whitespace(ideal_padding_advance, "floor")
 
         return ["", padding, line]
 
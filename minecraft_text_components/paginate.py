@@ -0,0 +1,141 @@
+import re
+from collections.abc import Generator
+from typing import cast
+
+from .compiled import CompiledComponent
+from .container import container
+from .flat import flat
+from .helpers import js_str
+from .measured import MeasuredComponent
+from .minify import minify
+from .types import FlatTextComponent, TextComponent, TextComponentDict
+
+# The number of lines that fit on a page of a written book.
+BOOK_PAGE_LINES = 14
+
+# A character which ends the current page early when paginating.
+PAGE_BREAK = "\f"
+
+# Matches each line break or page break.
+BREAK_PATTERN = re.compile(r"[\n\f]")
+
+
+def get_run_with_text(run: FlatTextComponent, text: str) -> FlatTextComponent:
+    """Gets a new run with the formatting of the specified run but a different `text`."""
+
+    if isinstance(run, dict):
+        return cast(TextComponentDict, {**run, "text": text})
+
+    return text
+
+
+def paginate(
+    component: TextComponent | CompiledComponent,
+    *,
+    lines_per_page: int = BOOK_PAGE_LINES,
+    # The width of each page in in-game pixels. Defaults to the width of a written book.
+    width: float | None = None,
+) -> Generator[TextComponent, None, None]:
+    """Generates the pages of a written book containing a text component, each wrapped
+    and automatically minified. A `PAGE_BREAK` character in the text ends the current
+    page early.
+
+    The text component is read one line (up to each line break or page break) at a
+    time, and each page is generated as soon as it's filled, so only the current line
+    and page are ever held in memory rather than all of the wrapped text.
+
+    >>> list(paginate(["", "Chapter 1", PAGE_BREAK, "It was a dark and stormy night."]))
+    ["Chapter 1", "It was a dark and\\nstormy night."]
+    """
+
+    if lines_per_page < 1:
+        raise ValueError("The number of `lines_per_page` must be at least 1")
+
+    if width is None:
+        width = cast(float, container.book.width)
+
+    # The runs of the line being read, up to the next line break or page break.
+    line_runs: list[FlatTextComponent] = []
+    # The runs of each wrapped line on the page being filled.
+    page_lines: list[list[FlatTextComponent]] = []
+    # Whether the last page ended because it was full rather than at a page break, in
+    # which case a page break right after it shouldn't add an empty page.
+    last_page_filled = False
+
+    def end_page():
+        """Gets the page being filled as a text component, and then starts a new
+        page.
+        """
+
+        nonlocal page_lines
+
+        # Start with `""` to prevent unwanted inheritence.
+        output: list[TextComponent] = [""]
+
+        for i, line in enumerate(page_lines):
+            if i != 0:
+                output.append("\n")
+
+            output.extend(line)
+
+        page_lines = []
+
+        return minify(output)
+
+    def end_line() -> Generator[TextComponent, None, None]:
+        """Wraps the line being read onto the page being filled, generating each page
+        it fills.
+        """
+
+        nonlocal line_runs, last_page_filled
+
+        measured_line = MeasuredComponent(["", *line_runs])
+        line_runs = []
+
+        for start, end, _ in measured_line.line_ranges(width):
+            page_lines.append(measured_line.get_slice(start, end))
+            last_page_filled = False
+
+            if len(page_lines) == lines_per_page:
+                yield end_page()
+                last_page_filled = True
+
+    for run in flat(component):
+        if isinstance(run, dict):
+            if "text" not in run:
+                # This is measured along with the rest of the line, which raises an
+                # error.
+                line_runs.append(run)
+                continue
+
+            text = js_str(run["text"])
+
+        else:
+            text = js_str(run)
+
+        # The index in the `text` after the last break.
+        start = 0
+
+        for match in BREAK_PATTERN.finditer(text):
+            if match.start() != start:
+                line_runs.append(get_run_with_text(run, text[start : match.start()]))
+
+            yield from end_line()
+
+            if match.group() == PAGE_BREAK:
+                if page_lines or not last_page_filled:
+                    yield end_page()
+
+                last_page_filled = False
+
+            start = match.end()
+
+        if start == 0:
+            line_runs.append(run)
+        elif start != len(text):
+            line_runs.append(get_run_with_text(run, text[start:]))
+
+    yield from end_line()
+
+    if page_lines:
+        yield end_page()
@@ -1,7 +1,10 @@
+import re
+from bisect import bisect_right
 from collections.abc import Callable, Generator
 from re import Pattern
 from typing import cast, overload
 
+from .compiled import CompiledComponent
 from .flat import flat
 from .helpers import js_str
 from .types import (
@@ -15,6 +18,13 @@ UncallableSeparator = str | None | Pattern[str]
 CallableSeparator = Callable[[str], list[str]]
 Separator = UncallableSeparator | CallableSeparator
 
+# The index of a run in a list of runs, and the start and end indices of a slice of its
+# text.
+RunSlice = tuple[int, int, int]
+
+# Matches each substring that `str.split` with no separator splits text into.
+WHITESPACE_SEPARATED_PATTERN = re.compile(r"\S+")
+
 
 def split_text(
     component: TextComponentText,
@@ -44,29 +54,83 @@ def split_text(
 
 @overload
 def split(
-    component: TextComponent,
+    component: TextComponent | CompiledComponent,
     sep: UncallableSeparator = None,
     maxsplit: int = -1,
+    *,
+    across_runs: bool = False,
 ) -> Generator[TextComponent, None, None]: ...
 
 
 @overload
 def split(
-    component: TextComponent,
+    component: TextComponent | CompiledComponent,
     sep: CallableSeparator,
 ) -> Generator[TextComponent, None, None]: ...
 
 
 def split(
-    component: TextComponent,
+    component: TextComponent | CompiledComponent,
     sep: Separator = None,
     maxsplit: int = -1,
+    *,
+    # Whether to split the concatenated text of all the runs at once rather than each
+    # run separately, so separators can span runs with different formatting, and
+    # `maxsplit` counts splits over the whole text component rather than each run.
+    across_runs: bool = False,
 ) -> Generator[TextComponent, None, None]:
     """Generates the sequence of subcomponents split from a specified text component.
 
     Always yields at least one value.
+
+    >>> component = ["", "a ", {"text": " b", "bold": True}]
+    >>> list(split(component, re.compile(" {2,}")))
+    [["", "a ", {"text": " b", "bold": True}]]
+    >>> list(split(component, re.compile(" {2,}"), across_runs=True))
+    ["a", {"text": "b", "bold": True}]
     """
 
+    if across_runs:
+        if callable(sep):
+            raise ValueError("The `sep` can't be callable when splitting `across_runs`")
+
+        runs = list(flat(component))
+        # Each run's `text` as a `str`, or `None` if it has no `text`.
+        texts: list[str | None] = []
+
+        for run in runs:
+            if isinstance(run, dict):
+                texts.append(js_str(run["text"]) if "text" in run else None)
+            else:
+                texts.append(js_str(run))
+
+        for run_slices in split_runs_across(texts, sep, maxsplit):
+            subcomponent: list[FlatTextComponent] = []
+
+            for index, start, end in run_slices:
+                run = runs[index]
+                text = texts[index]
+
+                if text is None or (
+                    isinstance(run, dict) and start == 0 and end == len(text)
+                ):
+                    subcomponent.append(run)
+                elif isinstance(run, dict):
+                    subcomponent.append(
+                        cast(TextComponentDict, {**run, "text": text[start:end]})
+                    )
+                else:
+                    subcomponent.append(text[start:end])
+
+            if not subcomponent:
+                yield ""
+            elif len(subcomponent) == 1:
+                yield subcomponent[0]
+            else:
+                yield ["", *subcomponent]
+
+        return
+
     previous_subcomponent: TextComponent | None = None
 
     def append_to_previous_subcomponent(subcomponent: FlatTextComponent):
@@ -110,3 +174,288 @@ def split(
             previous_subcomponent = split_subcomponent_item
 
     yield previous_subcomponent or ""
+
+
+def split_text_spans(
+    text: str,
+    sep: UncallableSeparator = None,
+    maxsplit: int = -1,
+) -> list[tuple[int, int]]:
+    """Gets the start and end indices in the `text` of each substring that `split_text`
+    would split it into, without slicing it.
+    """
+
+    spans: list[tuple[int, int]] = []
+
+    if sep is None:
+        for match in WHITESPACE_SEPARATED_PATTERN.finditer(text):
+            if len(spans) == maxsplit:
+                # The last substring is the rest of the text after the whitespace.
+                spans.append((match.start(), len(text)))
+                break
+
+            spans.append(match.span())
+
+    elif isinstance(sep, Pattern):
+        # `str.split` has `maxsplit=-1`, but `re.split` has `maxsplit=0`.
+        pattern_maxsplit = 0 if maxsplit == -1 else maxsplit
+        # The index after the end of the previous match.
+        start = 0
+
+        for match_count, match in enumerate(sep.finditer(text)):
+            if pattern_maxsplit < 0 or match_count == pattern_maxsplit != 0:
+                break
+
+            spans.append((start, match.start()))
+
+            # Like `re.split`, include the text of each group in the pattern, with an
+            # empty substring for each group that didn't participate in the match.
+            for group in range(1, sep.groups + 1):
+                group_start, group_end = match.span(group)
+                spans.append(
+                    (match.end(), match.end())
+                    if group_start == -1
+                    else (group_start, group_end)
+                )
+
+            start = match.end()
+
+        spans.append((start, len(text)))
+
+    else:
+        start = 0
+
+        for substring in text.split(sep, maxsplit):
+            spans.append((start, start + len(substring)))
+            start += len(substring) + len(sep)
+
+    # Ensure an empty list is never returned.
+    return spans or [(0, 0)]
+
+
+def split_runs_across(
+    texts: list[str | None],
+    sep: UncallableSeparator = None,
+    maxsplit: int = -1,
+) -> list[list[RunSlice]]:
+    """Gets the `RunSlice`s in each subcomponent that the concatenated text of runs with
+    the specified texts splits into, running the separator over all of it at once.
+
+    The position of each run in the concatenated text is indexed by its prefix offset,
+    so each substring is mapped back to the runs it spans by bisecting. Runs without
+    `text` or with empty `text` are included in the first subcomponent that ends at or
+    after them, other than those of the pattern's groups, which is where splitting each
+    run separately places them too.
+    """
+
+    # The index of each run with non-empty text.
+    text_run_indices: list[int] = []
+    # The index in the concatenated text at which each run with non-empty text starts.
+    text_run_starts: list[int] = []
+    # The index in the concatenated text at which each run with non-empty text ends.
+    text_run_ends: list[int] = []
+    # The index in the concatenated text at which each run without `text` or with empty
+    # `text` is.
+    empty_runs: list[tuple[int, int]] = []
+
+    text_length = 0
+
+    for index, text in enumerate(texts):
+        if not text:
+            empty_runs.append((index, text_length))
+        else:
+            text_run_indices.append(index)
+            text_run_starts.append(text_length)
+            text_length += len(text)
+            text_run_ends.append(text_length)
+
+    concatenated_text = "".join(cast(str, texts[index]) for index in text_run_indices)
+    spans = split_text_spans(concatenated_text, sep, maxsplit)
+
+    subcomponents: list[list[RunSlice]] = []
+
+    for start, end in spans:
+        # The index in `text_run_indices` of the run containing `start`.
+        i = bisect_right(text_run_starts, start) - 1
+
+        if i == -1:
+            # There's no text.
+            subcomponents.append([])
+            continue
+
+        run_start = text_run_starts[i]
+
+        if end <= text_run_ends[i]:
+            # Most substrings are within a single run.
+            subcomponents.append(
+                [(text_run_indices[i], start - run_start, end - run_start)]
+            )
+            continue
+
+        run_slices: list[RunSlice] = [
+            (text_run_indices[i], start - run_start, text_run_ends[i] - run_start)
+        ]
+        i += 1
+
+        while i < len(text_run_indices) and text_run_starts[i] < end:
+            run_start = text_run_starts[i]
+            run_slices.append(
+                (
+                    text_run_indices[i],
+                    0,
+                    min(end, text_run_ends[i]) - run_start,
+                )
+            )
+            i += 1
+
+        subcomponents.append(run_slices)
+
+    # Each match of a pattern adds a subcomponent for each of the pattern's groups after
+    # the subcomponent before it, so only every this many subcomponents aren't a group's.
+    subcomponent_step = sep.groups + 1 if isinstance(sep, Pattern) else 1
+    # The index of the subcomponent that the next empty run is included in.
+    subcomponent_index = 0
+
+    for index, position in empty_runs:
+        while (
+            subcomponent_index < len(spans) - subcomponent_step
+            and spans[subcomponent_index][1] < position
+        ):
+            subcomponent_index += subcomponent_step
+
+        run_slices = subcomponents[subcomponent_index]
+        run_slices.append((index, 0, 0))
+        # Keep the runs in their original order.
+        run_slices.sort()
+
+    return subcomponents
+
+
+class ComponentSlice:
+    """Part of a `CompiledComponent` as slices of its runs, which can be inspected or
+    measured before being converted to a text component with `to_component`.
+
+    >>> line, _ = split_slices(["", {"text": "a\\nb", "color": "red"}], "\\n")
+    >>> line.run_slices
+    [(0, 0, 1)]
+    >>> line.to_component()
+    {"text": "a", "color": "red"}
+    """
+
+    __slots__ = ("compiled", "run_slices")
+
+    # The compiled component that this is a slice of.
+    compiled: CompiledComponent
+    # The slice of each run that this contains.
+    run_slices: list[RunSlice]
+
+    def __init__(self, compiled: CompiledComponent, run_slices: list[RunSlice]):
+        self.compiled = compiled
+        self.run_slices = run_slices
+
+    def __len__(self):
+        return len(self.run_slices)
+
+    def __repr__(self):
+        return f"ComponentSlice({repr(self.to_component())})"
+
+    def get_text(self) -> str:
+        """Gets the concatenated text of the slices, ignoring runs without `text`."""
+
+        texts = self.compiled.texts
+
+        return "".join(
+            (texts[index] or "")[start:end] for index, start, end in self.run_slices
+        )
+
+    def runs(self) -> Generator[FlatTextComponent, None, None]:
+        """Generates each slice of a run converted to a new `FlatTextComponent`."""
+
+        for index, start, end in self.run_slices:
+            yield self.compiled.get_run_slice(index, start, end)
+
+    def get_advance(self) -> float:
+        """Gets the width in in-game pixels that the slices take up, assuming they're a
+        single line. Only slices of part of a run's text are measured again.
+        """
+
+        from .advances.get_line_advance import get_text_line_advance
+
+        compiled = self.compiled
+        advance = 0
+
+        for index, start, end in self.run_slices:
+            text = compiled.texts[index]
+            run_advance = compiled.get_run_advance(index)
+
+            if text is None or run_advance is None:
+                raise ValueError(
+                    "It's impossible to determine the advance of the following text "
+                    f"component:\n{repr(compiled.get_run(index))}"
+                )
+
+            if start != 0 or end != len(text):
+                run_advance = get_text_line_advance(
+                    text[start:end], compiled.get_formatting(index)
+                )
+
+            advance += run_advance
+
+        return advance
+
+    def to_component(self) -> TextComponent:
+        """Converts the slices to a new `TextComponent`."""
+
+        if not self.run_slices:
+            return ""
+
+        if len(self.run_slices) == 1:
+            return self.compiled.get_run_slice(*self.run_slices[0])
+
+        # Start with `""` so no run inherits formatting from the first.
+        return ["", *self.runs()]
+
+
+def split_slices(
+    component: TextComponent | CompiledComponent,
+    sep: UncallableSeparator = None,
+    maxsplit: int = -1,
+    *,
+    # Whether to split the concatenated text of all the runs at once. See `split`.
+    across_runs: bool = False,
+) -> Generator[ComponentSlice, None, None]:
+    """Generates the same sequence of subcomponents as `split`, but as `ComponentSlice`s
+    of the compiled text component rather than new text components.
+
+    Always yields at least one value. Unlike `split`, callable separators aren't
+    supported, since they don't give the position of each substring.
+    """
+
+    compiled = (
+        component
+        if isinstance(component, CompiledComponent)
+        else CompiledComponent(component)
+    )
+
+    if across_runs:
+        for run_slices in split_runs_across(compiled.texts, sep, maxsplit):
+            yield ComponentSlice(compiled, run_slices)
+
+        return
+
+    run_slices: list[RunSlice] = []
+
+    for index, text in enumerate(compiled.texts):
+        if text is None:
+            # We can't split something without text.
+            run_slices.append((index, 0, 0))
+            continue
+
+        for i, (start, end) in enumerate(split_text_spans(text, sep, maxsplit)):
+            if i != 0:
+                yield ComponentSlice(compiled, run_slices)
+                run_slices = []
+
+            run_slices.append((index, start, end))
+
+    yield ComponentSlice(compiled, run_slices)
@@ -1,11 +1,12 @@
 from typing import Unpack
 
+from .compiled import CompiledComponent
 from .minify import minify
 from .types import TextComponent, TextComponentFormatting
 
 
 def style(
-    component: TextComponent,
+    component: TextComponent | CompiledComponent,
     **formatting: Unpack[TextComponentFormatting],
 ):
     """Makes the specified text component inherit the specified formatting,
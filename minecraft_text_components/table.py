@@ -0,0 +1,150 @@
+from collections.abc import Sequence
+from typing import Literal
+
+from .compiled import CompiledComponent
+from .container import container
+from .join import join
+from .measured import MeasuredComponent
+from .overlap import TextComponentRange, get_range_line
+from .types import TextComponent
+from .whitespace import get_space_advance, get_valid_whitespace_advance
+
+# How each line of a cell is aligned within its column.
+ColumnAlignment = Literal["left", "center", "right"]
+
+
+def table(
+    rows: Sequence[Sequence[TextComponent | CompiledComponent]],
+    *,
+    # The alignment of each column. Columns without one are left-aligned.
+    alignments: Sequence[ColumnAlignment] = (),
+    # The width in in-game pixels at which each column's cells wrap. Columns without
+    # one (or with `None`) wrap at the container width.
+    widths: Sequence[float | None] = (),
+    # Whether there should be whitespace to the left and right of all columns rather
+    # than only between columns.
+    spacing_around_columns: bool = True,
+) -> TextComponent:
+    """Places rows of text components into evenly spaced columns shared by every row,
+    automatically minified. Each row is as many lines tall as its tallest cell, and
+    each column is as wide as its widest line.
+
+    Every cell is measured once, and the whitespace placing each line of each cell at
+    its column's position is built directly, rather than padding each column and then
+    overlapping them like `columns` does.
+
+    ⚠️ The whole table is minified at once, so like `minify`, tables with more than a
+    few hundred formatted subcomponents can exceed the recursion limit.
+
+    >>> with container(60):
+    >>>     table([["a", "b"], ["ccc", "d"]], alignments=["left", "right"])
+    "   a      b\\n   ccc   d"
+    """
+
+    measured_rows = [[MeasuredComponent(cell) for cell in row] for row in rows]
+
+    column_count = max((len(row) for row in measured_rows), default=0)
+
+    # The `(start, end, advance)` of each line of each cell, where `start` and `end` are
+    # indices in the cell's `text`.
+    cell_lines: list[list[list[tuple[int, int, float]]]] = []
+
+    # The advance of the widest line in each column.
+    column_advances = [0.0] * column_count
+
+    for measured_row in measured_rows:
+        row_lines: list[list[tuple[int, int, float]]] = []
+
+        for column, measured_cell in enumerate(measured_row):
+            width = widths[column] if column < len(widths) else None
+
+            if width is None:
+                width = container.width
+
+            prefix_advances = measured_cell.prefix_advances
+            lines = [
+                (start, end, prefix_advances[end] - prefix_advances[start])
+                for start, end, _ in measured_cell.line_ranges(width)
+            ]
+            row_lines.append(lines)
+
+            column_advances[column] = max(
+                column_advances[column],
+                max(advance for _, _, advance in lines),
+            )
+
+        cell_lines.append(row_lines)
+
+    space_advance = get_space_advance()
+
+    # The amount of in-game pixels available for spacing in the container.
+    free_width = container.width - sum(column_advances)
+
+    # The amount of whitespace around or between each column.
+    column_spacing = free_width / (column_count + 1)
+
+    if column_spacing < space_advance:
+        # There isn't room to fit the spacing around columns, so try removing it.
+        spacing_around_columns = False
+
+    if not spacing_around_columns and column_count > 1:
+        column_spacing = free_width / (column_count - 1)
+
+    if column_spacing < space_advance and column_count > 1:
+        # There isn't room to fit any spacing between columns either.
+        raise ValueError("The specified columns are too wide to fit in the container.")
+
+    # Round to the nearest valid whitespace advance.
+    column_spacing = get_valid_whitespace_advance(max(column_spacing, 0))
+
+    # The position of the left edge of each column.
+    column_starts: list[float] = []
+    # The position at which the next column starts.
+    column_start = column_spacing if spacing_around_columns else 0
+
+    for column_advance in column_advances:
+        column_starts.append(column_start)
+        column_start += column_advance + column_spacing
+
+    output_lines: list[TextComponent] = []
+
+    for measured_row, row_lines in zip(measured_rows, cell_lines):
+        row_height = max((len(lines) for lines in row_lines), default=1)
+
+        for line_index in range(row_height):
+            range_line: list[TextComponentRange] = []
+
+            for column, (measured_cell, lines) in enumerate(
+                zip(measured_row, row_lines)
+            ):
+                if line_index >= len(lines):
+                    continue
+
+                start, end, advance = lines[line_index]
+
+                if advance == 0:
+                    # Leave empty lines empty rather than adding useless whitespace.
+                    continue
+
+                alignment = alignments[column] if column < len(alignments) else "left"
+                # The amount of free space in the column to the left of the line.
+                offset = column_advances[column] - advance
+
+                if alignment == "left":
+                    offset = 0
+                elif alignment == "center":
+                    offset /= 2
+
+                range_start = column_starts[column] + offset
+
+                range_line.append(
+                    TextComponentRange(
+                        range_start,
+                        range_start + advance,
+                        ["", *measured_cell.get_slice(start, end)],
+                    )
+                )
+
+            output_lines.append(get_range_line(range_line))
+
+    return join("\n", output_lines)
@@ -1,5 +1,6 @@
 import re
 
+from .compiled import CompiledComponent
 from .join import join
 from .split import split
 from .types import TextComponent
@@ -7,5 +8,7 @@ from .types import TextComponent
 NON_WHITESPACE_PATTERN = re.compile(r"(\S+)")
 
 
-def trim(component: TextComponent):
-    return join("", list(split(component, NON_WHITESPACE_PATTERN))[1:-1])
+def trim(component: TextComponent | CompiledComponent):
+    return join(
+        "", list(split(component, NON_WHITESPACE_PATTERN, across_runs=True))[1:-1]
+    )
@@ -1,40 +1,59 @@
 import math
+from dataclasses import dataclass
+from functools import cache
+from typing import Literal
 
 from .advances import get_char_advance
 from .types import TextComponent
 
-SPACE_ADVANCE = int(get_char_advance(" "))
+# How an advance that whitespace can't achieve exactly is rounded to one it can.
+# `"round"` rounds it down to a whole pixel and then to the nearest valid advance,
+# preferring the smaller one in a tie, and never rounds a positive advance to zero.
+WhitespaceRounding = Literal["floor", "ceil", "round"]
 
+# The default maximum advance in in-game pixels up to which whitespace is precomputed.
+DEFAULT_WHITESPACE_TABLE_MAX_ADVANCE = 512
 
-def whitespace(
-    advance: float,
-    # Whether to floor the inputted width to the nearest valid whitespace, rather than
-    # (roughly) round which is the default.
-    floor: bool = False,
-) -> TextComponent:
-    """Returns a text component of a combination of plain and bold spaces to achieve a
-    specified width in in-game pixels.
+whitespace_table_max_advance = DEFAULT_WHITESPACE_TABLE_MAX_ADVANCE
+
+
+@cache
+def get_space_advance():
+    """Gets the advance of a plain space in in-game pixels."""
+
+    return int(get_char_advance(" "))
+
+
+def __getattr__(name: str):
+    # `SPACE_ADVANCE` is computed on first access so that importing this module doesn't
+    # load the advance table.
+    if name == "SPACE_ADVANCE":
+        return get_space_advance()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def is_valid_whitespace_advance(advance: int):
+    """Checks whether a combination of plain and bold spaces has exactly the specified
+    advance in in-game pixels.
     """
 
-    # If the advance is small, then round up to the smallest valid advance, since the
-    # advance is most likely intended to be non-zero (unless `floor`).
-    if advance > 0 and advance < SPACE_ADVANCE:
-        advance = 0 if floor else SPACE_ADVANCE
+    # Each bold space is one pixel wider than a plain space, so the remainder is made
+    # up by swapping that many plain spaces for bold ones.
+    plain_spaces, bold_spaces = divmod(advance, get_space_advance())
 
-    advance = math.floor(advance)
+    return advance >= 0 and bold_spaces <= plain_spaces
+
+
+def build_whitespace(advance: int) -> TextComponent:
+    """Builds the text component of plain and bold spaces with the specified valid
+    advance in in-game pixels.
+    """
 
     if advance == 0:
         return ""
-    if advance == 6:
-        advance = 5
-    elif advance == 7:
-        advance = 5 if floor else 8
-    elif advance == 11:
-        advance = 10
-    elif advance < 0:
-        raise ValueError("The `whitespace` advance must not be negative")
 
-    plain_spaces, bold_spaces = divmod(advance, SPACE_ADVANCE)
+    plain_spaces, bold_spaces = divmod(advance, get_space_advance())
     plain_spaces -= bold_spaces
 
     component: TextComponent = []
@@ -44,10 +63,163 @@ def whitespace(
     if bold_spaces:
         component.append({"text": " " * bold_spaces, "bold": True})
 
-    if not component:
-        return ""
-
     if len(component) == 1:
         return component[0]
 
     return component
+
+
+def find_floor_whitespace_advance(advance: int):
+    """Finds the greatest valid whitespace advance not greater than a non-negative
+    whole advance, without the `WhitespaceTable`.
+    """
+
+    while not is_valid_whitespace_advance(advance):
+        advance -= 1
+
+    return advance
+
+
+def find_ceil_whitespace_advance(advance: int):
+    """Finds the least valid whitespace advance not less than a non-negative whole
+    advance, without the `WhitespaceTable`.
+    """
+
+    while not is_valid_whitespace_advance(advance):
+        advance += 1
+
+    return advance
+
+
+@dataclass(frozen=True)
+class WhitespaceTable:
+    # The greatest valid whitespace advance not greater than each whole advance up to
+    # the table's maximum.
+    floor_advances: list[int]
+    # The least valid whitespace advance not less than each whole advance up to the
+    # table's maximum.
+    ceil_advances: list[int]
+    # The minified whitespace for each whole advance up to the table's maximum, or
+    # `None` if it isn't a valid whitespace advance.
+    components: list[TextComponent | None]
+
+
+@cache
+def get_whitespace_table():
+    """Gets the `WhitespaceTable`, building it on first access so that importing this
+    module doesn't load the advance table.
+    """
+
+    advances = range(whitespace_table_max_advance + 1)
+
+    return WhitespaceTable(
+        floor_advances=[find_floor_whitespace_advance(advance) for advance in advances],
+        ceil_advances=[find_ceil_whitespace_advance(advance) for advance in advances],
+        components=[
+            build_whitespace(advance) if is_valid_whitespace_advance(advance) else None
+            for advance in advances
+        ],
+    )
+
+
+def set_whitespace_table_max_advance(max_advance: int):
+    """Sets the maximum advance in in-game pixels up to which whitespace is
+    precomputed, clearing the table. Whitespace beyond the maximum is still supported,
+    but it's built on every call.
+    """
+
+    global whitespace_table_max_advance
+
+    if max_advance < 0:
+        raise ValueError("The `max_advance` must not be negative")
+
+    whitespace_table_max_advance = max_advance
+    get_whitespace_table.cache_clear()
+
+
+def get_valid_whitespace_advance(
+    advance: float,
+    rounding: WhitespaceRounding = "round",
+) -> int:
+    """Gets the advance in in-game pixels of the whitespace nearest to a specified
+    advance, rounded as specified, without building it.
+
+    >>> get_valid_whitespace_advance(7)
+    8
+    >>> get_valid_whitespace_advance(7, "floor")
+    5
+    """
+
+    if advance < 0:
+        raise ValueError("The `whitespace` advance must not be negative")
+
+    table = get_whitespace_table()
+
+    if rounding == "ceil":
+        whole_advance = math.ceil(advance)
+    else:
+        whole_advance = math.floor(advance)
+
+    if whole_advance < len(table.floor_advances):
+        floor_advance = table.floor_advances[whole_advance]
+        ceil_advance = table.ceil_advances[whole_advance]
+    else:
+        floor_advance = find_floor_whitespace_advance(whole_advance)
+        ceil_advance = find_ceil_whitespace_advance(whole_advance)
+
+    if rounding == "floor":
+        return floor_advance
+
+    if rounding == "ceil":
+        return ceil_advance
+
+    if floor_advance == 0 and advance > 0:
+        # The advance is most likely intended to be non-zero, so round up to the
+        # smallest valid advance.
+        return get_space_advance()
+
+    if ceil_advance - whole_advance < whole_advance - floor_advance:
+        return ceil_advance
+
+    return floor_advance
+
+
+def get_whitespace(
+    advance: float,
+    rounding: WhitespaceRounding = "round",
+) -> tuple[TextComponent, int]:
+    """Gets a text component of a combination of plain and bold spaces with the
+    advance nearest to a specified advance in in-game pixels, rounded as specified,
+    along with the advance it actually has.
+
+    ⚠️ Whitespace up to the table's maximum advance is shared between calls, so the
+    returned text component must not be mutated.
+
+    >>> get_whitespace(13)
+    ["  ", {"text": " ", "bold": True}], 13
+    """
+
+    advance = get_valid_whitespace_advance(advance, rounding)
+    components = get_whitespace_table().components
+
+    if advance < len(components):
+        return components[advance] or "", advance
+
+    return build_whitespace(advance), advance
+
+
+def whitespace(
+    advance: float,
+    # Whether to floor the inputted width to the nearest valid whitespace, rather than
+    # (roughly) round which is the default.
+    floor: bool = False,
+) -> TextComponent:
+    """Returns a text component of a combination of plain and bold spaces to achieve a
+    specified width in in-game pixels.
+    """
+
+    # Build new whitespace rather than sharing it from the table, since the caller may
+    # mutate it.
+    return build_whitespace(
+        get_valid_whitespace_advance(advance, "floor" if floor else "round")
+    )
@@ -0,0 +1,89 @@
+"""Compares the wall time of `minify` against the length of its output for long lists
+of differently formatted subcomponents, like a colored scoreboard listing, with each
+option for bounding the search for common formatting.
+
+Run with `python scripts/benchmark_factor_common_formatting.py`.
+"""
+
+import copy
+import random
+import time
+from typing import Any
+
+from minecraft_text_components import minify
+from minecraft_text_components.helpers import json_str
+from minecraft_text_components.types import TextComponent
+
+COLORS = ["gold", "gray", "green", "red", "aqua"]
+NAMES = ["Alex", "Steve", "Notch", "Jeb", "Dinnerbone", "Grumm"]
+
+# Each option set's label and keyword arguments to `minify`.
+OPTIONS: list[tuple[str, dict[str, Any]]] = [
+    ("optimal", {}),
+    ("max_range_length=16", {"max_range_length": 16}),
+    ("max_range_length=64", {"max_range_length": 64}),
+    ("max_combination_size=1", {"max_combination_size": 1}),
+    (
+        "max_range_length=64, max_combination_size=2",
+        {"max_range_length": 64, "max_combination_size": 2},
+    ),
+    ("time_limit=0.5", {"time_limit": 0.5}),
+    (
+        "max_range_length=256, time_limit=0.5",
+        {"max_range_length": 256, "time_limit": 0.5},
+    ),
+    (
+        "max_range_length=256, max_memo_entries=10000",
+        {"max_range_length": 256, "max_memo_entries": 10_000},
+    ),
+]
+
+
+def get_scoreboard_component(runs: int) -> TextComponent:
+    random.seed(runs)
+
+    component: list[TextComponent] = [""]
+
+    while len(component) <= runs:
+        name_formatting: dict[str, Any] = {"color": random.choice(COLORS)}
+        if random.random() < 0.3:
+            name_formatting["bold"] = True
+        if random.random() < 0.2:
+            name_formatting["italic"] = True
+
+        component += [
+            {"text": random.choice(NAMES), **name_formatting},
+            {"text": ": ", "color": "gray"},
+            {"text": str(random.randrange(1000)), "color": random.choice(COLORS)},
+            "\n",
+        ]
+
+    return component
+
+
+def measure(component: TextComponent, options: dict[str, Any]):
+    # `minify` may mutate its input.
+    component = copy.deepcopy(component)
+
+    start = time.perf_counter()
+
+    try:
+        output = minify(component, **options)
+    except RecursionError:
+        return "RecursionError"
+
+    elapsed = time.perf_counter() - start
+
+    return f"{elapsed * 1000:9.1f} ms {len(json_str(output)):7} chars"
+
+
+for runs in (50, 100, 300, 1000):
+    component = get_scoreboard_component(runs)
+    print(f"{runs} runs ({len(json_str(component))} chars unminified)")
+
+    for label, options in OPTIONS:
+        if runs > 100 and not options:
+            # The optimal factoring recurses too deeply and takes too long.
+            continue
+
+        print(f"  {label}: {measure(component, options)}")
@@ -0,0 +1,113 @@
+"""Compares `flat` against the previous recursive implementation on deeply nested and
+wide text components, reporting wall time and peak traced memory allocation.
+
+Run with `python scripts/benchmark_flat.py`.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable, Generator, Iterable
+
+from minecraft_text_components import flat, get_formatting
+from minecraft_text_components.types import (
+    FlatTextComponent,
+    TextComponent,
+    TextComponentFormatting,
+)
+
+
+def recursive_flat(
+    component: TextComponent,
+    formatting: TextComponentFormatting | None = None,
+) -> Generator[FlatTextComponent, None, None]:
+    """The recursive implementation `flat` replaced."""
+
+    if formatting is None:
+        formatting = {}
+
+    formatting = formatting | get_formatting(component)
+
+    if isinstance(component, list):
+        if component:
+            for subcomponent in component:
+                yield from recursive_flat(subcomponent, formatting)
+
+        return
+
+    if isinstance(component, dict):
+        component_without_extra = component.copy()
+        extra = component_without_extra.pop("extra", None)
+
+        yield component_without_extra | formatting  # type: ignore
+
+        if extra:
+            for subcomponent in extra:
+                yield from recursive_flat(subcomponent, formatting)
+
+        return
+
+    if component == "":
+        return
+
+    if formatting:
+        yield {"text": component, **formatting}
+        return
+
+    yield component
+
+
+def get_nested_component(depth: int) -> TextComponent:
+    """Gets a text component nested in alternating lists and `extra`s, like generated
+    templates produce.
+    """
+
+    component: TextComponent = "leaf"
+
+    for i in range(depth):
+        if i % 2:
+            component = ["", component, "text"]
+        else:
+            component = {"text": "a", "extra": [component, "b"]}
+            if i % 6 == 0:
+                component["color"] = "red"
+
+    return component
+
+
+def get_wide_component(width: int) -> TextComponent:
+    return [
+        "",
+        *(
+            {"text": f"item {i}", "color": "gold"} if i % 3 else f"item {i}"
+            for i in range(width)
+        ),
+    ]
+
+
+def measure(
+    implementation: Callable[[TextComponent], Iterable[FlatTextComponent]],
+    component: TextComponent,
+):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        for _ in implementation(component):
+            pass
+    except RecursionError:
+        return "RecursionError"
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return f"{elapsed * 1000:9.2f} ms {peak / 1024:10.1f} KiB peak"
+
+
+for name, component in [
+    *((f"depth {depth}", get_nested_component(depth)) for depth in (100, 1000, 5000)),
+    *((f"width {width}", get_wide_component(width)) for width in (1000, 100_000)),
+]:
+    print(name)
+    print(f"  recursive: {measure(recursive_flat, component)}")
+    print(f"  iterative: {measure(flat, component)}")
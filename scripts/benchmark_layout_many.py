@@ -0,0 +1,55 @@
+"""Measures how the throughput of `layout_many` wrapping and centering text components
+for chat, books, and signs scales with the number of threads.
+
+Threads only speed up laying out text on free-threaded builds of CPython, so with the
+GIL, the throughput should stay roughly the same as the number of threads grows.
+
+Run with `python scripts/benchmark_layout_many.py`.
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+
+from minecraft_text_components import center, container, layout_many, wrap
+from minecraft_text_components.compiled import CompiledComponent
+from minecraft_text_components.types import TextComponent
+
+TEXT = (
+    "Place the machine on a flat surface and connect it to a power source before "
+    "loading any items into it."
+)
+
+COMPONENT_COUNT = 400
+
+COMPONENTS: list[TextComponent] = [
+    ["", {"text": f"Tip {i + 1}: ", "bold": True, "color": "gold"}, TEXT]
+    for i in range(COMPONENT_COUNT)
+]
+
+WIDTHS = [
+    [container.chat.width, container.book.width, container.sign.width][i % 3]
+    for i in range(COMPONENT_COUNT)
+]
+
+
+def measure(layout: Callable[[TextComponent | CompiledComponent], TextComponent]):
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        layout_many(layout, COMPONENTS, WIDTHS, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"  {workers} threads: {elapsed * 1000:9.2f} ms "
+            f"{COMPONENT_COUNT / elapsed:9.0f} components/s"
+        )
+
+
+gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+print(f"{os.cpu_count()} CPUs, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+print("wrap")
+measure(wrap)
+print("center")
+measure(center)
@@ -0,0 +1,72 @@
+"""Measures how the time `merged` takes to merge text components made of one run per
+character grows with their length, like `wrap` output and generated gradients produce.
+
+Merging should take linear time, so the time per character should stay roughly the
+same as the length grows.
+
+Run with `python scripts/benchmark_merged.py`.
+"""
+
+import copy
+import time
+from collections.abc import Callable
+
+from minecraft_text_components import flat
+from minecraft_text_components.minify.merged import merged
+from minecraft_text_components.minify.normalized import normalized
+from minecraft_text_components.minify.reduce import reduced
+from minecraft_text_components.types import FlatTextComponent, TextComponent
+
+TEXT = "The quick brown fox jumps over the lazy dog. "
+
+
+def get_per_character_component(length: int, formatted: bool) -> TextComponent:
+    """Gets a text component with a run for each character, all with the same
+    formatting if `formatted`.
+    """
+
+    return [
+        "",
+        *(
+            (
+                {"text": TEXT[i % len(TEXT)], "color": "gold"}
+                if formatted
+                else TEXT[i % len(TEXT)]
+            )
+            for i in range(length)
+        ),
+    ]
+
+
+def measure(
+    implementation: Callable[[TextComponent], list[FlatTextComponent]],
+    component: TextComponent,
+    length: int,
+):
+    # The implementations may mutate their input.
+    component = copy.deepcopy(component)
+
+    start = time.perf_counter()
+    output = implementation(component)
+    elapsed = time.perf_counter() - start
+
+    assert len(output) == 1
+
+    return f"{elapsed * 1000:9.2f} ms {elapsed / length * 1e9:8.1f} ns per character"
+
+
+for formatted in (False, True):
+    print("formatted runs" if formatted else "plain runs")
+
+    for length in (10_000, 30_000, 100_000):
+        component = get_per_character_component(length, formatted)
+
+        print(f"  {length} characters")
+        print(
+            "    merged(reduced(flat(...))): "
+            + measure(lambda c: list(merged(reduced(flat(c)))), component, length)
+        )
+        print(
+            "    normalized(...):            "
+            + measure(lambda c: list(normalized(c)), component, length)
+        )
@@ -0,0 +1,51 @@
+"""Measures how long `overlap` and `columns` take on menus with many ranges per line.
+
+Run with `python scripts/benchmark_overlap.py`.
+"""
+
+import time
+from collections.abc import Callable
+
+from minecraft_text_components import columns, container, overlap
+from minecraft_text_components.types import TextComponent
+
+
+def get_column(line_count: int, column: int) -> TextComponent:
+    """Gets a text component with the specified number of lines of short labels."""
+
+    return "\n".join(f"Item {column}.{line}" for line in range(line_count))
+
+
+def get_sparse_layer(range_count: int, offset: int) -> TextComponent:
+    """Gets a single line of text component with many single-character ranges spaced
+    far enough apart for another layer with a different `offset` to fit between them.
+    """
+
+    return " " * offset + "        ".join("x" for _ in range(range_count))
+
+
+def measure(function: Callable[[], TextComponent]):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    return f"{elapsed * 1000:9.2f} ms"
+
+
+with container.chat:
+    for column_count in (2, 4):
+        components = [get_column(20, column) for column in range(column_count)]
+
+        print(
+            f"columns, {column_count} columns of 20 lines: "
+            + measure(lambda: columns(*components))
+        )
+
+with container(100_000):
+    for range_count in (50, 200):
+        layers = [get_sparse_layer(range_count, offset) for offset in (0, 5)]
+
+        print(
+            f"overlap, 2 layers of {range_count} ranges:  "
+            + measure(lambda: overlap(*layers))
+        )
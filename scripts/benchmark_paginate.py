@@ -0,0 +1,80 @@
+"""Compares `paginate` against wrapping a whole manual with `wrap` and slicing its lines
+into pages by hand, reporting wall time, peak traced memory allocation, and the number
+of pages.
+
+Run with `python scripts/benchmark_paginate.py`.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+
+from minecraft_text_components import (
+    BOOK_PAGE_LINES,
+    PAGE_BREAK,
+    container,
+    join,
+    paginate,
+    split,
+    wrap,
+)
+from minecraft_text_components.types import TextComponent
+
+PARAGRAPH = (
+    "Place the machine on a flat surface and connect it to a power source before "
+    "loading any items into it. "
+)
+
+
+def get_manual(chapter_count: int) -> TextComponent:
+    """Gets a text component with the specified number of chapters, each starting on a
+    new page.
+    """
+
+    component: list[TextComponent] = [""]
+
+    for chapter in range(chapter_count):
+        component.append({"text": f"Chapter {chapter + 1}\n\n", "bold": True})
+        component.extend(PARAGRAPH * 3 + "\n" for _ in range(6))
+        component.append(PAGE_BREAK)
+
+    return component
+
+
+def wrap_and_slice(component: TextComponent):
+    """Paginates a text component by wrapping each chapter whole, and then splitting it
+    into lines and slicing the lines into pages.
+    """
+
+    for chapter in split(component, PAGE_BREAK):
+        with container.book:
+            lines = list(split(wrap(chapter), "\n"))
+
+        for i in range(0, len(lines), BOOK_PAGE_LINES):
+            yield join("\n", lines[i : i + BOOK_PAGE_LINES])
+
+
+def measure(
+    implementation: Callable[[TextComponent], Iterable[TextComponent]],
+    component: TextComponent,
+):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        # Only count the pages, so they aren't all held in memory.
+        page_count = sum(1 for _ in implementation(component))
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return f"{elapsed * 1000:9.2f} ms {peak / 1024:10.1f} KiB peak {page_count:5} pages"
+
+
+for chapter_count in (10, 50):
+    manual = get_manual(chapter_count)
+
+    print(f"{chapter_count} chapters")
+    print(f"  wrap and slice: {measure(wrap_and_slice, manual)}")
+    print(f"  paginate:       {measure(paginate, manual)}")
@@ -0,0 +1,67 @@
+"""Times splitting text components made of many short runs on a pattern with `split`
+applying the pattern to each run separately and with `across_runs` applying it once to
+the concatenated text, and reports how many subcomponents each splits into.
+
+The two split into different subcomponents, since `across_runs` lets separators span
+runs, so the times aren't of equivalent work and neither is expected to be faster.
+
+Run with `python scripts/benchmark_split_across_runs.py`.
+"""
+
+import re
+import timeit
+
+from minecraft_text_components import split
+from minecraft_text_components.types import TextComponent
+
+# Matches whitespace that can be overlapped, like in `overlap`.
+OVERLAPPABLE_WHITESPACE_PATTERN = re.compile(r"(^ +| {2,}| +$)")
+
+
+def get_component(run_count: int) -> TextComponent:
+    """Gets a single line of text component with the specified number of runs of
+    alternating formatting, where the runs often start or end with spaces.
+    """
+
+    return [
+        "",
+        *(
+            {"text": f" {run} ", "color": "gold"} if run % 2 else f"word{run}  "
+            for run in range(run_count)
+        ),
+    ]
+
+
+for run_count in (100, 1000, 10_000):
+    component = get_component(run_count)
+
+    print(f"{run_count} runs")
+
+    for across_runs in (False, True):
+        subcomponent_count = len(
+            list(
+                split(
+                    component,
+                    OVERLAPPABLE_WHITESPACE_PATTERN,
+                    across_runs=across_runs,
+                )
+            )
+        )
+        elapsed = min(
+            timeit.repeat(
+                lambda: list(
+                    split(
+                        component,
+                        OVERLAPPABLE_WHITESPACE_PATTERN,
+                        across_runs=across_runs,
+                    )
+                ),
+                number=1,
+                repeat=5,
+            )
+        )
+
+        print(
+            f"  across_runs={across_runs!s:5}: {elapsed * 1000:9.2f} ms "
+            f"{subcomponent_count:6} subcomponents"
+        )
@@ -0,0 +1,68 @@
+"""Compares splitting a large text component into lines with `split` against
+`split_slices`, reporting wall time and peak traced memory allocation, both for only
+splitting and for also converting every line back to a text component. The lines are
+kept in a list, as they would be by a caller laying them out.
+
+Run with `python scripts/benchmark_split_slices.py`.
+"""
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+from minecraft_text_components import CompiledComponent, split, split_slices
+from minecraft_text_components.types import TextComponent
+
+
+def get_component(line_count: int) -> TextComponent:
+    """Gets a text component with the specified number of lines, where each run
+    contains several lines with the same formatting.
+    """
+
+    return [
+        "",
+        *(
+            {
+                "text": "".join(f"Entry {run}.{line}\n" for line in range(10)),
+                "color": "gold" if run % 2 else "aqua",
+                "hoverEvent": {"action": "show_text", "contents": f"Entry {run}"},
+            }
+            for run in range(line_count // 10)
+        ),
+    ]
+
+
+def measure(function: Callable[[], object]):
+    # The fastest of several runs, since the garbage collector makes single runs noisy.
+    elapsed = min(timeit.repeat(function, number=1, repeat=5))
+
+    # Trace memory in a separate run, since tracing slows down allocations.
+    tracemalloc.start()
+
+    try:
+        function()
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return f"{elapsed * 1000:9.2f} ms {peak / 1024:10.1f} KiB peak"
+
+
+for line_count in (1000, 10_000):
+    component = get_component(line_count)
+    compiled = CompiledComponent(component)
+
+    print(f"{line_count} lines")
+    print(
+        "  split:                      " + measure(lambda: list(split(compiled, "\n")))
+    )
+    print(
+        "  split_slices:               "
+        + measure(lambda: list(split_slices(compiled, "\n")))
+    )
+    print(
+        "  split_slices, to_component: "
+        + measure(
+            lambda: [line.to_component() for line in split_slices(compiled, "\n")]
+        )
+    )
@@ -0,0 +1,48 @@
+"""Compares building a leaderboard menu with a `table` call against a `columns` call per
+row joined with line breaks.
+
+Run with `python scripts/benchmark_table.py`.
+"""
+
+import time
+from collections.abc import Callable
+
+from minecraft_text_components import columns, container, join, table
+from minecraft_text_components.types import TextComponent
+
+
+def get_rows(row_count: int) -> list[list[TextComponent]]:
+    """Gets the rows of a leaderboard with four formatted columns."""
+
+    return [
+        [
+            {"text": f"#{row + 1}", "color": "gold"},
+            f"Player{row * 37 % 1000}",
+            {"text": str(row * 1234 % 99991), "bold": True},
+            {"text": "View", "color": "green", "underlined": True},
+        ]
+        for row in range(row_count)
+    ]
+
+
+def measure(function: Callable[[], TextComponent]):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    return f"{elapsed * 1000:9.2f} ms"
+
+
+with container.chat:
+    for row_count in (10, 50, 100):
+        rows = get_rows(row_count)
+
+        print(f"{row_count} rows of 4 columns")
+        print(
+            "  columns per row: "
+            + measure(lambda: join("\n", (columns(*row) for row in rows)))
+        )
+        print(
+            "  table:           "
+            + measure(lambda: table(rows, alignments=["right", "left", "right"]))
+        )
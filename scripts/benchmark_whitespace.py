@@ -0,0 +1,50 @@
+"""Compares building whitespace with `whitespace` and measuring it with
+`get_line_advance` against looking it up along with its advance with `get_whitespace`,
+and measures how long `center` takes on a menu with many lines.
+
+Run with `python scripts/benchmark_whitespace.py`.
+"""
+
+import time
+from collections.abc import Callable
+
+from minecraft_text_components import (
+    center,
+    container,
+    get_line_advance,
+    get_whitespace,
+    whitespace,
+)
+
+# Every advance in quarter pixels up to the width of the chat.
+ADVANCES = [advance / 4 for advance in range(320 * 4)]
+
+
+def build_and_measure():
+    for advance in ADVANCES:
+        get_line_advance(whitespace(advance))
+
+
+def look_up():
+    for advance in ADVANCES:
+        get_whitespace(advance)
+
+
+def measure(function: Callable[[], object]):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+
+    return f"{elapsed * 1000:9.2f} ms"
+
+
+# Build the table before timing, so only lookups are measured.
+get_whitespace(0)
+
+print(f"whitespace and get_line_advance: {measure(build_and_measure)}")
+print(f"get_whitespace:                  {measure(look_up)}")
+
+menu = "\n".join(f"Option {line}: {'=' * (line % 30)}" for line in range(200))
+
+with container.chat:
+    print(f"center, 200 lines:               {measure(lambda: center(menu))}")
@@ -0,0 +1,135 @@
+"""Compares `wrap` against the previous per-character implementation on book pages of
+mixed plain and formatted text, reporting wall time, peak traced memory allocation, and
+the number of lines.
+
+Run with `python scripts/benchmark_wrap.py`.
+"""
+
+import re
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from minecraft_text_components import container, get_line_advance, minify, split, wrap
+from minecraft_text_components.types import TextComponent
+
+SPACES_PATTERN = re.compile(r"( )")
+
+WORDS = "the quick brown fox jumps over a lazy dog while it sleeps".split()
+
+
+def per_character_wrap(component: TextComponent):
+    """The implementation `wrap` replaced, which split every word into one-character
+    components and measured each separately.
+    """
+
+    output: list[TextComponent] = []
+    output_line: list[TextComponent] = []
+    output_word: list[TextComponent] = [""]
+    output_line_advance = 0
+    output_word_advance = 0
+
+    def end_line():
+        nonlocal output_line, output_line_advance
+
+        if output:
+            output.append("\n")
+        output.append(output_line)
+
+        output_line = []
+        output_line_advance = 0
+
+    def end_word(word_sep: TextComponent | None = None):
+        nonlocal output_word, output_word_advance
+
+        if word_sep is not None and output_line:
+            output_line.append(word_sep)
+        output_line.append(output_word)
+
+        output_word = [""]
+        output_word_advance = 0
+
+    for line in split(component, "\n"):
+        words_and_spaces = split(line, SPACES_PATTERN)
+
+        space: TextComponent | None = None
+        for i, word_or_space in enumerate(words_and_spaces):
+            if i % 2 == 0:
+                for char in split(word_or_space, lambda value: ["", *value]):
+                    char_advance = get_line_advance(char)
+                    output_word_advance += char_advance
+                    if output_word_advance > container.width:
+                        end_word()
+                        end_line()
+                        output_line_advance = output_word_advance = char_advance
+
+                    else:
+                        output_line_advance += char_advance
+                        if output_line_advance > container.width:
+                            end_line()
+                            output_line_advance = output_word_advance
+
+                    output_word.append(char)
+
+                end_word(word_sep=space)
+
+            else:
+                space = word_or_space
+
+                output_line_advance += get_line_advance(space)
+
+        end_line()
+
+    return minify(output)
+
+
+def get_page(length: int) -> TextComponent:
+    """Gets a text component of roughly the specified number of characters, with every
+    few words formatted differently.
+    """
+
+    component: list[TextComponent] = [""]
+    component_length = 0
+    i = 0
+
+    while component_length < length:
+        word = WORDS[i % len(WORDS)] + " "
+
+        if i % 7 == 3:
+            component.append({"text": word, "bold": True})
+        elif i % 5 == 1:
+            component.append({"text": word, "color": "gold"})
+        else:
+            component.append(word)
+
+        component_length += len(word)
+        i += 1
+
+    return component
+
+
+def measure(
+    implementation: Callable[[TextComponent], TextComponent], page: TextComponent
+):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        output = implementation(page)
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    lines = len(list(split(output, "\n")))
+
+    return f"{elapsed * 1000:9.2f} ms {peak / 1024:10.1f} KiB peak {lines:5} lines"
+
+
+with container.book:
+    for length in (2000, 10_000):
+        page = get_page(length)
+
+        print(f"{length} characters")
+        print(f"  per-character: {measure(per_character_wrap, page)}")
+        print(f"  prefix sums:   {measure(wrap, page)}")
@@ -0,0 +1,45 @@
+"""Compares wrapping a text component for many container widths with a `wrap` call per
+width against a single `wrap_widths` call, and reports the minimum width that fits the
+text component in each number of lines.
+
+Run with `python scripts/benchmark_wrap_widths.py`.
+"""
+
+import time
+
+from minecraft_text_components import MeasuredComponent, container, wrap, wrap_widths
+from minecraft_text_components.types import TextComponent
+
+WIDTHS = [
+    container.chat.width,
+    container.book.width,
+    container.sign.width,
+    *range(90, 321, 5),
+]
+
+COMPONENT: TextComponent = [
+    "",
+    {"text": "Settings", "bold": True, "color": "gold"},
+    " — Choose which notifications to show in chat, how often to show them, and "
+    "whether to play a sound. ",
+    {"text": "Click here", "underlined": True, "color": "aqua"},
+    " to reset every option to its default value.",
+]
+
+
+start = time.perf_counter()
+for width in WIDTHS:
+    with container(width):
+        wrap(COMPONENT)
+print(f"wrap per width: {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+start = time.perf_counter()
+wrap_widths(COMPONENT, WIDTHS)
+print(f"wrap_widths:    {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+measured_component = MeasuredComponent(COMPONENT)
+for line_count in range(1, 7):
+    print(
+        f"minimum width for {line_count} lines: "
+        f"{measured_component.get_min_width(line_count)}"
+    )
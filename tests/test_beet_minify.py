@@ -0,0 +1,42 @@
+from typing import Any
+
+import pytest
+
+pytest.importorskip("beet")
+pytest.importorskip("mecha")
+
+from beet import Function, run_beet
+from mecha import Mecha
+
+from minecraft_text_components.contrib import beet_minify
+
+
+def test_minifies_in_parallel_for_each_compilation(monkeypatch: pytest.MonkeyPatch):
+    def minify(text_component: Any):
+        raise AssertionError(f"Minified outside `minify_in_parallel`: {text_component}")
+
+    monkeypatch.setattr(beet_minify, "minify", minify)
+
+    with run_beet(
+        {
+            "require": ["minecraft_text_components.contrib.beet_minify"],
+            "meta": {"minify_workers": 2},
+        }
+    ) as ctx:
+        mecha = ctx.inject(Mecha)
+
+        first = mecha.compile(
+            Function(
+                ['tellraw @a ["",{"text":"a","bold":true},{"text":"b","bold":true}]']
+            )
+        )
+        second = mecha.compile(
+            Function(
+                [
+                    'tellraw @a ["",{"text":"c","color":"red"},{"text":"d","color":"red"}]'
+                ]
+            )
+        )
+
+    assert first.text == 'tellraw @a {"text": "ab", "bold": true}\n'
+    assert second.text == 'tellraw @a {"text": "cd", "color": "red"}\n'
@@ -0,0 +1,44 @@
+from minecraft_text_components import CompiledComponent, get_line_advance
+from minecraft_text_components.advances import (
+    get_text_advance,
+    register_font,
+    unregister_font,
+)
+from minecraft_text_components.advances.advance_table import (
+    build_advance_table,
+    get_advance_table,
+)
+
+
+def test_advances_follow_registered_fonts():
+    compiled = CompiledComponent(["", "ab", {"text": "cd", "font": "test:wide"}])
+    default_advance = get_text_advance("abcd")
+
+    assert get_line_advance(compiled) == default_advance
+
+    register_font("test:wide", build_advance_table({"c": 10, "d": 10}, {}))
+
+    try:
+        assert get_line_advance(compiled) == get_text_advance("ab") + 20
+
+        register_font(
+            "minecraft:default",
+            build_advance_table({"a": 1, "b": 2}, {}, get_advance_table()),
+        )
+
+        try:
+            assert get_line_advance(compiled) == 23
+        finally:
+            unregister_font("minecraft:default")
+
+    finally:
+        unregister_font("test:wide")
+
+    assert get_line_advance(compiled) == default_advance
+
+
+def test_textless_runs_have_no_advance():
+    compiled = CompiledComponent(["", "a", {"translate": "b"}])
+
+    assert compiled.get_run_advance(0) == get_text_advance("a")
+    assert compiled.get_run_advance(1) is None
@@ -0,0 +1,73 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+
+import pytest
+
+from minecraft_text_components import container
+
+
+def get_width_or_none():
+    return getattr(container, "width", None)
+
+
+def get_width_in_new_thread():
+    widths: list[float | None] = []
+
+    thread = Thread(target=lambda: widths.append(get_width_or_none()))
+    thread.start()
+    thread.join()
+
+    return widths[0]
+
+
+@pytest.fixture(autouse=True)
+def reset_container_width() -> Iterator[None]:
+    yield
+
+    del container.width
+
+
+def test_set_width_is_visible_in_new_threads():
+    container.width = 123
+
+    assert get_width_in_new_thread() == 123
+
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(get_width_or_none).result() == 123
+
+    del container.width
+
+    assert get_width_in_new_thread() is None
+
+
+def test_with_block_width_is_context_local():
+    container.width = 123
+
+    with container.chat:
+        assert container.width == 320
+        assert get_width_in_new_thread() == 123
+
+        with container.none:
+            assert get_width_or_none() is None
+
+    assert container.width == 123
+
+
+def test_set_width_within_with_block_is_restored():
+    container.width = 123
+
+    with container.chat:
+        container.width = 100
+
+        assert container.width == 100
+        assert get_width_in_new_thread() == 123
+
+        with container.book:
+            del container.width
+
+            assert get_width_or_none() is None
+
+        assert container.width == 100
+
+    assert container.width == 123
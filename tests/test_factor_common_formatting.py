@@ -0,0 +1,151 @@
+import copy
+import random
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from minecraft_text_components import (
+    FactoringStats,
+    flat,
+    minify,
+    set_factoring_stats_hook,
+)
+from minecraft_text_components.formatting import get_formatting
+from minecraft_text_components.types import TextComponent
+
+COLORS = ["gold", "gray", "green", "red", "aqua"]
+NAMES = ["Alex", "Steve", "Notch", "Jeb", "Dinnerbone", "Grumm"]
+
+
+def get_scoreboard_component(runs: int) -> list[TextComponent]:
+    random.seed(runs)
+
+    component: list[TextComponent] = [""]
+
+    while len(component) <= runs:
+        name_formatting: dict[str, Any] = {"color": random.choice(COLORS)}
+        if random.random() < 0.3:
+            name_formatting["bold"] = True
+        if random.random() < 0.2:
+            name_formatting["italic"] = True
+
+        component += [
+            {"text": random.choice(NAMES), **name_formatting},
+            {"text": ": ", "color": "gray"},
+            {"text": str(random.randrange(1000)), "color": random.choice(COLORS)},
+            "\n",
+        ]
+
+    return component
+
+
+# The formatting keys which affect how whitespace is rendered.
+WHITESPACE_FORMATTING_KEYS = {"bold", "font", "strikethrough", "underlined"}
+
+
+def get_styled_chars(component: TextComponent):
+    """Gets each character of a text component with the formatting it's rendered with,
+    ignoring differences which minifying may introduce without affecting rendering.
+    """
+
+    styled_chars: list[tuple[str, dict[str, Any]]] = []
+
+    for run in flat(component):
+        formatting: dict[str, Any] = {
+            key: value
+            for key, value in get_formatting(run).items()
+            if not (key == "bold" and value is False)
+        }
+
+        for char in run["text"] if isinstance(run, dict) else run:
+            if char.isspace():
+                styled_chars.append(
+                    (
+                        char,
+                        {
+                            key: value
+                            for key, value in formatting.items()
+                            if key in WHITESPACE_FORMATTING_KEYS
+                        },
+                    )
+                )
+            else:
+                styled_chars.append((char, formatting))
+
+    return styled_chars
+
+
+@pytest.fixture
+def factoring_stats() -> Iterator[list[FactoringStats]]:
+    stats: list[FactoringStats] = []
+    set_factoring_stats_hook(stats.append)
+
+    yield stats
+
+    set_factoring_stats_hook(None)
+
+
+def minify_with_stats(
+    component: TextComponent,
+    factoring_stats: list[FactoringStats],
+    **options: Any,
+):
+    factoring_stats.clear()
+    output = minify(copy.deepcopy(component), **options)
+
+    assert get_styled_chars(output) == get_styled_chars(component)
+
+    return output, factoring_stats[-1]
+
+
+def test_time_limit_bounds_wall_time(factoring_stats: list[FactoringStats]):
+    # Without a time limit, factoring this takes many seconds.
+    component = get_scoreboard_component(1000)
+
+    start = time.perf_counter()
+    _, stats = minify_with_stats(component, factoring_stats, time_limit=0.2)
+    elapsed = time.perf_counter() - start
+
+    assert stats.limited
+    # Allow time to give the rest of the subcomponents their own arrays and to check
+    # the output.
+    assert elapsed < 0.2 + 0.5
+
+
+def test_max_memo_entries_bounds_memo(factoring_stats: list[FactoringStats]):
+    component = get_scoreboard_component(300)
+
+    _, stats = minify_with_stats(
+        component, factoring_stats, max_range_length=64, max_memo_entries=100
+    )
+
+    assert stats.limited
+    assert stats.entries <= 100
+
+
+def test_max_range_length_bounds_work(factoring_stats: list[FactoringStats]):
+    component = get_scoreboard_component(100)
+
+    _, unbounded_stats = minify_with_stats(component, factoring_stats)
+    _, bounded_stats = minify_with_stats(component, factoring_stats, max_range_length=8)
+
+    # The number of ranges factored, whether memoized or not.
+    bounded_work = bounded_stats.hits + bounded_stats.misses
+    unbounded_work = unbounded_stats.hits + unbounded_stats.misses
+
+    assert not bounded_stats.limited
+    assert bounded_work * 10 < unbounded_work
+
+
+def test_unlimited_factoring_is_optimal(factoring_stats: list[FactoringStats]):
+    component = get_scoreboard_component(50)
+
+    output, stats = minify_with_stats(component, factoring_stats)
+    limited_output, _ = minify_with_stats(
+        component, factoring_stats, max_memo_entries=1
+    )
+
+    assert not stats.limited
+    assert len(str(output)) <= len(str(limited_output))
@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from minecraft_text_components.advances import (
+    get_text_advance,
+    load_resource_pack_fonts,
+    unregister_font,
+)
+from minecraft_text_components.advances.advance_table import (
+    BINARY_HEADER,
+    BINARY_MAGIC,
+    BINARY_VERSION,
+)
+
+
+def test_unsupported_providers_are_skipped(tmp_path: Path):
+    font_path = tmp_path / "assets" / "test" / "font" / "mixed.json"
+    font_path.parent.mkdir(parents=True)
+    font_path.write_text(
+        json.dumps(
+            {
+                "providers": [
+                    {"type": "ttf", "file": "test:mixed.ttf", "shift": [0, 0]},
+                    {"type": "space", "advances": {"a": 3}},
+                ]
+            }
+        )
+    )
+
+    with pytest.warns(UserWarning, match="'ttf'.*'test:mixed'"):
+        registered_fonts = load_resource_pack_fonts(tmp_path, cache_directory=None)
+
+    try:
+        assert registered_fonts == ["test:mixed"]
+        assert get_text_advance("aa", font="test:mixed") == 6
+    finally:
+        unregister_font("test:mixed")
+
+
+@pytest.mark.parametrize(
+    "cached_table",
+    [
+        # A table from an older version of the binary advance table layout.
+        BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION - 1, b"b", 0),
+        # A truncated table.
+        BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, b"b", 0)[:8],
+        b"",
+    ],
+)
+def test_unreadable_cached_fonts_are_compiled_again(
+    tmp_path: Path,
+    cached_table: bytes,
+):
+    pack_path = tmp_path / "pack"
+    font_path = pack_path / "assets" / "test" / "font" / "space.json"
+    font_path.parent.mkdir(parents=True)
+    font_path.write_text(
+        json.dumps({"providers": [{"type": "space", "advances": {"a": 3}}]})
+    )
+
+    cache_directory = tmp_path / "cache"
+
+    try:
+        load_resource_pack_fonts(pack_path, cache_directory)
+        (cache_path,) = cache_directory.iterdir()
+        cache_path.write_bytes(cached_table)
+
+        assert load_resource_pack_fonts(pack_path, cache_directory) == ["test:space"]
+        assert get_text_advance("aa", font="test:space") == 6
+        assert cache_path.read_bytes() != cached_table
+    finally:
+        unregister_font("test:space")
@@ -0,0 +1,50 @@
+import pytest
+
+from minecraft_text_components.advances.advance_table import (
+    build_advance_table,
+    get_advance_table,
+)
+from minecraft_text_components.advances.get_text_advance import (
+    NUMPY_MIN_LENGTH,
+    get_text_advance_by_char,
+    get_text_advance_with_numpy,
+    get_text_advance_with_translation,
+)
+
+pytest.importorskip("numpy")
+
+TEXTS = [
+    "a" * (NUMPY_MIN_LENGTH + 1),
+    "Hello, world! " * 30,
+    "Ünïcödé ✔ \U0001f600 " * 30,
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("bold", [False, True])
+def test_paths_agree_on_integer_table(text: str, bold: bool):
+    table = get_advance_table()
+    advance = get_text_advance_by_char(text, bold, table)
+
+    assert get_text_advance_with_numpy(text, bold, table) == advance
+
+    translated_advance = get_text_advance_with_translation(text, bold, table)
+    if translated_advance is not None:
+        assert translated_advance == advance
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("bold", [False, True])
+def test_paths_agree_on_float_table(text: str, bold: bool):
+    table = build_advance_table({"a": 1.5, " ": 2.25}, {}, get_advance_table())
+    advance = get_text_advance_by_char(text, bold, table)
+
+    assert get_text_advance_with_numpy(text, bold, table) == advance
+    # Fractional advances can't be translated to characters.
+    assert get_text_advance_with_translation(text, bold, table) is None
+
+
+def test_numpy_keeps_fractional_advance():
+    table = build_advance_table({"a": 1.5}, {}, get_advance_table())
+
+    assert get_text_advance_with_numpy("a" * 257, False, table) == 385.5
@@ -0,0 +1,34 @@
+from minecraft_text_components import (
+    CompiledComponent,
+    clear_interned_formatting,
+    interned_formatting_info,
+    minify,
+)
+
+
+def test_clearing_frees_interned_formattings():
+    compiled = CompiledComponent(
+        ["", {"text": "a", "color": "#123456"}, {"text": "b", "color": "#654321"}]
+    )
+
+    assert interned_formatting_info().formattings >= 2
+
+    clear_interned_formatting()
+
+    assert interned_formatting_info() == (0, 0)
+    # Compiled components keep their own formattings.
+    assert compiled.get_formatting(0) == {"color": "#123456"}
+    assert compiled.to_component() == [
+        "",
+        {"text": "a", "color": "#123456"},
+        {"text": "b", "color": "#654321"},
+    ]
+    # Formattings interned after clearing get new IDs.
+    assert (
+        CompiledComponent({"text": "a", "color": "#123456"}).formatting_ids[0]
+        not in compiled.formatting_ids
+    )
+    assert minify(["", {"text": "a", "bold": True}, {"text": "b", "bold": True}]) == {
+        "text": "ab",
+        "bold": True,
+    }
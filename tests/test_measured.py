@@ -0,0 +1,145 @@
+from collections.abc import Iterator
+
+import pytest
+
+from minecraft_text_components import MeasuredComponent, container, wrap
+from minecraft_text_components.advances import register_font, unregister_font
+from minecraft_text_components.advances.advance_table import build_advance_table
+from minecraft_text_components.types import TextComponent
+
+NEGATIVE_SPACE = "\uf801"
+SMALL_NEGATIVE_SPACE = "\uf802"
+
+
+@pytest.fixture
+def negative_font() -> Iterator[str]:
+    register_font(
+        "neg:f",
+        build_advance_table({NEGATIVE_SPACE: -50, SMALL_NEGATIVE_SPACE: -3}, {}),
+    )
+
+    yield "neg:f"
+
+    unregister_font("neg:f")
+
+
+def get_brute_force_min_width(measured: MeasuredComponent, line_count: int):
+    prefix_advances = measured.prefix_advances
+    width = max(
+        prefix_advances[i + 1] - prefix_advances[i] for i in range(len(measured.text))
+    )
+
+    # Every advance is a whole number, so the wrapping only changes at whole widths.
+    while measured.get_line_count(width) > line_count:
+        width += 1
+
+    return width
+
+
+def test_negative_advances_dont_hide_overflow(negative_font: str):
+    component = [
+        "aaaaaaaaaaaa",
+        {"text": NEGATIVE_SPACE, "font": negative_font},
+        "aaaaaaaaaaaa",
+    ]
+    measured = MeasuredComponent(component)
+
+    assert measured.has_negative_advances
+    assert list(measured.wrapped_line_ranges(0, 25, 60)) == [
+        (0, 10, 60),
+        (10, 25, 34),
+    ]
+
+    with container(60):
+        assert wrap(component) == [
+            "aaaaaaaaaa\naa",
+            {"text": NEGATIVE_SPACE, "font": negative_font},
+            "aaaaaaaaaaaa",
+        ]
+
+
+def get_negative_component(*texts: str) -> list[TextComponent]:
+    """Gets a text component of the specified texts, where those of negative spaces
+    have the font with negative advances.
+    """
+
+    return [
+        "",
+        *(
+            (
+                {"text": text, "font": "neg:f"}
+                if text.strip(NEGATIVE_SPACE + SMALL_NEGATIVE_SPACE) == ""
+                else text
+            )
+            for text in texts
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "component",
+    [
+        get_negative_component("aaaaaaaaaaaa", NEGATIVE_SPACE, "aaaaaaaaaaaa"),
+        get_negative_component(
+            "Hello ", SMALL_NEGATIVE_SPACE * 4, " big world of ", NEGATIVE_SPACE, " a b"
+        ),
+        get_negative_component(
+            NEGATIVE_SPACE, "WWW W iii", SMALL_NEGATIVE_SPACE, "b aa bb\nab W"
+        ),
+    ],
+)
+def test_min_width_with_negative_advances(
+    negative_font: str,
+    component: list[TextComponent],
+):
+    measured = MeasuredComponent(component)
+    prefix_advances = measured.prefix_advances
+
+    for line_count in range(measured.text.count("\n") + 1, 6):
+        width = measured.get_min_width(line_count)
+
+        assert width == get_brute_force_min_width(measured, line_count)
+
+        for start, end, _ in measured.line_ranges(width):
+            # Only the first character of a line may overflow it.
+            for index in range(start + 2, end + 1):
+                assert prefix_advances[index] - prefix_advances[start] <= width
+
+
+def test_wrap_breaks_words_too_long_for_a_line():
+    measured = MeasuredComponent(
+        ["", "Hi ", {"text": "aaaaaaaaaaaa", "bold": True}, "aaaaaaaaa b"]
+    )
+
+    # The word is wrapped to its own line before being broken wherever it overflows.
+    assert measured.wrap(40) == [
+        "Hi\n",
+        {"text": "aaaaa\naaaaa\naa", "bold": True},
+        "aaaa\naaaaa b",
+    ]
+    assert list(measured.line_ranges(40)) == [
+        (0, 2, 40),
+        (3, 8, 35),
+        (8, 13, 35),
+        (13, 19, 38),
+        (19, 26, 40),
+    ]
+
+
+def test_min_width_matches_brute_force():
+    measured = MeasuredComponent(
+        [
+            "",
+            "The quick brown ",
+            {"text": "fox jumps", "bold": True},
+            " over the lazy dog.\nAnd again.",
+        ]
+    )
+
+    for line_count in range(2, 8):
+        assert measured.get_min_width(line_count) == get_brute_force_min_width(
+            measured, line_count
+        )
+
+    with pytest.raises(ValueError):
+        measured.get_min_width(1)
@@ -0,0 +1,40 @@
+from collections.abc import Iterator
+
+import pytest
+
+from minecraft_text_components import minify, minify_cache_info, set_minify_cache_size
+from minecraft_text_components.types import TextComponent
+
+
+@pytest.fixture(autouse=True)
+def minify_cache() -> Iterator[None]:
+    set_minify_cache_size(16)
+
+    yield
+
+    set_minify_cache_size(0)
+
+
+def test_key_order_doesnt_affect_cache():
+    first = minify(["", {"text": "a", "color": "red"}, {"text": "b", "bold": True}])
+    second = minify(["", {"color": "red", "text": "a"}, {"bold": True, "text": "b"}])
+
+    assert second == first
+    assert minify_cache_info().hits == 1
+    assert minify_cache_info().currsize == 1
+
+
+def test_timed_out_results_arent_cached():
+    component: list[TextComponent] = [""]
+
+    for i in range(300):
+        component.append({"text": str(i), "color": ["red", "gold", "aqua"][i % 3]})
+        component.append({"text": " ", "bold": i % 2 == 0})
+
+    minify(component, max_range_length=64, time_limit=0)
+
+    assert minify_cache_info().currsize == 0
+
+    minify(component, max_range_length=4, time_limit=60)
+
+    assert minify_cache_info().currsize == 1
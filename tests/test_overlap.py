@@ -0,0 +1,27 @@
+import pytest
+
+from minecraft_text_components import container, get_line_advance, overlap
+
+
+def test_overlap_places_ranges():
+    with container.chat:
+        assert overlap("a   c", "  b") == "a b c"
+
+
+def test_overflow_is_taken_out_of_whitespace():
+    with container(40):
+        # The "b" would end 2 pixels past the container, so the whitespace before it
+        # is reduced from 18 to 16 pixels.
+        output = overlap("aaa", " " * 9 + "b")
+
+        assert output == "aaa    b"
+        assert get_line_advance(output) == 40
+
+        # Up to `MAX_WHITESPACE_OFFSET` pixels of overflow can be taken out.
+        assert overlap("aaaa", " " * 8 + "bb") == "aaaa bb"
+
+
+def test_overflow_beyond_max_whitespace_offset_raises():
+    with container(40):
+        with pytest.raises(ValueError, match="cannot fit on one line"):
+            overlap("aaa", " " * 10 + "bb")
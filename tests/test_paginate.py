@@ -0,0 +1,36 @@
+import pytest
+
+from minecraft_text_components import PAGE_BREAK, paginate
+
+
+def test_page_breaks_end_pages():
+    assert list(
+        paginate(["", "Chapter 1", PAGE_BREAK, "It was a dark and stormy night."])
+    ) == ["Chapter 1", "It was a dark and\nstormy night."]
+    # Consecutive page breaks leave an empty page between them.
+    assert list(paginate(f"a{PAGE_BREAK}b{PAGE_BREAK}{PAGE_BREAK}c")) == [
+        "a",
+        "b",
+        "",
+        "c",
+    ]
+
+
+def test_full_pages_end_without_empty_pages():
+    # A page break right after a full page doesn't add an empty page.
+    assert list(
+        paginate(
+            ["", "a\nb\nc", {"text": f"{PAGE_BREAK}d\ne", "color": "red"}],
+            lines_per_page=3,
+        )
+    ) == ["a\nb\nc", {"text": "d\ne", "color": "red"}]
+    # Wrapped lines fill pages too.
+    assert list(paginate("aaa bbb ccc ddd", lines_per_page=2, width=30)) == [
+        "aaa\nbbb",
+        "ccc\nddd",
+    ]
+
+
+def test_lines_per_page_must_be_positive():
+    with pytest.raises(ValueError):
+        next(paginate("a", lines_per_page=0))
@@ -0,0 +1,89 @@
+import re
+
+import pytest
+
+from minecraft_text_components import split_slices, trim
+from minecraft_text_components.split import split
+from minecraft_text_components.types import TextComponent
+
+
+def test_across_runs_keeps_empty_text_runs():
+    component = ["", "a", {"text": "", "color": "red"}, " b"]
+
+    assert list(split(component, across_runs=True)) == [
+        ["", "a", {"text": "", "color": "red"}],
+        "b",
+    ]
+    assert [
+        piece.to_component() for piece in split_slices(component, across_runs=True)
+    ] == [
+        ["", "a", {"text": "", "color": "red"}],
+        "b",
+    ]
+
+
+def test_across_runs_places_textless_runs_outside_groups():
+    component = ["", "a", {"translate": "x"}]
+    expected = ["", "a", ["", "", {"translate": "x"}]]
+
+    assert list(split(component, re.compile(r"(\S+)"))) == expected
+    assert list(split(component, re.compile(r"(\S+)"), across_runs=True)) == expected
+
+
+def test_across_runs_spans_separators_over_runs():
+    component = ["", "a ", {"text": " b", "bold": True}]
+
+    assert list(split(component, re.compile(" {2,}"))) == [component]
+    assert list(split(component, re.compile(" {2,}"), across_runs=True)) == [
+        "a",
+        {"text": "b", "bold": True},
+    ]
+
+
+def test_trim_drops_leading_and_trailing_textless_runs():
+    assert trim(["", {"translate": "x"}, " a ", {"translate": "y"}]) == "a"
+    assert trim(["", "a", {"translate": "x"}]) == "a"
+    assert trim(["", " a", {"translate": "x"}, " b "]) == [
+        "a",
+        {"translate": "x"},
+        " b",
+    ]
+
+
+@pytest.mark.parametrize(
+    "component",
+    [
+        "",
+        "a b  c",
+        ["", "a\nb", {"text": "c\n\nd", "color": "red"}, {"translate": "x"}, "\ne"],
+        ["", {"text": " a ", "bold": True}, "", "  b", {"text": "c  ", "italic": True}],
+        {
+            "text": "a\nb",
+            "color": "red",
+            "extra": [" c", {"text": "d\n", "bold": True}],
+        },
+    ],
+)
+@pytest.mark.parametrize(
+    ("sep", "maxsplit"),
+    [
+        (None, -1),
+        (None, 1),
+        ("\n", -1),
+        (" ", 2),
+        (re.compile(" {2,}"), -1),
+        (re.compile("( )"), -1),
+        (re.compile(r"(\n)|(x)"), 1),
+    ],
+)
+@pytest.mark.parametrize("across_runs", [False, True])
+def test_split_slices_match_split(
+    component: TextComponent,
+    sep: str | re.Pattern[str] | None,
+    maxsplit: int,
+    across_runs: bool,
+):
+    assert [
+        piece.to_component()
+        for piece in split_slices(component, sep, maxsplit, across_runs=across_runs)
+    ] == list(split(component, sep, maxsplit, across_runs=across_runs))
@@ -0,0 +1,44 @@
+import pytest
+
+from minecraft_text_components import columns, container, get_line_advance, split, table
+
+
+@pytest.mark.parametrize("width", [60, 100, 320])
+@pytest.mark.parametrize("spacing_around_columns", [True, False])
+def test_left_aligned_table_matches_columns(
+    width: float,
+    spacing_around_columns: bool,
+):
+    with container(width):
+        assert table(
+            [["a", "b"], ["ccc", "d"]],
+            spacing_around_columns=spacing_around_columns,
+        ) == columns(
+            "a\nccc",
+            "b\nd",
+            spacing_around_columns=spacing_around_columns,
+        )
+
+
+def test_cells_align_and_wrap():
+    with container(60):
+        assert table([["a", "b"], ["ccc", "d"]], alignments=["left", "right"]) == (
+            "   a      b\n   ccc   d"
+        )
+
+        output = table(
+            [["a b c", "x"], ["", {"text": "yy", "bold": True}]],
+            alignments=["center"],
+            widths=[12],
+        )
+        lines = list(split(output, "\n"))
+
+        # The first row is as tall as its first cell, which wraps into 3 lines.
+        assert len(lines) == 4
+        assert all(get_line_advance(line) <= 60 for line in lines)
+
+
+def test_too_wide_columns_raise():
+    with container(60):
+        with pytest.raises(ValueError, match="too wide"):
+            table([["aaaaaaaaa", "bbbbbbbbb"]])
@@ -0,0 +1,60 @@
+from collections.abc import Iterator
+
+import pytest
+
+from minecraft_text_components import (
+    get_line_advance,
+    get_valid_whitespace_advance,
+    get_whitespace,
+    set_whitespace_table_max_advance,
+)
+from minecraft_text_components.whitespace import (
+    DEFAULT_WHITESPACE_TABLE_MAX_ADVANCE,
+    build_whitespace,
+    find_ceil_whitespace_advance,
+    find_floor_whitespace_advance,
+)
+
+
+@pytest.fixture(params=[DEFAULT_WHITESPACE_TABLE_MAX_ADVANCE, 8])
+def whitespace_table_max_advance(request: pytest.FixtureRequest) -> Iterator[int]:
+    set_whitespace_table_max_advance(request.param)
+
+    yield request.param
+
+    set_whitespace_table_max_advance(DEFAULT_WHITESPACE_TABLE_MAX_ADVANCE)
+
+
+def test_whitespace_has_the_advance_it_reports(whitespace_table_max_advance: int):
+    # Include advances beyond the smaller table's maximum.
+    for advance in range(0, 60):
+        for rounding in ("floor", "ceil", "round"):
+            component, actual_advance = get_whitespace(advance + 0.5, rounding)
+
+            assert get_line_advance(component) == actual_advance
+            assert actual_advance == get_valid_whitespace_advance(
+                advance + 0.5, rounding
+            )
+
+        assert get_valid_whitespace_advance(
+            advance, "floor"
+        ) == find_floor_whitespace_advance(advance)
+        assert get_valid_whitespace_advance(
+            advance, "ceil"
+        ) == find_ceil_whitespace_advance(advance)
+
+
+def test_round_never_rounds_positive_advances_to_zero():
+    assert get_valid_whitespace_advance(0) == 0
+    assert get_valid_whitespace_advance(1) == 4
+    assert get_valid_whitespace_advance(7) == 8
+    assert get_valid_whitespace_advance(7, "floor") == 5
+    assert get_whitespace(13) == (build_whitespace(13), 13)
+
+
+def test_negative_advances_raise():
+    with pytest.raises(ValueError):
+        get_valid_whitespace_advance(-1)
+
+    with pytest.raises(ValueError):
+        set_whitespace_table_max_advance(-1)
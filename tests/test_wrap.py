@@ -0,0 +1,16 @@
+from minecraft_text_components import container, wrap, wrap_widths
+
+
+def test_wrap_widths_matches_wrap():
+    component = ["", "Hello ", {"text": "world!", "color": "red"}]
+    widths = [40, 320, 41, 20]
+
+    wrapped = wrap_widths(component, widths)
+
+    for width, wrapped_component in zip(widths, wrapped):
+        with container(width):
+            assert wrapped_component == wrap(component)
+
+    # The widths 40 and 41 wrap the same way, but their results are separate copies.
+    assert wrapped[0] == wrapped[2]
+    assert wrapped[0] is not wrapped[2]